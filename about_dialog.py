@@ -1,8 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext
-from PIL import Image, ImageTk
 import os
 from config import Config
+from assets import AssetCache, load_logo
+from markdown_view import render_markdown
 import locales
 
 class AboutDialog:
@@ -33,39 +34,16 @@ class AboutDialog:
         main_frame = tk.Frame(self.dialog, bg="#000000")
         main_frame.pack(fill="both", expand=True, padx=30, pady=30)
         
-        logo_frame = tk.Frame(main_frame, bg="#000000")
+        logo_frame = tk.Frame(main_frame, bg="#000000", width=100, height=100)
+        logo_frame.pack_propagate(False)
         logo_frame.pack(pady=(0, 20))
         
-        logo_paths = ["Logo.png", "logo.png", "icon.png", "icon.ico"]
-        logo_image = None
-        
-        for path in logo_paths:
-            if os.path.exists(path):
-                try:
-                    img = Image.open(path)
-                    img = img.resize((100, 100), Image.Resampling.LANCZOS)
-                    logo_image = ImageTk.PhotoImage(img)
-                    break
-                except:
-                    continue
-        
-        if logo_image:
-            logo_label = tk.Label(
-                logo_frame,
-                image=logo_image,
-                bg="#000000"
-            )
-            logo_label.image = logo_image
-            logo_label.pack()
-        else:
-            logo_text = tk.Label(
-                logo_frame,
-                text="WMR",
-                font=("Lucida Console", 36, "bold"),
-                bg="#000000",
-                fg="#3B82F6"
-            )
-            logo_text.pack()
+        load_logo(
+            self.dialog,
+            AssetCache(self.config.get_data_path() / "assets"),
+            (100, 100),
+            lambda photo: self.show_logo(logo_frame, photo)
+        )
         
         title_label = tk.Label(
             main_frame,
@@ -197,6 +175,26 @@ class AboutDialog:
         )
         close_btn.pack(pady=20)
     
+    def show_logo(self, parent, photo):
+        if photo is None:
+            logo_text = tk.Label(
+                parent,
+                text="WMR",
+                font=("Lucida Console", 36, "bold"),
+                bg="#000000",
+                fg="#3B82F6"
+            )
+            logo_text.pack(expand=True)
+            return
+        
+        logo_label = tk.Label(
+            parent,
+            image=photo,
+            bg="#000000"
+        )
+        logo_label.image = photo
+        logo_label.pack(expand=True)
+    
     def show_changelog(self):
         try:
             changelog_window = tk.Toplevel(self.dialog)
@@ -229,7 +227,7 @@ class AboutDialog:
                 changelog_path = os.path.join(os.path.dirname(__file__), "changelog.txt")
                 if os.path.exists(changelog_path):
                     with open(changelog_path, "r", encoding="utf-8") as f:
-                        changelog_text.insert("1.0", f.read())
+                        render_markdown(changelog_text, f.read())
                 else:
                     changelog_text.insert("1.0", "Changelog not found.")
             except:
@@ -0,0 +1,134 @@
+import tkinter as tk
+
+class AppCard:
+    def __init__(self, parent, owner):
+        self.owner = owner
+        self.tr = owner.tr
+        self.app = None
+        self.state = {}
+        
+        self.frame = tk.Frame(
+            parent,
+            bg="#222222",
+            relief="solid",
+            borderwidth=1
+        )
+        
+        self.icon_label = tk.Label(
+            self.frame,
+            text="●",
+            font=("Lucida Console", 10),
+            bg="#222222",
+            fg="#FF0000"
+        )
+        self.icon_label.pack(side="left", padx=(10, 6), pady=6)
+        
+        text_frame = tk.Frame(self.frame, bg="#222222")
+        text_frame.pack(side="left", fill="both", expand=True, padx=(0, 6))
+        
+        self.name_label = tk.Label(
+            text_frame,
+            text="",
+            font=("Lucida Console", 9, "bold"),
+            bg="#222222",
+            fg="#FFFFFF",
+            anchor="w"
+        )
+        self.name_label.pack(fill="x", pady=(3, 1))
+        
+        self.version_label = tk.Label(
+            text_frame,
+            text="",
+            font=("Lucida Console", 7),
+            bg="#222222",
+            fg="#CCCCCC",
+            anchor="w"
+        )
+        self.version_label.pack(fill="x")
+        
+        status_frame = tk.Frame(self.frame, bg="#222222")
+        status_frame.pack(side="right", padx=(0, 10), pady=6)
+        
+        self.status_label = tk.Label(
+            status_frame,
+            text="",
+            font=("Lucida Console", 7, "bold"),
+            bg="#222222",
+            fg="#FFFFFF",
+            padx=6,
+            pady=1,
+            relief="solid",
+            borderwidth=1
+        )
+        self.status_label.pack()
+        
+        for widget in [self.frame, self.icon_label, self.name_label, self.version_label, self.status_label]:
+            widget.bind("<Enter>", self.on_enter)
+            widget.bind("<Leave>", self.on_leave)
+            widget.bind("<Button-1>", self.on_click)
+    
+    def on_enter(self, e):
+        self.owner.play_sound("hover")
+        original_bg = e.widget["bg"]
+        self.owner.animate_widget_color(e.widget, original_bg, "#333333", steps=5, duration=50)
+    
+    def on_leave(self, e):
+        original_bg = self.state.get("status_bg", "#222222") if e.widget is self.status_label else "#222222"
+        self.owner.animate_widget_color(e.widget, "#333333", original_bg, steps=5, duration=50)
+    
+    def on_click(self, e):
+        if self.app is None:
+            return
+        self.owner.play_sound("click")
+        self.owner.show_app_details(self.app)
+    
+    def view_state(self, app):
+        installed = app["status"] == "installed"
+        has_update = app.get("has_update", False)
+        
+        name_text = app["name"]
+        if has_update:
+            name_text += f" [{self.tr['update_to']} {app['latest_version']}]"
+        
+        return {
+            "icon": "↻" if has_update else "●",
+            "icon_color": "#FFFF00" if has_update else "#00FF00" if installed else "#FF0000",
+            "name_text": name_text,
+            "version_text": f"{app['local_version']} | {app['category']}",
+            "status_text": self.tr["installed"] if installed else self.tr["not_installed"],
+            "status_bg": "#333333" if installed else "#222222"
+        }
+    
+    def update(self, app):
+        self.app = app
+        state = self.view_state(app)
+        old = self.state
+        changed = 0
+        
+        if state["icon"] != old.get("icon") or state["icon_color"] != old.get("icon_color"):
+            self.icon_label.config(text=state["icon"], fg=state["icon_color"])
+            changed += 1
+        
+        if state["name_text"] != old.get("name_text"):
+            self.name_label.config(text=state["name_text"])
+            changed += 1
+        
+        if state["version_text"] != old.get("version_text"):
+            self.version_label.config(text=state["version_text"])
+            changed += 1
+        
+        if state["status_text"] != old.get("status_text") or state["status_bg"] != old.get("status_bg"):
+            self.status_label.config(text=state["status_text"], bg=state["status_bg"])
+            changed += 1
+        
+        self.state = state
+        return changed
+    
+    def pack(self):
+        self.frame.pack(fill="x", padx=8, pady=4, ipady=3)
+    
+    def pack_forget(self):
+        self.frame.pack_forget()
+    
+    def destroy(self):
+        self.frame.destroy()
@@ -0,0 +1,104 @@
+import os
+
+FILE_TYPES = {
+    ".exe": "exe",
+    ".bat": "bat",
+    ".py": "py",
+    ".sh": "sh",
+    ".command": "command",
+    ".ps1": "ps1",
+    ".cmd": "cmd",
+    ".dll": "dll"
+}
+
+EXECUTABLE_TYPES = set(FILE_TYPES.values())
+
+def file_type(name):
+    return FILE_TYPES.get(os.path.splitext(name)[1].lower(), "file")
+
+def scan_tree(path):
+    entries = {}
+    stack = [(path, "")]
+    
+    while stack:
+        current, prefix = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    rel_path = prefix + entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            entries[rel_path] = {"type": "dir", "size": 0, "mtime": 0}
+                            stack.append((entry.path, rel_path + "/"))
+                        else:
+                            stat = entry.stat(follow_symlinks=False)
+                            entries[rel_path] = {
+                                "type": file_type(entry.name),
+                                "size": stat.st_size,
+                                "mtime": stat.st_mtime
+                            }
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    
+    return entries
+
+def app_status(entries):
+    if entries is None:
+        return "not_installed"
+    
+    if any(entry["type"] in EXECUTABLE_TYPES for entry in entries.values()):
+        return "installed"
+    
+    for rel_path, entry in entries.items():
+        if "/" in rel_path:
+            continue
+        if entry["type"] == "dir":
+            return "partial"
+        if rel_path.endswith((".py", ".txt", ".md", ".json")):
+            return "partial"
+    
+    return "not_installed"
+
+def executable_files(install_path, entries):
+    executables = []
+    for rel_path, entry in (entries or {}).items():
+        if entry["type"] in EXECUTABLE_TYPES:
+            parts = rel_path.split("/")
+            executables.append({
+                "name": parts[-1],
+                "path": os.path.join(install_path, *parts),
+                "rel_path": os.path.join(*parts),
+                "size": entry["size"],
+                "type": entry["type"]
+            })
+    return executables
+
+class AppScanner:
+    def __init__(self, manifests, max_workers=4):
+        self.manifests = manifests
+        self.max_workers = max_workers
+    
+    def scan_app(self, app_key, install_path, force=False):
+        if force:
+            self.manifests.drop_index(app_key)
+        entries = self.manifests.get_index(app_key, install_path)
+        return {
+            "install_path": install_path,
+            "status": app_status(entries),
+            "files": executable_files(install_path, entries)
+        }
+    
+    def scan_all(self, install_dir, app_keys, force=False):
+        app_keys = list(app_keys)
+        if not app_keys:
+            return {}
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def scan(app_key):
+            return app_key, self.scan_app(app_key, os.path.join(install_dir, app_key), force)
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(app_keys)), thread_name_prefix="scan") as pool:
+            return dict(pool.map(scan, app_keys))
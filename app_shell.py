@@ -0,0 +1,83 @@
+import tkinter as tk
+
+from json_store import flush_all
+
+def when_painted(root, callback):
+    # Idle callbacks run after the pending redraws, so by then the window has
+    # actually been drawn once. A root that is already on screen (a screen
+    # swap on the shell) only has to wait for those redraws.
+    if root.winfo_ismapped():
+        root.after_idle(callback)
+        return
+    
+    def on_map(event):
+        if event.widget is not root:
+            return
+        root.unbind("<Map>", bind_id)
+        root.after_idle(callback)
+    
+    bind_id = root.bind("<Map>", on_map, add="+")
+
+class AppShell:
+    def __init__(self, title="WMR Group Apps"):
+        self.root = tk.Tk()
+        self.root.title(title)
+        self.root.configure(bg="#000000")
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
+        
+        self.screen = None
+        self.shutdown_hooks = []
+        self.shut_down = False
+    
+    def set_window(self, title, size, resizable=True):
+        width, height = size
+        self.root.title(title)
+        self.root.resizable(resizable, resizable)
+        self.root.minsize(1, 1)
+        self.center(width, height)
+    
+    def center(self, width=None, height=None):
+        self.root.update_idletasks()
+        width = width or self.root.winfo_width()
+        height = height or self.root.winfo_height()
+        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        self.root.geometry(f"{width}x{height}+{x}+{y}")
+    
+    def show(self, screen):
+        # Screens are frames on the one root; swapping them keeps the Tcl
+        # interpreter, fonts, styles and loaded images alive between screens.
+        previous, self.screen = self.screen, screen
+        if previous is not None and previous is not screen:
+            previous.destroy()
+        # Screens that build their widgets unpacked lay them out here, after
+        # the previous screen has left the root.
+        mount = getattr(screen, "mount", None)
+        if mount:
+            mount()
+        return screen
+    
+    def on_shutdown(self, callback):
+        self.shutdown_hooks.append(callback)
+    
+    def shutdown(self):
+        # Watchers, workers and debounced writers are stopped and flushed
+        # here rather than left to atexit, which runs after Tk is gone.
+        if self.shut_down:
+            return
+        self.shut_down = True
+        
+        for callback in reversed(self.shutdown_hooks):
+            try:
+                callback()
+            except Exception as e:
+                print(f"Shutdown hook failed: {e}")
+        flush_all()
+    
+    def quit(self):
+        self.shutdown()
+        self.root.destroy()
+    
+    def run(self):
+        self.root.mainloop()
+        self.shutdown()
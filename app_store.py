@@ -8,20 +8,35 @@ import threading
 import json
 import shutil
 import re
-import requests
-import zipfile
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 import tempfile
-import queue
-from concurrent.futures import ThreadPoolExecutor
 import math
+import importlib.util
 
 from config import Config
+from startup_timer import StartupTimer
+from app_shell import AppShell, when_painted
 import locales
-from about_dialog import AboutDialog
-from prog_info import ProgramInfo
+from prog_info import create_program_info
+from catalog import Catalog
+from version_checker import VersionChecker
+from github_client import get_client
+from releases_cache import ReleasesCache
+from release_list import ReleaseList
+from markdown_view import render_markdown
+from app_card import AppCard
+from virtual_list import VirtualAppList
+from progress_channel import ProgressChannel
+from downloader import ChunkedDownloader
+from download_cache import DownloadCache
+from zip_extractor import ZipExtractor
+from install_manifest import InstallManifest
+from app_scanner import app_status, executable_files
+from delta_update import DeltaUpdater, DeltaUnavailable
+from fs_watcher import InstallWatcher
+from task_scheduler import TaskScheduler, PRIORITY_UI, PRIORITY_NORMAL, PRIORITY_BULK
 
 class CodeEditor:
     def __init__(self, parent, file_path):
@@ -168,16 +183,47 @@ class CodeEditor:
         self.editor_window.grab_set()
         self.editor_window.wait_window()
 
+class StoreBootstrap:
+    def __init__(self, config, startup=None):
+        self.config = config
+        self.startup = startup or StartupTimer()
+        self.manifests = None
+        self.catalog = None
+        self.prog_info = None
+        self.app = None
+    
+    def stages(self, root):
+        return [
+            ("loading_config", self.prepare_dirs, True),
+            ("loading_catalog", self.load_catalog, True),
+            ("loading_programs", self.load_program_info, True),
+            ("building_ui", lambda: self.build_ui(root), False)
+        ]
+    
+    def prepare_dirs(self):
+        for path in [self.config.get_install_path(), self.config.get_downloads_path(),
+                     self.config.get_temp_path(), self.config.get_data_path()]:
+            os.makedirs(path, exist_ok=True)
+    
+    def load_catalog(self):
+        self.catalog = Catalog(self.config, get_client(self.config))
+    
+    def load_program_info(self):
+        self.manifests = InstallManifest(self.config.get_data_path() / "manifests")
+        self.prog_info = create_program_info(self.config, manifests=self.manifests, catalog=self.catalog)
+    
+    def build_ui(self, root):
+        self.app = WMRGroupApps(root, self.config, self.startup, services=self)
+
 class WMRGroupApps:
-    def __init__(self, root, config=None):
+    def __init__(self, root, config=None, startup=None, services=None):
         self.root = root
         self.config = config or Config()
+        self.startup = startup or StartupTimer()
         self.lang = self.config.get_language()
         self.tr = locales.LANGUAGES.get(self.lang, locales.LANGUAGES["en"])
         
-        self.root.title(f"{self.tr['app_title']} - Application Manager")
-        self.root.geometry("1400x800")
-        self.root.minsize(1000, 600)
+        self.window_size = (1400, 800)
         
         self.base_dir = Path(__file__).parent
         self.install_dir = self.config.get_install_path()
@@ -190,34 +236,109 @@ class WMRGroupApps:
         os.makedirs(self.temp_dir, exist_ok=True)
         
         self.app_config = self.load_config()
-        self.prog_info = ProgramInfo(self.config)
-        
-        self.sync_program_info()
-        
-        self.apps = self.get_apps_data()
+        if services is None:
+            services = StoreBootstrap(self.config, self.startup)
+            services.load_catalog()
+            services.load_program_info()
+            self.startup.mark("program info")
+        self.manifests = services.manifests
+        self.catalog = services.catalog
+        self.prog_info = services.prog_info
+        self.scanner = self.prog_info.scanner
+        
+        # The first frame is built from the stored program info; the disk scan
+        # that confirms it runs once the window is on screen.
+        self.apps = self.get_apps_data(scan=False)
         
         self.detected_files = {}
-        self.releases_cache = {}
+        self.releases_cache = ReleasesCache(
+            self.config.get_data_path() / "releases_cache.json",
+            ttl=self.config.get("cache.releases_ttl", 3600),
+            max_entries=self.config.get("cache.releases_max_entries", 32)
+        )
+        self.releases_per_page = self.config.get("github.releases_per_page", 10)
         
         self.right_panel = None
         self.current_app = None
         self.apps_frame = None
         self.canvas = None
-        
-        self.task_queue = queue.Queue()
-        self.executor = ThreadPoolExecutor(max_workers=4)
-        
-        self.process_tasks()
+        self.app_cards = {}
+        self.app_card_order = []
+        self.virtual_list = None
+        self.category_filter = None
+        
+        self.scheduler = TaskScheduler(self.root, max_workers=4)
+        self.release_list = None
+        self.github = get_client(self.config)
+        self.version_checker = VersionChecker(self.github)
+        self.downloader = ChunkedDownloader(self.github.session)
+        self.zip_extractor = ZipExtractor(workers=4)
+        self.delta_updater = DeltaUpdater(
+            self.github,
+            self.manifests,
+            api_base=self.config.get("github.api_base", "https://api.github.com"),
+            raw_base=self.config.get("github.raw_base", "https://raw.githubusercontent.com"),
+            max_files=self.config.get("github.delta_max_files", 200)
+        )
+        self.download_cache = DownloadCache(
+            self.downloads_dir,
+            max_bytes=self.config.get("cache.downloads_max_mb", 512) * 1024 * 1024
+        )
         
         self.sound_enabled = self.config.get_sound_effects()
+        self.fs_watcher = InstallWatcher(
+            self.install_dir,
+            self.on_install_dir_changes,
+            debounce=self.config.get("watcher.debounce", 0.5)
+        )
+        self.startup.mark("services")
         
         self.setup_ui()
         
-        self.check_app_versions()
-        
         self.root.bind('<Configure>', self.on_window_resize)
         self.setup_scroll_events()
+        self.startup.mark("ui build")
+    
+    def mount(self):
+        # Called by AppShell.show once the previous screen is gone. The main
+        # UI is built unpacked so the window is resized and filled in one step
+        # instead of growing around the splash.
+        self.root.title(f"{self.tr['app_title']} - Application Manager")
+        self.root.minsize(1000, 600)
+        self.root.attributes('-alpha', 0.0)
+        self.root.config(menu=self.menubar)
         
+        self.header.pack(fill="x")
+        self.main_container.pack(fill="both", expand=True, padx=10, pady=8)
+        
+        self.root.after(100, lambda: self.fade_in_widget(self.root, steps=30, duration=300))
+        when_painted(self.root, self.start_background_work)
+    
+    def shutdown(self):
+        if self.release_list:
+            self.release_list.cancel()
+        self.fs_watcher.stop()
+        self.scheduler.shutdown()
+        self.prog_info.flush()
+        self.config.flush()
+    
+    def start_background_work(self):
+        self.startup.mark("first paint")
+        self.startup.report()
+        
+        if self.config.get("watcher.enabled", True):
+            self.fs_watcher.start()
+        
+        def startup_sync_task():
+            self.sync_program_info()
+            return self.get_apps_data()
+        
+        def on_synced(apps):
+            self.apply_apps(apps)
+            self.check_app_versions()
+            self.add_task(self.refresh_catalog, priority=PRIORITY_BULK)
+        
+        self.scheduler.submit(startup_sync_task, priority=PRIORITY_NORMAL, on_done=on_synced)
         self.check_manager_update_on_start()
     
     def check_manager_update_on_start(self):
@@ -228,7 +349,7 @@ class WMRGroupApps:
                 update_info = updater.check_for_updates()
                 
                 if update_info.get("available", False):
-                    self.root.after(0, lambda: self.show_update_notification(update_info))
+                    self.run_on_ui(lambda: self.show_update_notification(update_info))
             except:
                 pass
         
@@ -275,13 +396,13 @@ class WMRGroupApps:
         
         try:
             changelog_url = self.config.get("updater.changelog_url")
-            response = requests.get(changelog_url, timeout=10)
+            response = self.github.get(changelog_url, timeout=10)
             if response.status_code == 200:
-                changelog_text.insert("1.0", response.text)
+                render_markdown(changelog_text, response.text, scheduler=self.scheduler)
             else:
-                changelog_text.insert("1.0", update_info.get("changelog", "No changelog available"))
+                render_markdown(changelog_text, update_info.get("changelog", "No changelog available"), scheduler=self.scheduler)
         except:
-            changelog_text.insert("1.0", update_info.get("changelog", "No changelog available"))
+            render_markdown(changelog_text, update_info.get("changelog", "No changelog available"), scheduler=self.scheduler)
         
         changelog_text.config(state="disabled")
         
@@ -324,7 +445,7 @@ class WMRGroupApps:
         from update_dialog import UpdateDialog
         
         updater = Updater(self.config)
-        update_dialog = UpdateDialog(updater, update_info, self.config)
+        update_dialog = UpdateDialog(self.root, updater, update_info, self.config)
         update_dialog.run()
     
     def play_sound(self, sound_type="hover"):
@@ -457,157 +578,98 @@ class WMRGroupApps:
         self.style.configure("Status.TLabel",
                            font=(font_family, 7))
     
-    def get_apps_data(self):
+    def get_apps_data(self, scan=True):
         apps_info = self.prog_info.get_all_programs_info()
         
         apps = []
-        for app_name, info in apps_info.items():
-            app_path = Path(self.install_dir) / app_name
-            status = self.check_app_status(app_name)
+        for entry in self.catalog.apps:
+            app_id = entry["id"]
+            info = apps_info.get(app_id, {})
+            default_version = entry.get("default_version", "1.0.0")
+            app_path = Path(self.install_dir) / app_id
             
-            app_data = {
+            apps.append({
                 "id": len(apps) + 1,
-                "name": info["name"],
-                "version": info.get("latest_version", "1.0.0"),
-                "description": "",
-                "author": "WMR Group",
-                "github_url": "",
-                "github_api": "",
-                "releases_api": "",
-                "download_url": "",
-                "release_date": info.get("last_updated", datetime.now().strftime("%d.%m.%Y")),
+                "app_id": app_id,
+                "name": entry["name"],
+                "version": info.get("latest_version", default_version),
+                "description": entry.get("description", ""),
+                "author": entry.get("author", "WMR Group"),
+                "github_url": entry.get("github_url", ""),
+                "github_api": entry.get("github_api", ""),
+                "releases_api": entry.get("releases_api", ""),
+                "download_url": entry.get("download_url", ""),
+                "release_date": info.get("last_updated") or datetime.now().strftime("%d.%m.%Y"),
                 "stars": 0,
                 "forks": 0,
-                "category": self.tr["utilities"],
+                "category": self.tr.get(entry.get("category", "utilities"), entry.get("category", "")),
+                "platforms": entry.get("platforms"),
                 "install_path": str(app_path),
-                "status": status,
-                "local_version": self.get_local_version(app_name),
+                "status": self.check_app_status(app_id) if scan else info.get("status", "not_installed"),
+                "local_version": self.get_local_version(app_id),
                 "has_update": info.get("update_available", False),
-                "latest_version": info.get("latest_version", "1.0.0")
-            }
-            
-            if app_name == "WALMFAST":
-                app_data.update({
-                    "description": "WALM Fastboot - tool for easier device flashing via fastboot",
-                    "author": "WALM Studio & MintVioletAurora",
-                    "github_url": "https://github.com/WALMFAST/walmfast",
-                    "github_api": "https://api.github.com/repos/WALMFAST/walmfast/releases/latest",
-                    "releases_api": "https://api.github.com/repos/WALMFAST/walmfast/releases",
-                    "download_url": "https://github.com/WALMFAST/walmfast/archive/refs/heads/main.zip",
-                    "category": self.tr["flashing_tools"],
-                })
-            elif app_name == "Wlap-FlashTool":
-                app_data.update({
-                    "description": "Professional flashing tool for mobile devices",
-                    "author": "MintVioletAurora",
-                    "github_url": "https://github.com/MintVioletAurora/Wlap-FlashTool",
-                    "github_api": "https://api.github.com/repos/MintVioletAurora/Wlap-FlashTool/releases/latest",
-                    "releases_api": "https://api.github.com/repos/MintVioletAurora/Wlap-FlashTool/releases",
-                    "download_url": "https://github.com/MintVioletAurora/Wlap-FlashTool/archive/refs/heads/main.zip",
-                    "category": self.tr["flashing_tools"],
-                })
-            elif app_name == "NightAuroraZIP":
-                app_data.update({
-                    "description": "Powerful archiver for ZIP, RAR, 7z, TAR archives",
-                    "author": "MintVioletAurora",
-                    "github_url": "https://github.com/MintVioletAurora/NightAuroraZIP",
-                    "github_api": "https://api.github.com/repos/MintVioletAurora/NightAuroraZIP/releases/latest",
-                    "releases_api": "https://api.github.com/repos/MintVioletAurora/NightAuroraZIP/releases",
-                    "download_url": "https://github.com/MintVioletAurora/NightAuroraZIP/archive/refs/heads/main.zip",
-                    "category": self.tr["utilities"],
-                })
-            elif app_name == "deltarune-translator":
-                app_data.update({
-                    "description": "Deltarune translation tool",
-                    "author": "WALM Studio",
-                    "github_url": "https://github.com/walmstudio/deltarune-translator",
-                    "github_api": "https://api.github.com/repos/walmstudio/deltarune-translator/releases/latest",
-                    "releases_api": "https://api.github.com/repos/walmstudio/deltarune-translator/releases",
-                    "download_url": "https://github.com/walmstudio/deltarune-translator/archive/refs/heads/main.zip",
-                    "category": self.tr["utilities"],
-                })
-            elif app_name == "musm":
-                app_data.update({
-                    "description": "Music manager and player",
-                    "author": "WALM Studio",
-                    "github_url": "https://github.com/walmstudio/musm",
-                    "github_api": "https://api.github.com/repos/walmstudio/musm/releases/latest",
-                    "releases_api": "https://api.github.com/repos/walmstudio/musm/releases",
-                    "download_url": "https://github.com/walmstudio/musm/archive/refs/heads/main.zip",
-                    "category": self.tr["utilities"],
-                })
-            elif app_name == "wayset":
-                app_data.update({
-                    "description": "Wireless audio system setup tool",
-                    "author": "WALM Studio",
-                    "github_url": "https://github.com/walmstudio/wayset",
-                    "github_api": "https://api.github.com/repos/walmstudio/wayset/releases/latest",
-                    "releases_api": "https://api.github.com/repos/walmstudio/wayset/releases",
-                    "download_url": "https://github.com/walmstudio/wayset/archive/refs/heads/main.zip",
-                    "category": self.tr["utilities"],
-                })
-            elif app_name == "lifus":
-                app_data.update({
-                    "description": "Life utilities collection",
-                    "author": "WALM Archive",
-                    "github_url": "https://github.com/walm-archive/lifus",
-                    "github_api": "https://api.github.com/repos/walm-archive/lifus/releases/latest",
-                    "releases_api": "https://api.github.com/repos/walm-archive/lifus/releases",
-                    "download_url": "https://github.com/walm-archive/lifus/archive/refs/heads/main.zip",
-                    "category": self.tr["utilities"],
-                })
-            
-            apps.append(app_data)
+                "latest_version": info.get("latest_version", default_version)
+            })
         
         return apps
     
-    def check_app_status(self, app_name):
-        app_path = Path(self.install_dir) / app_name
-        if not app_path.exists():
-            return "not_installed"
-        
-        exe_files = self.find_executable_files(str(app_path))
-        if exe_files:
-            return "installed"
-        
-        for item in os.listdir(app_path):
-            item_path = app_path / item
-            if item_path.is_dir():
-                return "partial"
-            if item.endswith((".py", ".txt", ".md", ".json")):
-                return "partial"
-        
-        return "not_installed"
-    
-    def find_executable_files(self, path):
-        executables = []
-        if not os.path.exists(path):
-            return executables
-        
-        for root, dirs, files in os.walk(path):
-            for file in files:
-                if file.lower().endswith((".exe", ".bat", ".py", ".sh", ".command", ".ps1", ".cmd", ".dll")):
-                    full_path = Path(root) / file
-                    rel_path = full_path.relative_to(path)
-                    file_type = "exe" if file.lower().endswith(".exe") else \
-                               "bat" if file.lower().endswith(".bat") else \
-                               "py" if file.lower().endswith(".py") else \
-                               "sh" if file.lower().endswith(".sh") else \
-                               "command" if file.lower().endswith(".command") else \
-                               "ps1" if file.lower().endswith(".ps1") else \
-                               "dll" if file.lower().endswith(".dll") else "cmd"
-                    
-                    executables.append({
-                        "name": file,
-                        "path": str(full_path),
-                        "rel_path": str(rel_path),
-                        "size": full_path.stat().st_size,
-                        "type": file_type
-                    })
-        return executables
-    
-    def get_local_version(self, app_name):
-        info = self.prog_info.get_program_info(app_name)
+    def is_available_on_platform(self, app):
+        return not app.get("platforms") or sys.platform in app["platforms"]
+    
+    def refresh_catalog(self):
+        if self.catalog.refresh():
+            print(f"Catalog updated to revision {self.catalog.revision}")
+            self.prog_info.insert_missing(self.catalog.default_programs())
+            self.run_on_ui(self.reload_apps)
+    
+    def reload_apps(self):
+        self.apply_apps(self.get_apps_data())
+    
+    def apply_apps(self, apps):
+        self.apps = apps
+        if self.current_app:
+            self.current_app = next((app for app in self.apps if app["app_id"] == self.current_app["app_id"]), None)
+        self.display_apps_list()
+        self.update_stats()
+    
+    def check_app_status(self, app_id):
+        app_path = Path(self.install_dir) / app_id
+        return app_status(self.manifests.get_index(app_id, str(app_path)))
+    
+    def find_executable_files(self, path, force=False):
+        if force and not self.fs_watcher.running:
+            self.manifests.drop_index(Path(path).name)
+        return executable_files(path, self.manifests.get_index(Path(path).name, path))
+    
+    def on_install_dir_changes(self, changes):
+        for app_key, app_changes in changes.items():
+            install_path = str(Path(self.install_dir) / app_key)
+            if any(not rel_path or (kind == "moved" and not dest_path) for kind, rel_path, dest_path in app_changes):
+                self.manifests.drop_index(app_key)
+            else:
+                self.manifests.patch_index(app_key, install_path, app_changes)
+            
+            app = next((a for a in self.apps if a["app_id"] == app_key), None)
+            if app is None:
+                continue
+            
+            app["status"] = self.check_app_status(app_key)
+            files = self.find_executable_files(install_path)
+            self.detected_files[app["name"]] = files
+            with self.prog_info.transaction():
+                self.prog_info.update_program_status(
+                    app_key,
+                    app["status"],
+                    install_path if app["status"] != "not_installed" else None
+                )
+                self.prog_info.update_executable_files(app_key, files)
+            
+            self.run_on_ui(lambda a=app: self.refresh_app_entry(a))
+            if self.current_app is app:
+                self.run_on_ui(lambda a=app: self.show_app_details(a))
+    
+    def get_local_version(self, app_id):
+        info = self.prog_info.get_program_info(app_id)
         version = info.get("current_version", "unknown")
         return "v" + version if version != "unknown" and not version.startswith("v") else version
     
@@ -624,52 +686,78 @@ class WMRGroupApps:
         with open(self.config_file, "w", encoding="utf-8") as f:
             json.dump(self.app_config, f, indent=2, ensure_ascii=False)
     
-    def process_tasks(self):
-        try:
-            while not self.task_queue.empty():
-                task = self.task_queue.get_nowait()
-                if task:
-                    self.executor.submit(task)
-        except:
-            pass
-        
-        self.root.after(100, self.process_tasks)
+    def add_task(self, task, priority=PRIORITY_NORMAL, name=None):
+        return self.scheduler.submit(task, priority=priority, name=name)
     
-    def add_task(self, task):
-        self.task_queue.put(task)
+    def run_on_ui(self, callback, *args):
+        self.scheduler.call_in_ui(callback, *args)
     
     def check_app_versions(self):
+        self.run_version_check()
+    
+    def run_version_check(self, show_summary=False):
         def check_versions_task():
-            for app in self.apps:
-                try:
-                    if app.get("github_api"):
-                        response = requests.get(app["github_api"], timeout=5)
-                        if response.status_code == 200:
-                            data = response.json()
-                            latest_version = data.get("tag_name", app["version"])
-                            
-                            local_ver = self.normalize_version(app["local_version"])
-                            latest_ver = self.normalize_version(latest_version)
-                            
-                            if self.compare_versions(latest_ver, local_ver) > 0:
-                                app["has_update"] = True
-                                app["latest_version"] = latest_version
-                                self.prog_info.set_update_available(app["name"], True, latest_version)
-                            else:
-                                app["has_update"] = False
-                                app["latest_version"] = app["local_version"]
-                                self.prog_info.set_update_available(app["name"], False)
-                        else:
-                            app["has_update"] = False
-                    else:
-                        app["has_update"] = False
-                
-                except:
-                    app["has_update"] = False
+            log_lines = []
+            
+            # Every check logs to stdout like the rest of the app; the menu
+            # check also shows the lines in its summary.
+            def log(line):
+                print(line)
+                log_lines.append(line)
+            
+            metrics = self.version_checker.check_all(
+                self.apps,
+                on_result=self.apply_version_result,
+                log_callback=log
+            )
             
-            self.root.after(0, self.display_apps_list)
+            self.run_on_ui(self.update_ui_after_check)
+            
+            if show_summary:
+                updates_found = sum(1 for app in self.apps if app.get("has_update", False))
+                summary = "\n".join(log_lines) or f"Version check: {metrics['checked']} apps"
+                if updates_found > 0:
+                    self.run_on_ui(lambda: messagebox.showinfo(
+                        self.tr["info"],
+                        f"Found {updates_found} application(s) with updates available!\n\n{summary}"
+                    ))
+                else:
+                    self.run_on_ui(lambda: messagebox.showinfo(
+                        self.tr["info"],
+                        f"{self.tr['no_update']}\n\n{summary}"
+                    ))
         
-        self.add_task(check_versions_task)
+        self.add_task(check_versions_task, priority=PRIORITY_BULK)
+    
+    def apply_version_result(self, app, data, error):
+        if data is None:
+            app["has_update"] = False
+        else:
+            latest_version = data.get("tag_name", app["version"])
+            
+            local_ver = self.normalize_version(app["local_version"])
+            latest_ver = self.normalize_version(latest_version)
+            
+            if self.compare_versions(latest_ver, local_ver) > 0:
+                app["has_update"] = True
+                app["latest_version"] = latest_version
+                self.prog_info.set_update_available(app["app_id"], True, latest_version)
+            else:
+                app["has_update"] = False
+                app["latest_version"] = app["local_version"]
+                self.prog_info.set_update_available(app["app_id"], False)
+        
+        self.run_on_ui(lambda: self.refresh_app_entry(app))
+    
+    def refresh_app_entry(self, app):
+        card = self.app_cards.get(app["name"])
+        # Only this app's row is touched; an app without a card is not on
+        # screen yet and picks up its state when the list is next built.
+        if self.virtual_list and self.virtual_list.active:
+            self.virtual_list.refresh_app(app)
+        elif card:
+            card.update(app)
+        self.update_stats()
     
     def normalize_version(self, version):
         if not version or version.lower() in ["unknown", "vunknown"]:
@@ -703,10 +791,7 @@ class WMRGroupApps:
         return 0
     
     def setup_ui(self):
-        self.root.attributes('-alpha', 0.0)
-        
-        menubar = Menu(self.root)
-        self.root.config(menu=menubar)
+        menubar = self.menubar = Menu(self.root)
         
         file_menu = Menu(menubar, tearoff=0)
         menubar.add_cascade(label=self.tr["file"], menu=file_menu)
@@ -732,8 +817,7 @@ class WMRGroupApps:
         menubar.add_cascade(label=self.tr["help"], menu=help_menu)
         help_menu.add_command(label=self.tr["about"], command=self.show_about)
         
-        header = tk.Frame(self.root, bg="#1A1A1A", height=60)
-        header.pack(fill="x")
+        header = self.header = tk.Frame(self.root, bg="#1A1A1A", height=60)
         
         logo_frame = tk.Frame(header, bg="#1A1A1A")
         logo_frame.pack(side="left", padx=20, pady=12)
@@ -834,8 +918,7 @@ class WMRGroupApps:
         )
         folder_btn.pack(side="left", padx=4)
         
-        main_container = tk.Frame(self.root, bg="#000000")
-        main_container.pack(fill="both", expand=True, padx=10, pady=8)
+        main_container = self.main_container = tk.Frame(self.root, bg="#000000")
         
         left_panel = tk.Frame(main_container, bg="#1A1A1A", width=400)
         left_panel.pack(side="left", fill="y", padx=(0, 8))
@@ -865,9 +948,13 @@ class WMRGroupApps:
         )
         filter_label.pack(side="left")
         
-        filters = [self.tr["all"], self.tr["flashing_tools"], self.tr["utilities"]]
+        filters = [
+            (self.tr["all"], None),
+            (self.tr["flashing_tools"], self.tr["flashing_tools"]),
+            (self.tr["utilities"], self.tr["utilities"])
+        ]
         self.filter_buttons = []
-        for i, filt in enumerate(filters):
+        for i, (filt, category) in enumerate(filters):
             btn = tk.Button(
                 filter_frame,
                 text=filt,
@@ -877,7 +964,8 @@ class WMRGroupApps:
                 relief="solid",
                 borderwidth=1,
                 padx=8,
-                pady=2
+                pady=2,
+                command=lambda i=i, category=category: self.set_category_filter(category, i)
             )
             btn.pack(side="left", padx=(6, 0))
             self.filter_buttons.append(btn)
@@ -889,17 +977,16 @@ class WMRGroupApps:
         scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
         self.apps_frame = tk.Frame(self.canvas, bg="#1A1A1A")
         
-        self.apps_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.apps_frame.bind("<Configure>", self.update_list_scrollregion)
         
-        self.canvas.create_window((0, 0), window=self.apps_frame, anchor="nw")
+        self.apps_window = self.canvas.create_window((0, 0), window=self.apps_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=scrollbar.set)
         
         self.canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
+        self.virtual_list = VirtualAppList(self.canvas, self, scrollbar=scrollbar)
+        
         self.display_apps_list()
         
         stats_frame = tk.Frame(left_panel, bg="#1A1A1A")
@@ -922,8 +1009,6 @@ class WMRGroupApps:
         
         # Инициализируем правую панель с приветствием
         self.show_welcome()
-        
-        self.root.after(100, lambda: self.fade_in_widget(self.root, steps=30, duration=300))
     
     def toggle_sound_effects(self):
         self.sound_enabled = self.sound_var.get()
@@ -945,89 +1030,51 @@ class WMRGroupApps:
             )
     
     def check_github_updates(self):
-        def check_updates_task():
-            updates_found = 0
-            for app in self.apps:
-                try:
-                    if app.get("github_api"):
-                        response = requests.get(app["github_api"], timeout=5)
-                        if response.status_code == 200:
-                            data = response.json()
-                            latest_version = data.get("tag_name", app["version"])
-                            
-                            local_ver = self.normalize_version(app["local_version"])
-                            latest_ver = self.normalize_version(latest_version)
-                            
-                            if self.compare_versions(latest_ver, local_ver) > 0:
-                                app["has_update"] = True
-                                app["latest_version"] = latest_version
-                                self.prog_info.set_update_available(app["name"], True, latest_version)
-                                updates_found += 1
-                            else:
-                                app["has_update"] = False
-                                self.prog_info.set_update_available(app["name"], False)
-                        else:
-                            app["has_update"] = False
-                    else:
-                        app["has_update"] = False
-                
-                except:
-                    app["has_update"] = False
-            
-            self.root.after(0, self.update_ui_after_check)
-            
-            if updates_found > 0:
-                self.root.after(0, lambda: messagebox.showinfo(
-                    self.tr["info"],
-                    f"Found {updates_found} application(s) with updates available!"
-                ))
-            else:
-                self.root.after(0, lambda: messagebox.showinfo(
-                    self.tr["info"],
-                    self.tr["no_update"]
-                ))
-        
-        self.add_task(check_updates_task)
+        self.run_version_check(show_summary=True)
     
     def refresh_all_app_status(self):
         def refresh_task():
-            for app in self.apps:
-                app["status"] = self.check_app_status(app["name"])
-                app["local_version"] = self.get_local_version(app["name"])
-                
-                self.prog_info.update_program_status(
-                    app["name"], 
-                    app["status"], 
-                    app["install_path"] if app["status"] == "installed" else None
-                )
+            with self.prog_info.transaction():
+                for app in self.apps:
+                    app["status"] = self.check_app_status(app["app_id"])
+                    app["local_version"] = self.get_local_version(app["app_id"])
+                    
+                    self.prog_info.update_program_status(
+                        app["app_id"], 
+                        app["status"], 
+                        app["install_path"] if app["status"] == "installed" else None
+                    )
             
-            self.root.after(0, self.display_apps_list)
-            self.root.after(0, self.update_stats)
+            self.run_on_ui(self.display_apps_list)
+            self.run_on_ui(self.update_stats)
             if self.current_app:
-                self.root.after(0, lambda: self.show_app_details(self.current_app))
+                self.run_on_ui(lambda: self.show_app_details(self.current_app))
         
-        self.add_task(refresh_task)
+        self.add_task(refresh_task, priority=PRIORITY_BULK)
     
     def detect_all_executables(self):
         def detect_all_task():
-            for app in self.apps:
-                if app["status"] == "installed":
-                    app_path = Path(app["install_path"])
-                    if app_path.exists():
-                        files = self.find_executable_files(str(app_path))
-                        if files:
-                            self.detected_files[app["name"]] = files
-                            self.prog_info.update_executable_files(app["name"], files)
+            installed = {app["app_id"]: app for app in self.apps if app["status"] == "installed"}
+            results = self.scanner.scan_all(
+                str(self.install_dir),
+                installed.keys(),
+                force=not self.fs_watcher.running
+            )
+            
+            for app_key, result in results.items():
+                if result["files"]:
+                    self.detected_files[installed[app_key]["name"]] = result["files"]
+            self.prog_info.apply_scan_results(results)
             
-            self.root.after(0, lambda: messagebox.showinfo(
+            self.run_on_ui(lambda: messagebox.showinfo(
                 self.tr["info"],
                 f"Detected executables in {len([a for a in self.apps if a['status'] == 'installed'])} installed applications"
             ))
             
             if self.current_app:
-                self.root.after(0, lambda: self.show_app_details(self.current_app))
+                self.run_on_ui(lambda: self.show_app_details(self.current_app))
         
-        self.add_task(detect_all_task)
+        self.add_task(detect_all_task, priority=PRIORITY_BULK)
     
     def sync_programs(self):
         def sync_task():
@@ -1037,19 +1084,21 @@ class WMRGroupApps:
             
             self.apps = self.get_apps_data()
             
-            self.root.after(0, lambda: messagebox.showinfo(
+            self.run_on_ui(lambda: messagebox.showinfo(
                 self.tr["sync_complete"],
                 "Program information synchronized successfully!"
             ))
             
-            self.root.after(0, self.display_apps_list)
-            self.root.after(0, self.update_stats)
+            self.run_on_ui(self.display_apps_list)
+            self.run_on_ui(self.update_stats)
             if self.current_app:
-                self.root.after(0, lambda: self.show_app_details(self.current_app))
+                self.run_on_ui(lambda: self.show_app_details(self.current_app))
         
-        self.add_task(sync_task)
+        self.add_task(sync_task, priority=PRIORITY_BULK)
     
     def show_about(self):
+        from about_dialog import AboutDialog
+        
         about_dialog = AboutDialog(self.root, self.config)
         about_dialog.show()
     
@@ -1066,127 +1115,75 @@ class WMRGroupApps:
         
         self.stats_label.config(text=stats_text)
     
+    def set_category_filter(self, category, button_index=0):
+        self.category_filter = category
+        for i, btn in enumerate(self.filter_buttons):
+            btn.config(bg="#333333" if i == button_index else "#222222")
+        self.canvas.yview_moveto(0)
+        self.display_apps_list()
+    
+    def get_filtered_apps(self):
+        if not self.category_filter:
+            return self.apps
+        return [app for app in self.apps if app["category"] == self.category_filter]
+    
+    def use_virtual_list(self, apps):
+        return len(apps) > self.config.get("ui.virtual_list_threshold", 50)
+    
+    def update_list_scrollregion(self, event=None):
+        if self.virtual_list and self.virtual_list.active:
+            return
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    
     def display_apps_list(self):
         if not hasattr(self, "apps_frame") or not self.apps_frame:
             return
         
-        for widget in self.apps_frame.winfo_children():
-            widget.destroy()
+        visible_apps = self.get_filtered_apps()
+        
+        if self.virtual_list and self.use_virtual_list(visible_apps):
+            if not self.virtual_list.active:
+                for card in self.app_cards.values():
+                    card.destroy()
+                self.app_cards = {}
+                self.app_card_order = []
+                self.canvas.itemconfigure(self.apps_window, state="hidden")
+            self.virtual_list.set_items(visible_apps)
+            return
+        
+        if self.virtual_list and self.virtual_list.active:
+            self.virtual_list.deactivate()
+            self.canvas.itemconfigure(self.apps_window, state="normal")
         
+        names = set()
         for app in self.apps:
-            self.create_app_card(app)
+            card = self.app_cards.get(app["name"])
+            if card:
+                card.update(app)
+            else:
+                self.create_app_card(app)
+            names.add(app["name"])
+        
+        for key in [key for key in self.app_cards if key not in names]:
+            self.app_cards.pop(key).destroy()
+        
+        order = [app["name"] for app in visible_apps]
+        if order != self.app_card_order:
+            for card in self.app_cards.values():
+                card.pack_forget()
+            for key in order:
+                self.app_cards[key].pack()
+            self.app_card_order = order
+            self.root.after_idle(self.update_list_scrollregion)
     
     def create_app_card(self, app):
         if not hasattr(self, "apps_frame") or not self.apps_frame:
-            return
-        
-        for widget in self.apps_frame.winfo_children():
-            widget.destroy()
+            return None
         
-        for app in self.apps:
-            card = tk.Frame(
-                self.apps_frame,
-                bg="#222222",
-                relief="solid",
-                borderwidth=1
-            )
-            card.pack(fill="x", padx=8, pady=4, ipady=3)
-            
-            status_icon = "●"
-            status_color = "#00FF00" if app["status"] == "installed" else "#FF0000"
-            
-            if app.get("has_update", False):
-                status_icon = "↻"
-                status_color = "#FFFF00"
-            
-            icon_label = tk.Label(
-                card,
-                text=status_icon,
-                font=("Lucida Console", 10),
-                bg="#222222",
-                fg=status_color
-            )
-            icon_label.pack(side="left", padx=(10, 6), pady=6)
-            
-            text_frame = tk.Frame(card, bg="#222222")
-            text_frame.pack(side="left", fill="both", expand=True, padx=(0, 6))
-            
-            name_text = app["name"]
-            if app.get("has_update", False):
-                name_text += f" [{self.tr['update_to']} {app['latest_version']}]"
-            
-            name_label = tk.Label(
-                text_frame,
-                text=name_text,
-                font=("Lucida Console", 9, "bold"),
-                bg="#222222",
-                fg="#FFFFFF",
-                anchor="w"
-            )
-            name_label.pack(fill="x", pady=(3, 1))
-            
-            version_text = f"{app['local_version']} | {app['category']}"
-            version_label = tk.Label(
-                text_frame,
-                text=version_text,
-                font=("Lucida Console", 7),
-                bg="#222222",
-                fg="#CCCCCC",
-                anchor="w"
-            )
-            version_label.pack(fill="x")
-            
-            status_frame = tk.Frame(card, bg="#222222")
-            status_frame.pack(side="right", padx=(0, 10), pady=6)
-            
-            status_text = self.tr["installed"] if app["status"] == "installed" else self.tr["not_installed"]
-            status_bg = "#333333" if app["status"] == "installed" else "#222222"
-            
-            status_label = tk.Label(
-                status_frame,
-                text=status_text,
-                font=("Lucida Console", 7, "bold"),
-                bg=status_bg,
-                fg="#FFFFFF",
-                padx=6,
-                pady=1,
-                relief="solid",
-                borderwidth=1
-            )
-            status_label.pack()
-            
-            def on_enter(e):
-                self.play_sound("hover")
-                original_bg = e.widget["bg"]
-                self.animate_widget_color(e.widget, original_bg, "#333333", steps=5, duration=50)
-            
-            def on_leave(e):
-                original_bg = "#222222"
-                self.animate_widget_color(e.widget, "#333333", original_bg, steps=5, duration=50)
-            
-            def on_click_app(e, app_data=app):
-                self.play_sound("click")
-                self.show_app_details(app_data)
-            
-            card.bind("<Enter>", on_enter)
-            card.bind("<Leave>", on_leave)
-            card.bind("<Button-1>", on_click_app)
-            
-            icon_label.bind("<Enter>", on_enter)
-            icon_label.bind("<Leave>", on_leave)
-            icon_label.bind("<Button-1>", on_click_app)
-            
-            name_label.bind("<Enter>", on_enter)
-            name_label.bind("<Leave>", on_leave)
-            name_label.bind("<Button-1>", on_click_app)
-            
-            version_label.bind("<Enter>", on_enter)
-            version_label.bind("<Leave>", on_leave)
-            version_label.bind("<Button-1>", on_click_app)
-            
-            status_label.bind("<Enter>", on_enter)
-            status_label.bind("<Leave>", on_leave)
-            status_label.bind("<Button-1>", on_click_app)
+        card = AppCard(self.apps_frame, self)
+        card.update(app)
+        self.app_cards[app["name"]] = card
+        return card
     
     def show_welcome(self):
         if not hasattr(self, "right_panel") or not self.right_panel:
@@ -1454,7 +1451,7 @@ class WMRGroupApps:
             run_menu_btn.pack(side="left", padx=3)
         else:
             # Кнопка установки (если доступна для платформы)
-            if sys.platform != "win32" or (sys.platform == "win32" and app["name"] not in ["MUSM", "Lifus"]):
+            if self.is_available_on_platform(app):
                 install_btn = tk.Button(
                     action_frame,
                     text=self.tr["install"],
@@ -1728,18 +1725,18 @@ class WMRGroupApps:
                     else:
                         self.run_file(file_info)
                 
-                self.root.after(0, lambda: messagebox.showinfo(
+                self.run_on_ui(lambda: messagebox.showinfo(
                     "Info",
                     f"Attempting to run {file_name} as Administrator..."
                 ))
                         
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror(
+                self.run_on_ui(lambda: messagebox.showerror(
                     "Error",
                     f"Failed to run as Administrator:\n{str(e)}"
                 ))
         
-        self.add_task(run_task)
+        self.add_task(run_task, priority=PRIORITY_UI)
     
     def show_releases(self, app):
         if not hasattr(self, "right_panel") or not self.right_panel:
@@ -1806,308 +1803,61 @@ class WMRGroupApps:
             padx=10,
             pady=4,
             cursor="hand2",
-            command=lambda: self.load_releases(app, main_frame)
+            command=lambda: self.release_list.load(force=True)
         )
         refresh_btn.pack(side="right", padx=3)
         
         separator = tk.Frame(main_frame, height=1, bg="#666666")
         separator.pack(fill="x", pady=(0, 15), padx=12)
         
-        loading_frame = tk.Frame(main_frame, bg="#1A1A1A")
-        loading_frame.pack(fill="x", pady=15, padx=12, ipadx=12, ipady=35)
-        
-        loading_label = tk.Label(
-            loading_frame,
-            text=self.tr["loading_releases"] + "...",
-            font=("Lucida Console", 10),
-            bg="#1A1A1A",
-            fg="#00FF00",
-            justify="center"
+        if self.release_list:
+            self.release_list.cancel()
+        self.release_list = ReleaseList(
+            main_frame,
+            main_canvas,
+            self,
+            app,
+            scrollbar=scrollbar,
+            per_page=self.releases_per_page
         )
-        loading_label.pack()
-        
-        self.load_releases(app, main_frame)
+        self.release_list.load()
         
         bottom_padding = tk.Frame(main_frame, height=30, bg="#000000")
         bottom_padding.pack(fill="x")
     
-    def load_releases(self, app, parent_frame):
-        for widget in parent_frame.winfo_children():
-            widget_name = widget.winfo_name()
-            if widget_name not in ["!frame", "!frame2", "!frame3", "!frame4", "!frame5"]:
-                widget.destroy()
-        
-        def load_task():
-            try:
-                releases = []
-                if app.get("releases_api"):
-                    releases = self.get_app_releases(app)
-                
-                self.root.after(0, lambda: self.display_releases(parent_frame, app, releases))
-            
-            except Exception as e:
-                self.root.after(0, lambda: self.show_releases_error(parent_frame, str(e)))
-        
-        self.add_task(load_task)
+    def releases_cache_key(self, app, page):
+        return f"{app['app_id']}:{self.releases_per_page}:{page}"
     
-    def get_app_releases(self, app):
-        cache_key = app["name"]
-        if cache_key in self.releases_cache:
-            return self.releases_cache[cache_key]
+    def get_app_releases(self, app, page=1, force=False):
+        cache_key = self.releases_cache_key(app, page)
+        cached, fresh = self.releases_cache.get(cache_key)
+        if cached is not None and fresh and not force:
+            return cached
         
-        try:
-            if not app.get("releases_api"):
-                return []
-                
-            response = requests.get(app["releases_api"], timeout=10)
-            if response.status_code == 200:
-                releases = response.json()
-                if isinstance(releases, list):
-                    self.releases_cache[cache_key] = releases
-                    return releases
-                else:
-                    return []
-            else:
-                return []
-        except Exception as e:
-            print(f"Error fetching releases for {app['name']}: {e}")
+        if not app.get("releases_api"):
             return []
-    
-    def display_releases(self, parent_frame, app, releases):
-        for widget in parent_frame.winfo_children():
-            if widget.winfo_name() == "!frame" or widget.winfo_name() == "!frame2":
-                continue
-            widget.destroy()
-        
-        if not releases:
-            self.show_no_releases(parent_frame)
-            return
         
-        releases_frame = tk.Frame(parent_frame, bg="#000000")
-        releases_frame.pack(fill="x", padx=12)
-        
-        for i, release in enumerate(releases[:20]):
-            release_frame = tk.Frame(releases_frame, bg="#1A1A1A")
-            release_frame.pack(fill="x", pady=6, ipadx=12, ipady=12)
-            
-            header_frame = tk.Frame(release_frame, bg="#1A1A1A")
-            header_frame.pack(fill="x", pady=(0, 8))
-            
-            version_label = tk.Label(
-                header_frame,
-                text=release.get("tag_name", f"Release {i+1}"),
-                font=("Lucida Console", 12, "bold"),
-                bg="#1A1A1A",
-                fg="#FFFFFF",
-                anchor="w"
+        # Failures raise so the release list shows its error and retry button;
+        # only a page that really is cached is served in their place.
+        try:
+            response = self.github.get(
+                app["releases_api"],
+                params={"per_page": self.releases_per_page, "page": page},
+                timeout=10
             )
-            version_label.pack(side="left")
-            
-            if release.get("prerelease", False):
-                prerelease_label = tk.Label(
-                    header_frame,
-                    text=f" [{self.tr['prerelease']}]",
-                    font=("Lucida Console", 8, "bold"),
-                    bg="#1A1A1A",
-                    fg="#FFAA00",
-                    anchor="w"
-                )
-                prerelease_label.pack(side="left", padx=(4, 0))
-            
-            if i == 0:
-                latest_label = tk.Label(
-                    header_frame,
-                    text=f" [{self.tr['latest']}]",
-                    font=("Lucida Console", 8, "bold"),
-                    bg="#1A1A1A",
-                    fg="#00FF00",
-                    anchor="w"
-                )
-                latest_label.pack(side="left", padx=(4, 0))
-            
-            date_frame = tk.Frame(header_frame, bg="#1A1A1A")
-            date_frame.pack(side="right")
-            
-            date_text = release.get("published_at", "")
-            if date_text:
-                try:
-                    date_obj = datetime.fromisoformat(date_text.replace("Z", "+00:00"))
-                    date_formatted = date_obj.strftime("%Y-%m-%d %H:%M")
-                    date_label = tk.Label(
-                        date_frame,
-                        text=f"{self.tr['published']}: {date_formatted}",
-                        font=("Lucida Console", 7),
-                        bg="#1A1A1A",
-                        fg="#CCCCCC"
-                    )
-                    date_label.pack()
-                except:
-                    pass
-            
-            if release.get("body"):
-                body_text = release["body"]
-                if len(body_text) > 400:
-                    body_text = body_text[:400] + "..."
-                
-                body_label = tk.Label(
-                    release_frame,
-                    text=body_text,
-                    font=("Lucida Console", 8),
-                    bg="#1A1A1A",
-                    fg="#AAAAAA",
-                    wraplength=900,
-                    justify="left",
-                    anchor="w"
-                )
-                body_label.pack(fill="x", pady=(0, 8))
-            
-            assets = release.get("assets", [])
-            if assets:
-                assets_frame = tk.Frame(release_frame, bg="#1A1A1A")
-                assets_frame.pack(fill="x", pady=(0, 8))
-                
-                assets_label = tk.Label(
-                    assets_frame,
-                    text=f"{self.tr['assets']}: {len(assets)}",
-                    font=("Lucida Console", 8, "bold"),
-                    bg="#1A1A1A",
-                    fg="#FFFFFF",
-                    anchor="w"
-                )
-                assets_label.pack(anchor="w", pady=(0, 4))
-                
-                for asset in assets[:5]:
-                    asset_frame = tk.Frame(assets_frame, bg="#2A2A2A")
-                    asset_frame.pack(fill="x", pady=2, ipadx=8, ipady=4)
-                    
-                    asset_name = asset.get("name", "Unknown")
-                    asset_size = asset.get("size", 0)
-                    
-                    size_mb = asset_size / (1024 * 1024)
-                    size_text = f"{size_mb:.2f} MB" if size_mb >= 1 else f"{asset_size / 1024:.2f} KB"
-                    
-                    name_label = tk.Label(
-                        asset_frame,
-                        text=asset_name,
-                        font=("Lucida Console", 7, "bold"),
-                        bg="#2A2A2A",
-                        fg="#CCCCCC",
-                        anchor="w"
-                    )
-                    name_label.pack(side="left", padx=(4, 0))
-                    
-                    size_label = tk.Label(
-                        asset_frame,
-                        text=f" ({size_text})",
-                        font=("Lucida Console", 7),
-                        bg="#2A2A2A",
-                        fg="#888888",
-                        anchor="w"
-                    )
-                    size_label.pack(side="left", padx=(4, 0))
-                    
-                    download_btn = tk.Button(
-                        asset_frame,
-                        text=self.tr["download"],
-                        font=("Lucida Console", 7),
-                        bg="#222222",
-                        fg="#00AAFF",
-                        relief="solid",
-                        borderwidth=1,
-                        padx=6,
-                        pady=2,
-                        cursor="hand2",
-                        command=lambda url=asset.get("browser_download_url", ""): webbrowser.open(url)
-                    )
-                    download_btn.pack(side="right", padx=(0, 4))
-            
-            buttons_frame = tk.Frame(release_frame, bg="#1A1A1A")
-            buttons_frame.pack(fill="x")
-            
-            if release.get("html_url"):
-                github_btn = tk.Button(
-                    buttons_frame,
-                    text=self.tr["github"],
-                    font=("Lucida Console", 7, "bold"),
-                    bg="#222222",
-                    fg="#FFFFFF",
-                    relief="solid",
-                    borderwidth=1,
-                    padx=8,
-                    pady=2,
-                    cursor="hand2",
-                    command=lambda url=release["html_url"]: webbrowser.open(url)
-                )
-                github_btn.pack(side="left", padx=(0, 4))
-            
-            if release.get("zipball_url"):
-                source_btn = tk.Button(
-                    buttons_frame,
-                    text=self.tr["download"] + " (Source)",
-                    font=("Lucida Console", 7),
-                    bg="#222222",
-                    fg="#00FF00",
-                    relief="solid",
-                    borderwidth=1,
-                    padx=8,
-                    pady=2,
-                    cursor="hand2",
-                    command=lambda url=release["zipball_url"]: webbrowser.open(url)
-                )
-                source_btn.pack(side="left", padx=(0, 4))
-    
-    def show_no_releases(self, parent_frame):
-        for widget in parent_frame.winfo_children():
-            if widget.winfo_name() == "!frame" or widget.winfo_name() == "!frame2":
-                continue
-            widget.destroy()
-        
-        no_releases_frame = tk.Frame(parent_frame, bg="#1A1A1A")
-        no_releases_frame.pack(fill="x", pady=30, padx=12, ipadx=12, ipady=35)
-        
-        no_releases_label = tk.Label(
-            no_releases_frame,
-            text=self.tr["no_releases"],
-            font=("Lucida Console", 10),
-            bg="#1A1A1A",
-            fg="#FF5555",
-            justify="center"
-        )
-        no_releases_label.pack()
-    
-    def show_releases_error(self, parent_frame, error_msg):
-        for widget in parent_frame.winfo_children():
-            if widget.winfo_name() == "!frame" or widget.winfo_name() == "!frame2":
-                continue
-            widget.destroy()
-        
-        error_frame = tk.Frame(parent_frame, bg="#1A1A1A")
-        error_frame.pack(fill="x", pady=30, padx=12, ipadx=12, ipady=25)
-        
-        error_label = tk.Label(
-            error_frame,
-            text=f"{self.tr['error']}: {error_msg}",
-            font=("Lucida Console", 8),
-            bg="#1A1A1A",
-            fg="#FF5555",
-            justify="center"
-        )
-        error_label.pack()
+            if response.status_code != 200:
+                raise Exception(f"HTTP {response.status_code}")
+            releases = response.json()
+            if not isinstance(releases, list):
+                raise Exception("Unexpected releases response")
+        except Exception as e:
+            print(f"Error fetching releases for {app['name']}: {e}")
+            if cached is not None:
+                return cached
+            raise
         
-        retry_btn = tk.Button(
-            error_frame,
-            text=self.tr["refresh"],
-            font=("Lucida Console", 8, "bold"),
-            bg="#222222",
-            fg="#FFFFFF",
-            relief="solid",
-            borderwidth=1,
-            padx=12,
-            pady=4,
-            cursor="hand2",
-            command=lambda: self.load_releases(self.current_app, parent_frame)
-        )
-        retry_btn.pack(pady=8)
+        self.releases_cache.set(cache_key, releases)
+        return releases
     
     def show_detected_files(self, parent_frame, app):
         files = self.detected_files.get(app["name"], [])
@@ -2225,30 +1975,30 @@ class WMRGroupApps:
     def detect_app_files(self, app):
         def detect_task():
             if not os.path.exists(app["install_path"]):
-                self.root.after(0, lambda: messagebox.showerror(
+                self.run_on_ui(lambda: messagebox.showerror(
                     self.tr["error"],
                     f"Installation folder not found:\n{app['install_path']}"
                 ))
                 return
             
-            files = self.find_executable_files(app["install_path"])
+            files = self.find_executable_files(app["install_path"], force=True)
             
             if not files:
-                self.root.after(0, lambda: messagebox.showinfo(
+                self.run_on_ui(lambda: messagebox.showinfo(
                     self.tr["info"],
                     f"No executable files found in:\n{app['install_path']}"
                 ))
                 return
             
             self.detected_files[app["name"]] = files
-            self.prog_info.update_executable_files(app["name"], files)
+            self.prog_info.update_executable_files(app["app_id"], files)
             
-            self.root.after(0, lambda: messagebox.showinfo(
+            self.run_on_ui(lambda: messagebox.showinfo(
                 self.tr["info"],
                 f"Found {len(files)} executable file(s) in {app['name']}"
             ))
             
-            self.root.after(0, lambda: self.show_app_details(app))
+            self.run_on_ui(lambda: self.show_app_details(app))
         
         self.add_task(detect_task)
     
@@ -2269,7 +2019,7 @@ class WMRGroupApps:
                     print(f"DEBUG: Changed to directory: {os.getcwd()}")
                     
                     if file_type == "dll":
-                        self.root.after(0, lambda: messagebox.showinfo(
+                        self.run_on_ui(lambda: messagebox.showinfo(
                             self.tr["info"],
                             f"DLL file {file_name} cannot be executed directly.\n\n"
                             f"File path: {file_path}"
@@ -2306,7 +2056,7 @@ class WMRGroupApps:
                         else:
                             os.system(f'./"{file_name}"')
                     
-                    self.root.after(0, lambda: messagebox.showinfo(
+                    self.run_on_ui(lambda: messagebox.showinfo(
                         self.tr["info"],
                         f"Starting {file_name}..."
                     ))
@@ -2318,14 +2068,14 @@ class WMRGroupApps:
                     print(f"DEBUG: Returned to directory: {os.getcwd()}")
                         
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror(
+                self.run_on_ui(lambda: messagebox.showerror(
                     self.tr["error"],
                     f"Failed to start {file_info['name']}:\n{str(e)}\n\n"
                     f"File path: {file_path}\n"
                     f"File type: {file_type}"
                 ))
         
-        self.add_task(run_task)
+        self.add_task(run_task, priority=PRIORITY_UI)
     
     def open_folder(self, path):
         def open_task():
@@ -2338,48 +2088,68 @@ class WMRGroupApps:
                 else:
                     subprocess.Popen(["xdg-open", path_str])
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror(
+                self.run_on_ui(lambda: messagebox.showerror(
                     self.tr["error"],
                     f"Failed to open folder:\n{str(e)}"
                 ))
         
-        self.add_task(open_task)
+        self.add_task(open_task, priority=PRIORITY_UI)
+    
+    def resolve_archive_version(self, app):
+        url = app["download_url"]
+        parsed = self.delta_updater.parse_archive_url(url)
+        if parsed:
+            try:
+                commit = self.delta_updater.resolve_commit(*parsed)
+                # The archive is fetched by commit rather than by branch, so
+                # the bytes always match the version they are cached under.
+                return commit, self.delta_updater.commit_archive_url(url, commit)
+            except Exception as e:
+                print(f"Failed to resolve commit for {app['name']}: {e}")
+        
+        try:
+            return self.downloader.probe(url)["etag"], url
+        except Exception:
+            return None, url
     
     def download_github_repo(self, app, progress_callback=None, log_callback=None):
         try:
-            if log_callback:
-                log_callback(f"Starting download from: {app['download_url']}")
-            
-            response = requests.get(app["download_url"], stream=True, timeout=30)
-            
-            if response.status_code != 200:
-                raise Exception(f"Failed to download. HTTP {response.status_code}")
-            
-            total_size = int(response.headers.get("content-length", 0))
+            version, archive_url = self.resolve_archive_version(app)
+            cached_path = self.download_cache.get(app["download_url"], version)
+            if cached_path:
+                if log_callback:
+                    log_callback(f"Using cached archive ({version[:12]}): {cached_path}")
+                    log_callback(self.download_cache.report())
+                if progress_callback:
+                    progress_callback(100, "Using cached archive")
+                return str(cached_path)
             
             if log_callback:
-                log_callback(f"Total size: {total_size / (1024*1024):.2f} MB")
+                log_callback(f"Starting download from: {archive_url}")
             
-            temp_zip_path = self.temp_dir / f"{app['name']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+            temp_zip_path = self.temp_dir / f"{app['name'].replace(' ', '_')}.zip"
             
-            downloaded = 0
-            chunk_size = 8192
+            def on_progress(downloaded, total_size):
+                if progress_callback and total_size > 0:
+                    percent = (downloaded / total_size) * 100
+                    progress_callback(percent, f"Downloading... {downloaded/(1024*1024):.1f} MB / {total_size/(1024*1024):.1f} MB")
             
-            with open(temp_zip_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if progress_callback and total_size > 0:
-                            percent = (downloaded / total_size) * 100
-                            progress_callback(percent, f"Downloading... {downloaded/(1024*1024):.1f} MB / {total_size/(1024*1024):.1f} MB")
+            self.downloader.download(
+                archive_url,
+                temp_zip_path,
+                progress_callback=on_progress,
+                log_callback=log_callback
+            )
             
             if log_callback:
                 log_callback(f"Download completed: {temp_zip_path}")
                 log_callback(f"File size: {os.path.getsize(temp_zip_path) / (1024*1024):.2f} MB")
             
-            return str(temp_zip_path)
+            zip_path = self.download_cache.put(app["download_url"], version, temp_zip_path)
+            if log_callback:
+                log_callback(self.download_cache.report())
+            
+            return str(zip_path)
         
         except Exception as e:
             if log_callback:
@@ -2391,73 +2161,56 @@ class WMRGroupApps:
             if log_callback:
                 log_callback(f"Extracting archive to: {extract_to}")
             
-            os.makedirs(extract_to, exist_ok=True)
+            def on_progress(done_bytes, total_bytes, done_files, total_files):
+                if progress_callback:
+                    percent = done_bytes / total_bytes * 100 if total_bytes else 100
+                    progress_callback(percent, f"Extracting... {done_files}/{total_files} files, {done_bytes/(1024*1024):.1f} MB")
             
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                file_list = zip_ref.namelist()
-                total_files = len(file_list)
-                
-                if log_callback:
-                    log_callback(f"Found {total_files} files in archive")
-                
-                for i, filename in enumerate(file_list):
-                    try:
-                        zip_ref.extract(filename, extract_to)
-                        
-                        if progress_callback:
-                            percent = (i + 1) / total_files * 100
-                            progress_callback(percent, f"Extracting... {i+1}/{total_files} files")
-                    
-                    except Exception as e:
-                        if log_callback:
-                            log_callback(f"Error extracting {filename}: {str(e)}")
+            result = self.zip_extractor.extract(
+                zip_path,
+                extract_to,
+                progress_callback=on_progress,
+                log_callback=log_callback
+            )
             
             if log_callback:
-                log_callback("Extraction completed successfully")
-            
-            extracted_items = os.listdir(extract_to)
-            
-            if len(extracted_items) == 1:
-                inner_path = os.path.join(extract_to, extracted_items[0])
-                if os.path.isdir(inner_path):
-                    if log_callback:
-                        log_callback(f"Moving files from: {inner_path}")
-                    
-                    for item in os.listdir(inner_path):
-                        src = os.path.join(inner_path, item)
-                        dst = os.path.join(extract_to, item)
-                        shutil.move(src, dst)
-                    
-                    shutil.rmtree(inner_path)
+                if result["errors"]:
+                    log_callback(f"Extraction failed for {len(result['errors'])} files")
+                else:
+                    log_callback("Extraction completed successfully")
             
-            return True
+            return not result["errors"]
         
         except Exception as e:
             if log_callback:
                 log_callback(f"Extraction error: {str(e)}")
             raise
     
-    def install_app(self, app):
-        if sys.platform == "win32" and app["name"] in ["MUSM", "Lifus"]:
-            messagebox.showwarning(
-                self.tr["warning"],
-                f"{app['name']} is not available for installation on Windows.\n\n"
-                f"This application is only available for Linux systems."
-            )
-            return
+    def swap_install_dir(self, staging_path, install_path, log_callback=None):
+        backup_path = f"{install_path}.old"
+        if os.path.exists(backup_path):
+            shutil.rmtree(backup_path)
         
-        response = messagebox.askyesno(
-            self.tr["install"],
-            f"Install {app['name']}?\n\n"
-            f"Application will be downloaded from GitHub and installed to:\n{app['install_path']}\n\n"
-            f"Note: This will download the entire repository (~few MB)"
-        )
+        had_previous = os.path.exists(install_path)
+        if had_previous:
+            os.rename(install_path, backup_path)
         
-        if not response:
-            return
+        try:
+            os.rename(staging_path, install_path)
+        except Exception:
+            if had_previous:
+                os.rename(backup_path, install_path)
+            raise
         
+        if log_callback:
+            log_callback(f"Installed to: {install_path}")
+        
+        if had_previous:
+            shutil.rmtree(backup_path, ignore_errors=True)
+    
+    def open_progress_window(self, app, title, status):
         progress_window = tk.Toplevel(self.root)
-        progress_window.title(f"{self.tr['installing']} {app['name']}")
+        progress_window.title(f"{title} {app['name']}")
         progress_window.geometry("600x350")
         progress_window.configure(bg="#000000")
         progress_window.resizable(False, False)
@@ -2467,7 +2220,7 @@ class WMRGroupApps:
         
         title_label = tk.Label(
             progress_window,
-            text=f"{self.tr['installing'].upper()} {app['name'].upper()}",
+            text=f"{title.upper()} {app['name'].upper()}",
             font=("Lucida Console", 12, "bold"),
             bg="#000000",
             fg="#FFFFFF"
@@ -2494,7 +2247,7 @@ class WMRGroupApps:
         
         self.status_label = tk.Label(
             progress_window,
-            text=self.tr["preparing_download"],
+            text=status,
             font=("Lucida Console", 8),
             bg="#000000",
             fg="#00FF00"
@@ -2524,21 +2277,51 @@ class WMRGroupApps:
         )
         console_text.pack(fill="both", expand=True)
         
+        channel = ProgressChannel(progress_window).bind(
+            progress_var=progress_var,
+            status_label=self.status_label,
+            detail_label=self.detail_label,
+            console_text=console_text
+        )
+        
+        return progress_window, channel, console_text
+    
+    def install_app(self, app, confirm=True):
+        if not self.is_available_on_platform(app):
+            messagebox.showwarning(
+                self.tr["warning"],
+                f"{app['name']} is not available for installation on this system.\n\n"
+                f"Supported platforms: {', '.join(app['platforms'])}"
+            )
+            return
+        
+        if confirm:
+            response = messagebox.askyesno(
+                self.tr["install"],
+                f"Install {app['name']}?\n\n"
+                f"Application will be downloaded from GitHub and installed to:\n{app['install_path']}\n\n"
+                f"Note: This will download the entire repository (~few MB)"
+            )
+            
+            if not response:
+                return
+        
+        progress_window, channel, console_text = self.open_progress_window(
+            app,
+            self.tr["installing"],
+            self.tr["preparing_download"]
+        )
+        
         def log_message(message):
-            console_text.insert("end", f"> {message}\n")
-            console_text.see("end")
-            progress_window.update()
+            channel.log(message)
         
         def update_progress(percent, detail=""):
-            progress_var.set(percent)
-            if detail:
-                self.detail_label.config(text=detail)
-            progress_window.update()
+            channel.set_progress(percent, detail)
         
         def real_installation():
             try:
                 log_message("Starting download from GitHub...")
-                self.status_label.config(text=self.tr["downloading_from_github"])
+                channel.set_status(self.tr["downloading_from_github"])
                 
                 zip_path = self.download_github_repo(
                     app, 
@@ -2548,54 +2331,52 @@ class WMRGroupApps:
                 
                 log_message(f"Download completed: {zip_path}")
                 
-                self.status_label.config(text=self.tr["extracting_files"])
+                channel.set_status(self.tr["extracting_files"])
                 update_progress(60, "Preparing to extract...")
                 
-                extract_temp_dir = self.temp_dir / f"extract_{app['name']}"
+                # Staging lives next to install_path so the final swap is a rename on
+                # the same filesystem rather than another copy.
+                staging_path = f"{app['install_path']}.staging"
+                if os.path.exists(staging_path):
+                    shutil.rmtree(staging_path)
                 
-                self.extract_zip_file(
+                # A partly extracted staging dir must never replace a working
+                # install; the handler below removes it.
+                if not self.extract_zip_file(
                     zip_path,
-                    str(extract_temp_dir),
+                    staging_path,
                     app,
-                    progress_callback=lambda p, d: update_progress(60 + p * 0.2, d),
+                    progress_callback=lambda p, d: update_progress(60 + p * 0.25, d),
                     log_callback=log_message
-                )
-                
-                log_message(f"Extraction completed to: {extract_temp_dir}")
-                
-                self.status_label.config(text=self.tr["copying_files"])
-                update_progress(80, "Copying files to installation directory...")
-                
-                if os.path.exists(app["install_path"]):
-                    shutil.rmtree(app["install_path"])
+                ):
+                    raise Exception("Some files could not be extracted; the existing installation was kept")
                 
-                os.makedirs(app["install_path"], exist_ok=True)
+                channel.set_status(self.tr["copying_files"])
+                update_progress(85, "Replacing installation directory...")
                 
-                for item in os.listdir(extract_temp_dir):
-                    src = os.path.join(extract_temp_dir, item)
-                    dst = os.path.join(app["install_path"], item)
-                    
-                    if os.path.isdir(src):
-                        shutil.copytree(src, dst)
-                    else:
-                        shutil.copy2(src, dst)
+                self.swap_install_dir(staging_path, app["install_path"], log_callback=log_message)
+                self.manifests.drop_index(app["app_id"])
                 
-                log_message(f"Files copied to: {app['install_path']}")
+                try:
+                    if self.delta_updater.snapshot(app["app_id"], app["install_path"], app["download_url"]):
+                        log_message("Install manifest recorded for delta updates")
+                except Exception as e:
+                    log_message(f"Install manifest not recorded: {str(e)}")
                 
-                self.status_label.config(text=self.tr["creating_launchers"])
+                channel.set_status(self.tr["creating_launchers"])
                 update_progress(90, "Creating launcher files...")
                 
                 self.create_launcher_files(app)
                 
-                self.status_label.config(text=self.tr["finalizing"])
+                channel.set_status(self.tr["finalizing"])
                 update_progress(95, "Updating configuration...")
                 
                 app["status"] = "installed"
                 version_to_use = app.get("latest_version", app["version"])
-                app["local_version"] = self.get_local_version(app["name"])
+                app["local_version"] = self.get_local_version(app["app_id"])
                 
-                self.prog_info.update_program_status(app["name"], "installed", app["install_path"])
-                self.prog_info.update_program_version(app["name"], version_to_use.replace("v", ""))
+                self.prog_info.update_program_status(app["app_id"], "installed", app["install_path"])
+                self.prog_info.update_program_version(app["app_id"], version_to_use.replace("v", ""))
                 
                 self.app_config.setdefault("installed_apps", {})[app["name"]] = {
                     "version": version_to_use.replace("v", ""),
@@ -2607,27 +2388,25 @@ class WMRGroupApps:
                 
                 files = self.find_executable_files(app["install_path"])
                 self.detected_files[app["name"]] = files
-                self.prog_info.update_executable_files(app["name"], files)
+                self.prog_info.update_executable_files(app["app_id"], files)
                 
                 try:
-                    if os.path.exists(zip_path):
+                    if Path(zip_path).parent == self.temp_dir and os.path.exists(zip_path):
                         os.remove(zip_path)
-                    if os.path.exists(extract_temp_dir):
-                        shutil.rmtree(extract_temp_dir)
                     log_message("Temporary files cleaned up")
                 except:
                     pass
                 
                 update_progress(100, "Installation complete!")
-                self.status_label.config(text=self.tr["installation_complete"])
+                channel.set_status(self.tr["installation_complete"])
                 log_message("Installation completed successfully!")
                 
                 import time
                 time.sleep(1)
                 
-                self.root.after(0, progress_window.destroy)
+                self.run_on_ui(lambda: [channel.close(), progress_window.destroy()])
                 
-                self.root.after(0, lambda: messagebox.showinfo(
+                self.run_on_ui(lambda: messagebox.showinfo(
                     self.tr["success"],
                     f"{app['name']} has been installed successfully!\n\n"
                     f"Location: {app['install_path']}\n"
@@ -2635,16 +2414,17 @@ class WMRGroupApps:
                     f"Click '{self.tr['detect_files']}' to see all available executables."
                 ))
                 
-                self.root.after(0, self.display_apps_list)
-                self.root.after(0, lambda: self.show_app_details(app))
-                self.root.after(0, self.update_stats)
+                self.run_on_ui(self.display_apps_list)
+                self.run_on_ui(lambda: self.show_app_details(app))
+                self.run_on_ui(self.update_stats)
             
             except Exception as e:
                 log_message(f"ERROR: {str(e)}")
-                self.status_label.config(text=self.tr["installation_failed"])
-                self.detail_label.config(text=f"Error: {str(e)}")
+                channel.set_status(self.tr["installation_failed"])
+                shutil.rmtree(f"{app['install_path']}.staging", ignore_errors=True)
+                channel.set_detail(f"Error: {str(e)}")
                 
-                self.root.after(0, lambda: tk.Button(
+                self.run_on_ui(lambda: tk.Button(
                     progress_window,
                     text=self.tr["view_error_details"],
                     font=("Lucida Console", 7),
@@ -2904,12 +2684,76 @@ TROUBLESHOOTING:
         if not response:
             return
         
+        progress_window, channel, console_text = self.open_progress_window(
+            app,
+            self.tr["updating"],
+            self.tr["downloading_from_github"]
+        )
+        
+        def on_progress(done_files, total_files, done_bytes):
+            channel.set_progress(
+                done_files / total_files * 100 if total_files else 100,
+                f"{done_files}/{total_files} files, {done_bytes / 1024:.1f} KB"
+            )
+        
+        def delta_task():
+            channel.log(f"Checking {app['download_url']} for changed files...")
+            result = self.delta_updater.update(
+                app["app_id"],
+                app["install_path"],
+                app["download_url"],
+                progress_callback=on_progress,
+                log_callback=channel.log
+            )
+            
+            files = self.find_executable_files(app["install_path"])
+            self.detected_files[app["name"]] = files
+            self.prog_info.update_executable_files(app["app_id"], files)
+            return result
+        
+        def on_done(result):
+            channel.close()
+            progress_window.destroy()
+            self.finish_update(app, result)
+        
+        def on_error(error):
+            if isinstance(error, DeltaUnavailable):
+                # Anything the delta path cannot handle (no manifest, too many
+                # changes, a bad blob) is repaired by a full download.
+                channel.close()
+                progress_window.destroy()
+                self.install_app(app, confirm=False)
+                return
+            
+            channel.log(f"ERROR: {str(error)}")
+            channel.set_status(self.tr["installation_failed"])
+            channel.set_detail(f"Error: {str(error)}")
+            tk.Button(
+                progress_window,
+                text=self.tr["view_error_details"],
+                font=("Lucida Console", 7),
+                bg="#442222",
+                fg="#FFFFFF",
+                relief="solid",
+                borderwidth=1,
+                command=lambda: self.show_error_details(str(error), console_text.get("1.0", "end"))
+            ).pack(pady=6)
+        
+        self.scheduler.submit(
+            delta_task,
+            priority=PRIORITY_UI,
+            name=f"delta_update:{app['name']}",
+            on_done=on_done,
+            on_error=on_error
+        )
+    
+    def finish_update(self, app, result):
         app["local_version"] = app["latest_version"]
         app["has_update"] = False
         
         version_without_v = app["latest_version"].replace("v", "")
-        self.prog_info.update_program_version(app["name"], version_without_v)
-        self.prog_info.set_update_available(app["name"], False)
+        self.prog_info.update_program_version(app["app_id"], version_without_v)
+        self.prog_info.set_update_available(app["app_id"], False)
         
         if app["name"] in self.app_config.get("installed_apps", {}):
             self.app_config["installed_apps"][app["name"]]["version"] = version_without_v
@@ -2922,7 +2766,9 @@ TROUBLESHOOTING:
         
         messagebox.showinfo(
             self.tr["success"],
-            f"{app['name']} has been updated to {app['latest_version']}!"
+            f"{app['name']} has been updated to {app['latest_version']}!\n\n"
+            f"{result['changed']} files changed, {result['removed']} removed "
+            f"({result['bytes'] / 1024:.1f} KB downloaded)"
         )
     
     def uninstall_app(self, app):
@@ -2939,6 +2785,7 @@ TROUBLESHOOTING:
             try:
                 if os.path.exists(app["install_path"]):
                     shutil.rmtree(app["install_path"])
+                self.manifests.delete(app["app_id"])
                 
                 if app["name"] in self.app_config.get("installed_apps", {}):
                     del self.app_config["installed_apps"][app["name"]]
@@ -2951,49 +2798,43 @@ TROUBLESHOOTING:
                 app["local_version"] = "unknown"
                 app["has_update"] = False
                 
-                self.prog_info.update_program_status(app["name"], "not_installed")
-                self.prog_info.update_program_version(app["name"], "unknown")
-                self.prog_info.set_update_available(app["name"], False)
+                self.prog_info.update_program_status(app["app_id"], "not_installed")
+                self.prog_info.update_program_version(app["app_id"], "unknown")
+                self.prog_info.set_update_available(app["app_id"], False)
                 
-                self.root.after(0, lambda: messagebox.showinfo(
+                self.run_on_ui(lambda: messagebox.showinfo(
                     self.tr["success"],
                     f"{app['name']} has been successfully uninstalled."
                 ))
                 
-                self.root.after(0, lambda: self.display_apps_list())
-                self.root.after(0, lambda: self.show_app_details(app))
-                self.root.after(0, lambda: self.update_stats())
+                self.run_on_ui(lambda: self.display_apps_list())
+                self.run_on_ui(lambda: self.show_app_details(app))
+                self.run_on_ui(lambda: self.update_stats())
             
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror(
+                self.run_on_ui(lambda: messagebox.showerror(
                     self.tr["error"],
                     f"Failed to uninstall {app['name']}:\n{str(e)}"
                 ))
         
         self.add_task(uninstall_task)
 
-def main():
-    try:
-        import tkinter
-        import requests
-    except ImportError as e:
-        print(f"ERROR: {e}")
+def main(config=None, startup=None):
+    # find_spec checks that requests is installed without paying for the import.
+    if importlib.util.find_spec("requests") is None:
+        print("ERROR: No module named 'requests'")
         print("Please install required packages:")
         print("pip install requests")
         return
     
-    config = Config()
-    
-    root = tk.Tk()
-    app = WMRGroupApps(root, config)
-    
-    root.update_idletasks()
-    width = root.winfo_width()
-    height = root.winfo_height()
-    x = (root.winfo_screenwidth() // 2) - (width // 2)
-    y = (root.winfo_screenheight() // 2) - (height // 2)
-    root.geometry(f"{width}x{height}+{x}+{y}")
+    config = config or Config()
+    startup = startup or StartupTimer()
     
-    root.resizable(True, True)
+    shell = AppShell()
+    startup.mark("tk root")
+    app = WMRGroupApps(shell.root, config, startup)
+    shell.on_shutdown(app.shutdown)
     
-    root.mainloop()
+    shell.show(app)
+    shell.center(*app.window_size)
+    shell.run()
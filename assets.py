@@ -0,0 +1,128 @@
+import os
+import hashlib
+import threading
+import tkinter as tk
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent
+LOGO_NAMES = ["Logo.png", "logo.png", "icon.png", "icon.ico"]
+
+def find_logo():
+    for name in LOGO_NAMES:
+        path = BASE_DIR / name
+        if path.exists():
+            return path
+    return None
+
+class AssetCache:
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.lock = threading.Lock()
+    
+    def source_hash(self, source):
+        digest = hashlib.sha256()
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def variant_path(self, source, size, source_hash):
+        width, height = size
+        return self.cache_dir / f"{Path(source).stem}-{source_hash[:16]}-{width}x{height}.png"
+    
+    def render(self, source, size, target):
+        from PIL import Image
+        
+        with Image.open(source) as img:
+            img = img.convert("RGBA")
+            img.thumbnail(size, Image.Resampling.LANCZOS)
+            
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_name(f"{target.name}.{threading.get_ident()}.tmp")
+            try:
+                img.save(tmp_path, "PNG", optimize=True)
+                os.replace(tmp_path, target)
+            except:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+    
+    def prune(self, source, keep):
+        # Variants of an older source file are never read again.
+        prefix = f"{Path(source).stem}-"
+        for path in self.cache_dir.glob(f"{prefix}*.png"):
+            if not path.name.startswith(prefix + keep):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+    
+    def get(self, source, size):
+        source_hash = self.source_hash(source)
+        target = self.variant_path(source, size, source_hash)
+        if target.exists():
+            return target
+        
+        with self.lock:
+            if not target.exists():
+                self.render(source, size, target)
+                self.prune(source, source_hash[:16])
+        return target
+
+def load_photo(path, master):
+    # Tk 8.6 reads PNG itself, which keeps PIL off the warm path; PIL is the
+    # fallback for older Tk builds.
+    try:
+        return tk.PhotoImage(master=master, file=str(path))
+    except tk.TclError:
+        from PIL import Image, ImageTk
+        with Image.open(path) as img:
+            return ImageTk.PhotoImage(img.copy(), master=master)
+
+def load_logo(master, cache, size, on_ready, poll_interval=15):
+    source = find_logo()
+    if source is None:
+        on_ready(None)
+        return
+    
+    result = {}
+    
+    def worker():
+        try:
+            result["path"] = cache.get(source, size)
+        except Exception as e:
+            print(f"Failed to prepare logo: {e}")
+            result["path"] = None
+    
+    def poll():
+        if "path" not in result:
+            try:
+                master.after(poll_interval, poll)
+            except tk.TclError:
+                pass
+            return
+        
+        # The window the logo was meant for may have closed while it was
+        # being prepared.
+        try:
+            if not master.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        
+        photo = None
+        if result["path"] is not None:
+            try:
+                photo = load_photo(result["path"], master)
+            except Exception as e:
+                print(f"Failed to load logo: {e}")
+        
+        try:
+            on_ready(photo)
+        except tk.TclError:
+            pass
+    
+    threading.Thread(target=worker, name="logo-loader", daemon=True).start()
+    poll()
@@ -17,6 +17,7 @@ pyinstaller --onefile --windowed ^
   --name "WMR_Group_Apps" ^
   --icon=icon.ico ^
   --add-data "*.json;." ^
+  --add-data "catalog.json;." ^
   --hidden-import=requests ^
   --hidden-import=PIL ^
   --hidden-import=tkinter ^
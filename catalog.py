@@ -0,0 +1,149 @@
+import re
+import json
+import time
+import threading
+from pathlib import Path
+
+from json_store import atomic_write_json
+
+CATALOG_SCHEMA = 1
+# Ids become directory names under the install dir, and uninstall removes that
+# directory, so an id must be exactly one plain path component.
+APP_ID_PATTERN = re.compile(r"[A-Za-z0-9_-][A-Za-z0-9_.-]*")
+
+class CatalogError(Exception):
+    pass
+
+class Catalog:
+    def __init__(self, config, client=None):
+        self.config = config
+        self.client = client
+        self.source = config.get("catalog.url", "") if config else ""
+        self.refresh_interval = config.get("catalog.refresh_interval", 21600) if config else 21600
+        
+        self.base_dir = Path(__file__).parent
+        self.bundled_file = self.base_dir / "catalog.json"
+        data_dir = config.get_data_path() if config else self.base_dir / "data"
+        self.cache_file = Path(data_dir) / "catalog_cache.json"
+        
+        self.lock = threading.Lock()
+        self.index = None
+        self.by_id = {}
+        self.fetched_at = 0
+        self.load()
+    
+    def validate(self, index):
+        if not isinstance(index, dict) or not isinstance(index.get("apps"), list):
+            raise CatalogError("Catalog index has no app list")
+        if index.get("schema") != CATALOG_SCHEMA:
+            raise CatalogError(f"Unsupported catalog schema: {index.get('schema')}")
+        
+        seen = set()
+        for app in index["apps"]:
+            if not app.get("id") or not app.get("name"):
+                raise CatalogError("Catalog entry without id or name")
+            if not isinstance(app["id"], str) or not APP_ID_PATTERN.fullmatch(app["id"]):
+                raise CatalogError(f"Unsafe catalog id: {app['id']!r}")
+            if app["id"] in seen:
+                raise CatalogError(f"Duplicate catalog id: {app['id']}")
+            seen.add(app["id"])
+        return index
+    
+    def read_file(self, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return self.validate(json.load(f))
+    
+    def load(self):
+        candidates = []
+        for path in [self.cache_file, self.bundled_file]:
+            try:
+                candidates.append(self.read_file(path))
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                print(f"Ignoring catalog {path.name}: {e}")
+        
+        if not candidates:
+            raise CatalogError("No usable catalog found")
+        
+        # A cached remote index wins unless the bundled one is newer, which is
+        # the case right after a manager update that ships a fresher catalog.
+        index = max(candidates, key=lambda candidate: candidate.get("revision", 0))
+        self.fetched_at = index.get("fetched_at", 0)
+        self.set_index(index)
+    
+    def set_index(self, index):
+        with self.lock:
+            self.index = index
+            self.by_id = {app["id"]: app for app in index["apps"]}
+    
+    @property
+    def revision(self):
+        return self.index.get("revision", 0)
+    
+    @property
+    def apps(self):
+        return self.index["apps"]
+    
+    def get(self, app_id):
+        return self.by_id.get(app_id)
+    
+    def default_programs(self):
+        programs = {}
+        for app in self.apps:
+            version = app.get("default_version", "1.0.0")
+            programs[app["id"]] = {
+                "name": app["name"],
+                "current_version": version,
+                "latest_version": version,
+                "last_checked": None,
+                "last_updated": None,
+                "install_path": None,
+                "file_count": 0,
+                "executable_files": [],
+                "status": "not_installed",
+                "update_available": False
+            }
+        return programs
+    
+    def fetch_source(self):
+        if self.source.startswith(("http://", "https://")):
+            if self.client is None:
+                raise CatalogError("No HTTP client for a remote catalog")
+            # GitHubClient sends If-None-Match/If-Modified-Since, so an
+            # unchanged index costs a 304 and no body.
+            response = self.client.get(self.source, timeout=10)
+            if response.status_code != 200:
+                raise CatalogError(f"HTTP {response.status_code}")
+            return self.validate(response.json())
+        
+        path = Path(self.source)
+        if not path.is_absolute():
+            path = self.base_dir / path
+        return self.read_file(path)
+    
+    def refresh(self, force=False):
+        if not self.source:
+            return False
+        if not force and time.time() - self.fetched_at < self.refresh_interval:
+            return False
+        
+        try:
+            index = self.fetch_source()
+        except Exception as e:
+            print(f"Catalog refresh failed, keeping revision {self.revision}: {e}")
+            return False
+        
+        self.fetched_at = time.time()
+        index["fetched_at"] = self.fetched_at
+        try:
+            atomic_write_json(self.cache_file, index, fsync=False)
+        except Exception as e:
+            print(f"Failed to cache catalog: {e}")
+        
+        if index.get("revision", 0) < self.revision:
+            return False
+        
+        changed = index["apps"] != self.apps
+        self.set_index(index)
+        return changed
@@ -1,7 +1,37 @@
 import os
 import json
+import threading
 from pathlib import Path
 
+from json_store import CoalescingWriter, atomic_write_json
+
+class ConfigFile:
+    # Several Config objects live in one process (main, the language
+    # selector, the store, the updater). All of them for one path share this
+    # dict, lock and writer, so none of them can overwrite another's changes.
+    registry = {}
+    registry_lock = threading.Lock()
+    
+    def __init__(self, path, data):
+        self.path = path
+        self.data = data
+        self.lock = threading.RLock()
+        self.writer = CoalescingWriter(self.write, delay=0.5)
+    
+    @classmethod
+    def open(cls, path, load):
+        key = os.path.normcase(os.path.realpath(path))
+        with cls.registry_lock:
+            shared = cls.registry.get(key)
+            if shared is None:
+                shared = cls.registry[key] = cls(path, load())
+            return shared
+    
+    def write(self):
+        with self.lock:
+            data = json.dumps(self.data, indent=2, ensure_ascii=False)
+        atomic_write_json(self.path, data)
+
 class Config:
     def __init__(self):
         self.base_dir = Path(__file__).parent
@@ -31,10 +61,37 @@ class Config:
                 "window_size": "1400x800",
                 "font_family": "Lucida Console",
                 "font_size": 10,
-                "sound_effects": True
+                "sound_effects": True,
+                "virtual_list_threshold": 50
+            },
+            "cache": {
+                "releases_ttl": 3600,
+                "releases_max_entries": 32,
+                "stale_while_revalidate": True,
+                "downloads_max_mb": 512
+            },
+            "github": {
+                "api_base": "https://api.github.com",
+                "raw_base": "https://raw.githubusercontent.com",
+                "delta_max_files": 200,
+                "releases_per_page": 10
+            },
+            "watcher": {
+                "enabled": True,
+                "debounce": 0.5
+            },
+            "storage": {
+                "program_info_backend": "json"
+            },
+            "catalog": {
+                "url": "https://raw.githubusercontent.com/WMR-Group/WMR-GROUP-APPS/main/catalog.json",
+                "refresh_interval": 21600
             }
         }
-        self.config = self.load_config()
+        self.shared = ConfigFile.open(self.config_file, self.load_config)
+        self.config = self.shared.data
+        self.lock = self.shared.lock
+        self.writer = self.shared.writer
     
     def load_config(self):
         if self.config_file.exists():
@@ -55,9 +112,14 @@ class Config:
         return default
     
     def save_config(self):
-        os.makedirs(self.base_dir, exist_ok=True)
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(self.config, f, indent=2, ensure_ascii=False)
+        self.writer.mark_dirty()
+        self.writer.flush()
+    
+    def batch(self):
+        return self.writer.transaction()
+    
+    def flush(self):
+        self.writer.flush()
     
     def get(self, key, default=None):
         keys = key.split(".")
@@ -71,13 +133,14 @@ class Config:
     
     def set(self, key, value):
         keys = key.split(".")
-        config = self.config
-        for i, k in enumerate(keys[:-1]):
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-        config[keys[-1]] = value
-        self.save_config()
+        with self.lock:
+            config = self.config
+            for i, k in enumerate(keys[:-1]):
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
+            config[keys[-1]] = value
+        self.writer.mark_dirty()
     
     def get_language(self):
         lang = self.get("app.language")
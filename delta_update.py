@@ -0,0 +1,187 @@
+import os
+import re
+import shutil
+import threading
+from urllib.parse import quote
+
+from install_manifest import git_blob_sha
+
+class DeltaUnavailable(Exception):
+    pass
+
+class DeltaUpdater:
+    def __init__(self, client, manifests, api_base="https://api.github.com",
+                 raw_base="https://raw.githubusercontent.com", max_files=200, workers=8):
+        self.client = client
+        self.manifests = manifests
+        self.api_base = api_base.rstrip("/")
+        self.raw_base = raw_base.rstrip("/")
+        self.max_files = max_files
+        self.workers = workers
+    
+    def parse_archive_url(self, url):
+        match = re.match(r"https?://[^/]+/([^/]+)/([^/]+)/archive/refs/(?:heads|tags)/(.+)\.zip$", url)
+        if not match:
+            return None
+        return match.groups()
+    
+    def commit_archive_url(self, url, commit):
+        return re.sub(r"/archive/refs/(?:heads|tags)/.+\.zip$", f"/archive/{commit}.zip", url)
+    
+    def resolve_commit(self, owner, repo, ref):
+        response = self.client.get(f"{self.api_base}/repos/{owner}/{repo}/commits/{ref}")
+        if response.status_code != 200:
+            raise DeltaUnavailable(f"Cannot resolve {owner}/{repo}@{ref}: HTTP {response.status_code}")
+        return response.json()["sha"]
+    
+    def fetch_tree(self, owner, repo, commit):
+        response = self.client.get(f"{self.api_base}/repos/{owner}/{repo}/git/trees/{commit}", params={"recursive": "1"})
+        if response.status_code != 200:
+            raise DeltaUnavailable(f"Cannot fetch tree for {owner}/{repo}@{commit[:12]}: HTTP {response.status_code}")
+        
+        data = response.json()
+        if data.get("truncated"):
+            raise DeltaUnavailable(f"Tree for {owner}/{repo} is too large for the tree API")
+        
+        blobs = [item for item in data.get("tree", []) if item.get("type") == "blob"]
+        tree = {item["path"]: item["sha"] for item in blobs}
+        modes = {item["path"]: item.get("mode", "100644") for item in blobs}
+        return tree, modes
+    
+    def snapshot(self, app_key, install_path, download_url):
+        parsed = self.parse_archive_url(download_url)
+        if not parsed:
+            return None
+        
+        owner, repo, ref = parsed
+        with self.manifests.editing(app_key):
+            commit = self.resolve_commit(owner, repo, ref)
+            tree, modes = self.fetch_tree(owner, repo, commit)
+            manifest = self.manifests.build(install_path, tree, f"{owner}/{repo}", ref, commit)
+            self.manifests.save(app_key, manifest)
+        return manifest
+    
+    def plan(self, manifest, tree, install_path):
+        known = manifest["files"]
+        changed = []
+        for rel_path, sha in tree.items():
+            entry = known.get(rel_path)
+            local_path = os.path.join(install_path, *rel_path.split("/"))
+            if entry is None or entry["sha"] != sha or not os.path.isfile(local_path):
+                changed.append(rel_path)
+        
+        removed = [rel_path for rel_path in known if rel_path not in tree]
+        return changed, removed
+    
+    def download_blob(self, owner, repo, commit, rel_path, sha, target, mode="100644"):
+        url = f"{self.raw_base}/{owner}/{repo}/{commit}/{quote(rel_path)}"
+        response = self.client.session.get(url, stream=True, timeout=self.client.timeout)
+        if response.status_code != 200:
+            raise DeltaUnavailable(f"Failed to download {rel_path}: HTTP {response.status_code}")
+        
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        size = 0
+        with open(target, "wb") as f:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
+                size += len(chunk)
+        
+        if git_blob_sha(target) != sha:
+            raise DeltaUnavailable(f"Checksum mismatch for {rel_path}")
+        
+        # Regular files keep their permission bits, as a full install through
+        # ZipExtractor does, so scripts stay executable.
+        if mode in ("100644", "100755"):
+            os.chmod(target, int(mode, 8) & 0o777)
+        return size
+    
+    def remove_file(self, install_path, rel_path):
+        try:
+            os.remove(os.path.join(install_path, *rel_path.split("/")))
+        except OSError:
+            return
+        
+        # Directories the removed file leaves empty go too; rmdir refuses
+        # anything that still has content.
+        parts = rel_path.split("/")[:-1]
+        while parts:
+            try:
+                os.rmdir(os.path.join(install_path, *parts))
+            except OSError:
+                break
+            parts.pop()
+    
+    def update(self, app_key, install_path, download_url, progress_callback=None, log_callback=None):
+        # The manifest is held from load to save, so a snapshot or a second
+        # update of the same app cannot write a files map in between.
+        with self.manifests.editing(app_key):
+            return self.apply_update(app_key, install_path, download_url, progress_callback, log_callback)
+    
+    def apply_update(self, app_key, install_path, download_url, progress_callback, log_callback):
+        from concurrent.futures import ThreadPoolExecutor
+        
+        manifest = self.manifests.load(app_key)
+        if manifest is None:
+            raise DeltaUnavailable("No install manifest recorded for this app")
+        
+        parsed = self.parse_archive_url(download_url)
+        if not parsed or f"{parsed[0]}/{parsed[1]}" != manifest.get("repo"):
+            raise DeltaUnavailable("Download source changed since the app was installed")
+        
+        owner, repo, ref = parsed
+        commit = self.resolve_commit(owner, repo, ref)
+        if commit == manifest.get("commit"):
+            if log_callback:
+                log_callback(f"Already at {commit[:12]}")
+            return {"commit": commit, "changed": 0, "removed": 0, "bytes": 0}
+        
+        tree, modes = self.fetch_tree(owner, repo, commit)
+        changed, removed = self.plan(manifest, tree, install_path)
+        if log_callback:
+            log_callback(f"{manifest['commit'][:12]} -> {commit[:12]}: {len(changed)} changed, {len(removed)} removed")
+        
+        if len(changed) > self.max_files:
+            raise DeltaUnavailable(f"{len(changed)} files changed, a full download is cheaper")
+        
+        # Blobs land in a staging dir first, so a failed or partial transfer
+        # leaves the installed files untouched.
+        staging_path = f"{install_path}.delta"
+        shutil.rmtree(staging_path, ignore_errors=True)
+        
+        lock = threading.Lock()
+        progress = {"files": 0, "bytes": 0}
+        
+        def fetch(rel_path):
+            target = os.path.join(staging_path, *rel_path.split("/"))
+            size = self.download_blob(owner, repo, commit, rel_path, tree[rel_path], target, modes[rel_path])
+            with lock:
+                progress["files"] += 1
+                progress["bytes"] += size
+                if progress_callback:
+                    progress_callback(progress["files"], len(changed), progress["bytes"])
+        
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="delta") as pool:
+                list(pool.map(fetch, changed))
+            
+            for rel_path in changed:
+                target = os.path.join(install_path, *rel_path.split("/"))
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.replace(os.path.join(staging_path, *rel_path.split("/")), target)
+            
+            for rel_path in removed:
+                self.remove_file(install_path, rel_path)
+        finally:
+            shutil.rmtree(staging_path, ignore_errors=True)
+        
+        files = {rel_path: entry for rel_path, entry in manifest["files"].items() if rel_path in tree}
+        for rel_path in changed:
+            files[rel_path] = {"sha": tree[rel_path]}
+        manifest.update({"ref": ref, "commit": commit, "files": files})
+        self.manifests.save(app_key, manifest)
+        self.manifests.drop_index(app_key)
+        
+        if log_callback:
+            log_callback(f"Delta update applied: {progress['bytes'] / 1024:.1f} KB transferred")
+        
+        return {"commit": commit, "changed": len(changed), "removed": len(removed), "bytes": progress["bytes"]}
@@ -0,0 +1,179 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+
+class DownloadCache:
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_file = self.cache_dir / "index.json"
+        self.max_bytes = max_bytes
+        
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0, "corrupt": 0, "bytes_saved": 0}
+        
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.load()
+    
+    def load(self):
+        if not self.index_file.exists():
+            return
+        
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                loaded = json.load(f)
+        except:
+            return
+        
+        with self.lock:
+            for key, entry in loaded.get("entries", {}).items():
+                if (self.objects_dir / entry.get("object", "")).is_file():
+                    self.entries[key] = entry
+    
+    def save(self):
+        with self.lock:
+            data = {"entries": dict(self.entries)}
+        
+        try:
+            tmp_file = self.index_file.with_name(f"{self.index_file.name}.{threading.get_ident()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.index_file)
+        except Exception as e:
+            print(f"Failed to save download cache index: {e}")
+    
+    def make_key(self, url, version):
+        return hashlib.sha256(f"{url}\n{version}".encode("utf-8")).hexdigest()
+    
+    def hash_file(self, path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def get(self, url, version):
+        if not version:
+            return None
+        
+        key = self.make_key(url, version)
+        with self.lock:
+            entry = self.entries.get(key)
+        
+        if entry is None:
+            with self.lock:
+                self.stats["misses"] += 1
+            return None
+        
+        path = self.objects_dir / entry["object"]
+        try:
+            valid = path.stat().st_size == entry["size"] and self.hash_file(path) == entry["sha256"]
+        except OSError:
+            valid = False
+        
+        if not valid:
+            print(f"Cached archive for {url} failed verification, discarding")
+            self.remove(key)
+            with self.lock:
+                self.stats["corrupt"] += 1
+                self.stats["misses"] += 1
+            return None
+        
+        with self.lock:
+            entry["used_at"] = time.time()
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += entry["size"]
+        self.save()
+        return path
+    
+    def put(self, url, version, source_path):
+        if not version:
+            return Path(source_path)
+        
+        sha256 = self.hash_file(source_path)
+        size = os.path.getsize(source_path)
+        object_name = f"{sha256}{Path(source_path).suffix}"
+        object_path = self.objects_dir / object_name
+        
+        # Identical bytes under different URLs or versions share one object file.
+        if object_path.exists():
+            os.remove(source_path)
+        else:
+            os.replace(source_path, object_path)
+        
+        now = time.time()
+        with self.lock:
+            self.entries[self.make_key(url, version)] = {
+                "url": url,
+                "version": version,
+                "object": object_name,
+                "sha256": sha256,
+                "size": size,
+                "created_at": now,
+                "used_at": now
+            }
+            self.stats["stored"] += 1
+            self.evict(keep=object_name)
+        self.save()
+        return object_path
+    
+    def total_size(self):
+        sizes = {entry["object"]: entry["size"] for entry in self.entries.values()}
+        return sum(sizes.values())
+    
+    def evict(self, keep=None):
+        # Least recently used first; the object just stored is never evicted so
+        # a single archive larger than the cap can still be installed from.
+        for key, entry in sorted(self.entries.items(), key=lambda item: item[1].get("used_at", 0)):
+            if self.total_size() <= self.max_bytes:
+                break
+            if entry["object"] == keep:
+                continue
+            self.remove_locked(key)
+            self.stats["evicted"] += 1
+    
+    def remove_locked(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        if any(other["object"] == entry["object"] for other in self.entries.values()):
+            return
+        try:
+            (self.objects_dir / entry["object"]).unlink()
+        except OSError:
+            pass
+    
+    def remove(self, key):
+        with self.lock:
+            self.remove_locked(key)
+        self.save()
+    
+    def clear(self):
+        with self.lock:
+            for key in list(self.entries):
+                self.remove_locked(key)
+        self.save()
+    
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self.entries)
+            stats["size"] = self.total_size()
+        
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+    
+    def report(self):
+        stats = self.get_stats()
+        return (
+            f"Download cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate'] * 100:.0f}% hit rate), "
+            f"{stats['bytes_saved'] / (1024*1024):.1f} MB saved, "
+            f"{stats['entries']} archives / {stats['size'] / (1024*1024):.1f} MB of "
+            f"{self.max_bytes / (1024*1024):.0f} MB"
+        )
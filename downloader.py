@@ -0,0 +1,256 @@
+import os
+import json
+import time
+import threading
+from pathlib import Path
+
+class DownloadError(Exception):
+    pass
+
+class ChunkedDownloader:
+    def __init__(self, session=None, segments=4, buffer_size=1024 * 1024,
+                 min_segment_size=2 * 1024 * 1024, timeout=30, retries=3, client=None):
+        self.http = session
+        self.client = client
+        self.segments = segments
+        self.buffer_size = buffer_size
+        self.min_segment_size = min_segment_size
+        self.timeout = timeout
+        self.retries = retries
+    
+    @property
+    def session(self):
+        # Sharing the GitHubClient session is resolved on first use, so building
+        # a downloader does not pull requests in at startup.
+        if self.http is None:
+            if self.client is not None:
+                self.http = self.client.session
+            else:
+                import requests
+                self.http = requests.Session()
+        return self.http
+    
+    def probe(self, url):
+        import requests
+        
+        headers = {"Accept-Encoding": "identity"}
+        info = {"url": url, "size": 0, "ranges": False, "etag": None}
+        
+        try:
+            response = self.session.head(url, headers=headers, allow_redirects=True, timeout=self.timeout)
+            if response.status_code == 200:
+                info["url"] = response.url
+                info["size"] = int(response.headers.get("Content-Length", 0) or 0)
+                info["ranges"] = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+                info["etag"] = response.headers.get("ETag")
+                if info["size"]:
+                    return info
+        except requests.RequestException:
+            pass
+        
+        # Some servers ignore HEAD or omit the length there; a one-byte range
+        # request tells us both the total size and whether ranges work.
+        try:
+            headers["Range"] = "bytes=0-0"
+            response = self.session.get(url, headers=headers, stream=True, allow_redirects=True, timeout=self.timeout)
+            response.close()
+            if response.status_code == 206:
+                content_range = response.headers.get("Content-Range", "")
+                if "/" in content_range and not content_range.endswith("/*"):
+                    info["size"] = int(content_range.rsplit("/", 1)[1])
+                    info["ranges"] = True
+                info["url"] = response.url
+                info["etag"] = response.headers.get("ETag", info["etag"])
+        except (requests.RequestException, ValueError):
+            pass
+        
+        return info
+    
+    def download(self, url, dest, progress_callback=None, log_callback=None):
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        part_path = dest.with_name(dest.name + ".part")
+        state_path = dest.with_name(dest.name + ".part.json")
+        
+        info = self.probe(url)
+        if log_callback and info["size"]:
+            log_callback(f"Total size: {info['size'] / (1024*1024):.2f} MB"
+                         f"{' (range requests supported)' if info['ranges'] else ''}")
+        
+        use_segments = (
+            info["ranges"]
+            and self.segments > 1
+            and info["size"] >= self.min_segment_size * 2
+        )
+        
+        if use_segments:
+            self.download_segmented(info, part_path, state_path, progress_callback, log_callback)
+        else:
+            self.download_stream(info, part_path, state_path, progress_callback, log_callback)
+        
+        actual_size = part_path.stat().st_size
+        if info["size"] and actual_size != info["size"]:
+            raise DownloadError(f"Size mismatch: expected {info['size']} bytes, got {actual_size}")
+        
+        os.replace(part_path, dest)
+        if state_path.exists():
+            state_path.unlink()
+        
+        return dest
+    
+    def load_state(self, state_path, info):
+        if not state_path.exists():
+            return None
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except:
+            return None
+        
+        if state.get("size") != info["size"] or state.get("etag") != info["etag"]:
+            return None
+        return state
+    
+    def save_state(self, state_path, state):
+        tmp_path = state_path.with_name(state_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, state_path)
+    
+    def download_stream(self, info, part_path, state_path, progress_callback, log_callback):
+        import requests
+        
+        headers = {"Accept-Encoding": "identity"}
+        offset = 0
+        
+        state = self.load_state(state_path, info)
+        if state and state.get("mode") == "stream" and info["ranges"] and part_path.exists():
+            offset = part_path.stat().st_size
+            if offset and offset < info["size"]:
+                headers["Range"] = f"bytes={offset}-"
+                if log_callback:
+                    log_callback(f"Resuming download at {offset / (1024*1024):.1f} MB")
+            else:
+                offset = 0
+        
+        self.save_state(state_path, {"mode": "stream", "size": info["size"], "etag": info["etag"]})
+        
+        for attempt in range(self.retries + 1):
+            try:
+                response = self.session.get(info["url"], headers=headers, stream=True, timeout=self.timeout)
+                if response.status_code == 206 and "Range" in headers:
+                    mode = "ab" if offset else "wb"
+                elif response.status_code == 200:
+                    mode = "wb"
+                    offset = 0
+                else:
+                    raise DownloadError(f"Failed to download. HTTP {response.status_code}")
+                
+                total = info["size"] or int(response.headers.get("Content-Length", 0) or 0) + offset
+                downloaded = offset
+                
+                with open(part_path, mode, buffering=self.buffer_size) as f:
+                    for chunk in response.iter_content(chunk_size=self.buffer_size):
+                        if chunk:
+                            f.write(chunk)
+                            downloaded += len(chunk)
+                            if progress_callback:
+                                progress_callback(downloaded, total)
+                
+                if not info["size"]:
+                    info["size"] = total if response.headers.get("Content-Length") else 0
+                return
+            except requests.RequestException as e:
+                if attempt >= self.retries:
+                    raise
+                # Without range support the only way on is from the start.
+                if info["ranges"]:
+                    offset = part_path.stat().st_size if part_path.exists() else 0
+                    headers["Range"] = f"bytes={offset}-"
+                    if log_callback:
+                        log_callback(f"Connection lost ({e}), resuming at {offset / (1024*1024):.1f} MB")
+                else:
+                    offset = 0
+                    headers.pop("Range", None)
+                    if log_callback:
+                        log_callback(f"Connection lost ({e}), restarting download")
+                time.sleep(min(2 ** attempt, 8))
+    
+    def plan_segments(self, size):
+        count = max(1, min(self.segments, size // self.min_segment_size))
+        step = size // count
+        segments = []
+        for i in range(count):
+            start = i * step
+            end = size - 1 if i == count - 1 else (i + 1) * step - 1
+            segments.append({"start": start, "end": end, "done": 0})
+        return segments
+    
+    def download_segmented(self, info, part_path, state_path, progress_callback, log_callback):
+        import requests
+        from concurrent.futures import ThreadPoolExecutor
+        
+        state = self.load_state(state_path, info)
+        if state and state.get("mode") == "segments" and part_path.exists():
+            segments = state["segments"]
+            if log_callback:
+                resumed = sum(segment["done"] for segment in segments)
+                log_callback(f"Resuming download at {resumed / (1024*1024):.1f} MB")
+        else:
+            segments = self.plan_segments(info["size"])
+            with open(part_path, "wb") as f:
+                f.truncate(info["size"])
+        
+        state = {"mode": "segments", "size": info["size"], "etag": info["etag"], "segments": segments}
+        self.save_state(state_path, state)
+        
+        if log_callback:
+            log_callback(f"Downloading in {len(segments)} parallel segments")
+        
+        lock = threading.Lock()
+        last_save = [time.monotonic()]
+        
+        def report():
+            downloaded = sum(segment["done"] for segment in segments)
+            if progress_callback:
+                progress_callback(downloaded, info["size"])
+            now = time.monotonic()
+            if now - last_save[0] >= 1.0:
+                last_save[0] = now
+                self.save_state(state_path, state)
+        
+        def fetch(segment):
+            for attempt in range(self.retries + 1):
+                position = segment["start"] + segment["done"]
+                if position > segment["end"]:
+                    return
+                try:
+                    headers = {"Accept-Encoding": "identity", "Range": f"bytes={position}-{segment['end']}"}
+                    response = self.session.get(info["url"], headers=headers, stream=True, timeout=self.timeout)
+                    if response.status_code != 206:
+                        raise DownloadError(f"Range request rejected. HTTP {response.status_code}")
+                    
+                    with open(part_path, "r+b") as f:
+                        f.seek(position)
+                        for chunk in response.iter_content(chunk_size=self.buffer_size):
+                            if chunk:
+                                f.write(chunk)
+                                with lock:
+                                    segment["done"] += len(chunk)
+                                    report()
+                    return
+                except requests.RequestException as e:
+                    if attempt >= self.retries:
+                        raise
+                    if log_callback:
+                        log_callback(f"Segment at {position} interrupted ({e}), retrying")
+                    time.sleep(min(2 ** attempt, 8))
+        
+        with ThreadPoolExecutor(max_workers=len(segments), thread_name_prefix="download") as pool:
+            futures = [pool.submit(fetch, segment) for segment in segments]
+            try:
+                for future in futures:
+                    future.result()
+            finally:
+                with lock:
+                    self.save_state(state_path, state)
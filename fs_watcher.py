@@ -0,0 +1,125 @@
+import os
+import time
+import threading
+import importlib.util
+
+# watchdog is imported in start(), which runs after the first paint; only its
+# presence is checked at import time.
+WATCHDOG_AVAILABLE = importlib.util.find_spec("watchdog") is not None
+
+IGNORED_SUFFIXES = (".staging", ".old", ".delta")
+
+class InstallWatcher:
+    def __init__(self, install_dir, on_changes, debounce=0.5):
+        self.install_dir = os.path.realpath(install_dir)
+        self.on_changes = on_changes
+        self.debounce = debounce
+        
+        self.observer = None
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.timer = None
+        self.first_pending = 0.0
+    
+    @property
+    def running(self):
+        return self.observer is not None and self.observer.is_alive()
+    
+    def start(self):
+        if not WATCHDOG_AVAILABLE:
+            print("watchdog is not installed, install_dir changes need a manual refresh")
+            return False
+        
+        try:
+            from watchdog.observers import Observer
+            
+            self.observer = Observer()
+            self.observer.daemon = True
+            self.observer.schedule(self, self.install_dir, recursive=True)
+            self.observer.start()
+            return True
+        except Exception as e:
+            print(f"Failed to start install watcher: {e}")
+            self.observer = None
+            return False
+    
+    def stop(self):
+        with self.lock:
+            if self.timer:
+                self.timer.cancel()
+                self.timer = None
+        
+        if self.observer:
+            try:
+                self.observer.stop()
+                self.observer.join(timeout=2)
+            except Exception:
+                pass
+            self.observer = None
+    
+    def split_path(self, path):
+        rel_path = os.path.relpath(os.path.realpath(path), self.install_dir)
+        if rel_path == "." or rel_path.startswith(".."):
+            return None, None
+        
+        parts = rel_path.replace(os.sep, "/").split("/", 1)
+        if parts[0].endswith(IGNORED_SUFFIXES):
+            return None, None
+        return parts[0], parts[1] if len(parts) > 1 else ""
+    
+    def add_change(self, app_key, change):
+        if app_key is None:
+            return
+        with self.lock:
+            if not self.pending:
+                self.first_pending = time.monotonic()
+            self.pending.setdefault(app_key, []).append(change)
+        self.schedule_flush()
+    
+    def dispatch(self, event):
+        # The observer only needs dispatch() from its handlers.
+        self.on_any_event(event)
+    
+    def on_any_event(self, event):
+        if event.event_type not in ("created", "deleted", "moved", "modified"):
+            return
+        if event.event_type == "modified" and event.is_directory:
+            return
+        
+        app_key, rel_path = self.split_path(event.src_path)
+        
+        if event.event_type == "moved":
+            dest_key, dest_rel = self.split_path(event.dest_path)
+            if app_key == dest_key:
+                self.add_change(app_key, ("moved", rel_path, dest_rel))
+            else:
+                self.add_change(app_key, ("deleted", rel_path, None))
+                self.add_change(dest_key, ("created", dest_rel, None))
+        else:
+            self.add_change(app_key, (event.event_type, rel_path, None))
+    
+    def schedule_flush(self):
+        # Installs and copies produce bursts of thousands of events; restarting
+        # the timer on each one collapses a burst into a single flush, capped
+        # so a steady stream of events still gets flushed now and then.
+        with self.lock:
+            if self.timer:
+                if time.monotonic() - self.first_pending >= self.debounce * 10:
+                    return
+                self.timer.cancel()
+            self.timer = threading.Timer(self.debounce, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+    
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.timer = None
+        
+        if not pending:
+            return
+        
+        try:
+            self.on_changes(pending)
+        except Exception as e:
+            print(f"Install watcher callback failed: {e}")
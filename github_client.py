@@ -0,0 +1,164 @@
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+
+from config import Config
+
+class CachedResponse:
+    def __init__(self, status_code, content, headers=None, url="", from_cache=False):
+        from requests.structures import CaseInsensitiveDict
+        
+        self.status_code = status_code
+        self.content = content or b""
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.url = url
+        self.from_cache = from_cache
+    
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+    
+    def json(self):
+        return json.loads(self.content.decode("utf-8"))
+
+class GitHubClient:
+    def __init__(self, cache_dir, timeout=10):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "not_modified": 0, "stored": 0, "offline_hits": 0}
+        self.http = None
+    
+    @property
+    def session(self):
+        # requests costs more to import than the rest of startup together, so
+        # the session is only built once something actually goes to the network.
+        with self.lock:
+            if self.http is None:
+                import requests
+                self.http = requests.Session()
+                self.http.headers.update({"User-Agent": "WMR-Group-Apps"})
+            return self.http
+    
+    def build_url(self, url, params=None):
+        if not params:
+            return url
+        import requests
+        return requests.Request("GET", url, params=params).prepare().url
+    
+    def entry_paths(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+    
+    def load_entry(self, url):
+        meta_path, body_path = self.entry_paths(url)
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                meta["content"] = f.read()
+            return meta
+        except:
+            return None
+    
+    def store_entry(self, url, response):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        
+        meta_path, body_path = self.entry_paths(url)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_type": response.headers.get("Content-Type", "")
+        }
+        
+        try:
+            tmp_body = body_path.with_name(f"{body_path.name}.{threading.get_ident()}.tmp")
+            with open(tmp_body, "wb") as f:
+                f.write(response.content)
+            os.replace(tmp_body, body_path)
+            
+            tmp_meta = meta_path.with_name(f"{meta_path.name}.{threading.get_ident()}.tmp")
+            with open(tmp_meta, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp_meta, meta_path)
+            
+            with self.lock:
+                self.stats["stored"] += 1
+        except Exception as e:
+            print(f"HTTP cache write failed for {url}: {e}")
+    
+    def cached_response(self, url, entry):
+        headers = {"Content-Type": entry.get("content_type", "")}
+        if entry.get("etag"):
+            headers["ETag"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["Last-Modified"] = entry["last_modified"]
+        return CachedResponse(200, entry["content"], headers, url, from_cache=True)
+    
+    def get(self, url, params=None, timeout=None):
+        import requests
+        
+        url = self.build_url(url, params)
+        entry = self.load_entry(url)
+        
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        
+        with self.lock:
+            self.stats["requests"] += 1
+        
+        try:
+            response = self.session.get(url, headers=headers, timeout=timeout or self.timeout)
+        except requests.RequestException:
+            if entry:
+                with self.lock:
+                    self.stats["offline_hits"] += 1
+                return self.cached_response(url, entry)
+            raise
+        
+        if response.status_code == 304 and entry:
+            with self.lock:
+                self.stats["not_modified"] += 1
+            return self.cached_response(url, entry)
+        
+        if response.status_code == 200:
+            self.store_entry(url, response)
+        
+        return CachedResponse(response.status_code, response.content, response.headers, url)
+    
+    def get_stats(self):
+        with self.lock:
+            return dict(self.stats)
+    
+    def clear(self):
+        for path in self.cache_dir.glob("*"):
+            try:
+                path.unlink()
+            except:
+                pass
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client(config=None):
+    global _client
+    with _client_lock:
+        if _client is None:
+            config = config or Config()
+            _client = GitHubClient(config.get_data_path() / "http_cache")
+        return _client
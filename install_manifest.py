@@ -0,0 +1,200 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+
+from app_scanner import scan_tree, file_type
+
+
+def git_blob_sha(path):
+    # Same id git uses for a blob, so local files compare directly against
+    # the sha values returned by the GitHub tree API.
+    size = os.path.getsize(path)
+    digest = hashlib.sha1(f"blob {size}\0".encode("ascii"))
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class InstallManifest:
+    def __init__(self, manifest_dir):
+        self.manifest_dir = Path(manifest_dir)
+        self.manifest_dir.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.app_locks = {}
+        self.indexes = {}
+    
+    def app_lock(self, app_key, kind):
+        # Manifests and indexes have their own per-app locks, so a delta update
+        # holding its manifest never waits on a scan, or the other way round.
+        with self.lock:
+            return self.app_locks.setdefault((app_key, kind), threading.RLock())
+    
+    def editing(self, app_key):
+        return self.app_lock(app_key, "manifest")
+    
+    def manifest_path(self, app_key):
+        return self.manifest_dir / f"{app_key}.json"
+    
+    def index_path(self, app_key):
+        return self.manifest_dir / f"{app_key}.index.json"
+    
+    def read_json(self, path):
+        if not path.exists():
+            return None
+        
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except:
+            return None
+    
+    def write_json(self, path, data):
+        try:
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Failed to save {path.name}: {e}")
+    
+    def load(self, app_key):
+        manifest = self.load_raw(app_key)
+        if manifest is None or not manifest.get("repo") or not isinstance(manifest.get("files"), dict):
+            return None
+        return manifest
+    
+    def load_raw(self, app_key):
+        return self.read_json(self.manifest_path(app_key))
+    
+    def save(self, app_key, manifest):
+        # Older manifests carried the index inline; it lives in its own file now.
+        manifest.pop("index", None)
+        manifest["updated_at"] = time.time()
+        
+        with self.editing(app_key):
+            self.write_json(self.manifest_path(app_key), manifest)
+    
+    def delete(self, app_key):
+        with self.editing(app_key), self.app_lock(app_key, "index"):
+            self.indexes.pop(app_key, None)
+            for path in (self.manifest_path(app_key), self.index_path(app_key)):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+    
+    def build(self, install_path, tree, repo, ref, commit):
+        # Only files that match the upstream tree are recorded; launchers and
+        # anything the user added stay out of the manifest and are never
+        # touched by a delta update.
+        files = {}
+        for rel_path, sha in tree.items():
+            local_path = os.path.join(install_path, *rel_path.split("/"))
+            try:
+                if git_blob_sha(local_path) == sha:
+                    files[rel_path] = {"sha": sha}
+            except OSError:
+                continue
+        
+        return {
+            "repo": repo,
+            "ref": ref,
+            "commit": commit,
+            "files": files
+        }
+    
+    def scan(self, install_path):
+        return scan_tree(install_path)
+    
+    def load_index(self, app_key):
+        index = self.indexes.get(app_key)
+        if index is None:
+            index = self.read_json(self.index_path(app_key))
+            if index is not None:
+                self.indexes[app_key] = index
+        return index
+    
+    def save_index(self, app_key, index):
+        self.indexes[app_key] = index
+        self.write_json(self.index_path(app_key), index)
+    
+    def get_index(self, app_key, install_path):
+        try:
+            root_mtime = os.stat(install_path).st_mtime
+        except OSError:
+            return None
+        
+        # Only the top-level directory mtime is checked: it changes whenever
+        # entries are added to or removed from the install root, which is what
+        # install, uninstall and manual copies do. Installs that rewrite nested
+        # files drop the index explicitly instead.
+        with self.app_lock(app_key, "index"):
+            index = self.load_index(app_key)
+            if index and index.get("root_mtime") == root_mtime:
+                return index["entries"]
+            
+            entries = self.scan(install_path)
+            self.save_index(app_key, {"root_mtime": root_mtime, "entries": entries})
+            return entries
+    
+    def patch_index(self, app_key, install_path, changes):
+        with self.app_lock(app_key, "index"):
+            index = self.load_index(app_key)
+            if not index:
+                return False
+            
+            # Callers may still be reading the entries they got from
+            # get_index, so the patch goes into a copy.
+            entries = dict(index["entries"])
+            
+            def remove_tree(rel_path):
+                entries.pop(rel_path, None)
+                prefix = rel_path + "/"
+                for key in [key for key in entries if key.startswith(prefix)]:
+                    del entries[key]
+            
+            def add_path(rel_path):
+                full_path = os.path.join(install_path, *rel_path.split("/"))
+                if os.path.isdir(full_path):
+                    entries[rel_path] = {"type": "dir", "size": 0, "mtime": 0}
+                    for sub_path, entry in self.scan(full_path).items():
+                        entries[f"{rel_path}/{sub_path}"] = entry
+                else:
+                    try:
+                        stat = os.stat(full_path)
+                    except OSError:
+                        return
+                    entries[rel_path] = {
+                        "type": file_type(rel_path),
+                        "size": stat.st_size,
+                        "mtime": stat.st_mtime
+                    }
+            
+            for kind, rel_path, dest_path in changes:
+                if kind == "deleted":
+                    remove_tree(rel_path)
+                elif kind == "moved":
+                    remove_tree(rel_path)
+                    if dest_path:
+                        add_path(dest_path)
+                else:
+                    add_path(rel_path)
+            
+            try:
+                root_mtime = os.stat(install_path).st_mtime
+            except OSError:
+                self.drop_index(app_key)
+                return True
+            self.save_index(app_key, {"root_mtime": root_mtime, "entries": entries})
+            return True
+    
+    def drop_index(self, app_key):
+        with self.app_lock(app_key, "index"):
+            self.indexes.pop(app_key, None)
+            try:
+                self.index_path(app_key).unlink()
+            except OSError:
+                pass
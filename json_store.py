@@ -0,0 +1,108 @@
+import os
+import json
+import atexit
+import weakref
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+def atomic_write_json(path, data, indent=None, fsync=True):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            if isinstance(data, str):
+                f.write(data)
+            else:
+                json.dump(data, f, indent=indent, ensure_ascii=False)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+# Live writers are tracked weakly, so a writer whose owner is gone does not
+# stay alive just to be flushed at exit.
+_writers = weakref.WeakSet()
+_writers_lock = threading.Lock()
+
+def flush_all():
+    with _writers_lock:
+        writers = list(_writers)
+    for writer in writers:
+        writer.flush()
+
+atexit.register(flush_all)
+
+class CoalescingWriter:
+    def __init__(self, write, delay=1.0):
+        self.write = write
+        self.delay = delay
+        
+        self.lock = threading.RLock()
+        self.write_lock = threading.Lock()
+        self.local = threading.local()
+        self.dirty = False
+        self.timer = None
+        self.writes = 0
+        
+        with _writers_lock:
+            _writers.add(self)
+    
+    @property
+    def depth(self):
+        # Transactions are per thread: a batch on one thread only holds back
+        # its own writes, and other threads keep their debounced flushes.
+        return getattr(self.local, "depth", 0)
+    
+    def mark_dirty(self):
+        with self.lock:
+            self.dirty = True
+            if self.depth == 0:
+                self.schedule()
+    
+    def schedule(self):
+        if self.timer is not None:
+            return
+        self.timer = threading.Timer(self.delay, self.flush)
+        self.timer.daemon = True
+        self.timer.start()
+    
+    @contextmanager
+    def transaction(self):
+        self.local.depth = self.depth + 1
+        try:
+            yield
+        finally:
+            self.local.depth -= 1
+            with self.lock:
+                flush_now = self.local.depth == 0 and self.dirty
+            if flush_now:
+                self.flush()
+    
+    def flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if not self.dirty:
+                return
+            self.dirty = False
+        
+        # The write runs outside self.lock: it usually takes the owner's own
+        # lock to snapshot its data, and owners mark dirty while holding it.
+        with self.write_lock:
+            try:
+                self.write()
+                self.writes += 1
+            except Exception as e:
+                with self.lock:
+                    self.dirty = True
+                print(f"Deferred write failed: {e}")
@@ -4,29 +4,20 @@ from config import Config
 import locales
 
 class LanguageSelector:
-    def __init__(self, callback):
+    def __init__(self, shell, callback, config=None):
+        self.shell = shell
+        self.root = shell.root
         self.callback = callback
-        self.config = Config()
-        
-        self.root = tk.Tk()
-        self.root.title("WMR Group Apps - Language Selection")
-        self.root.geometry("500x350")
-        self.root.configure(bg="#000000")
-        self.center_window()
+        self.config = config or Config()
         
+        self.shell.set_window("WMR Group Apps - Language Selection", (500, 350))
         self.setup_ui()
-    
-    def center_window(self):
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f"{width}x{height}+{x}+{y}")
+        self.shell.show(self)
     
     def setup_ui(self):
-        main_frame = tk.Frame(self.root, bg="#000000")
-        main_frame.pack(fill="both", expand=True, padx=50, pady=50)
+        self.main_frame = tk.Frame(self.root, bg="#000000")
+        self.main_frame.pack(fill="both", expand=True, padx=50, pady=50)
+        main_frame = self.main_frame
         
         title_label = tk.Label(
             main_frame,
@@ -90,8 +81,7 @@ class LanguageSelector:
     
     def select_language(self, lang):
         self.config.set("app.language", lang)
-        self.root.destroy()
         self.callback()
     
-    def run(self):
-        self.root.mainloop()
\ No newline at end of file
+    def destroy(self):
+        self.main_frame.destroy()
\ No newline at end of file
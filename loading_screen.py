@@ -1,68 +1,44 @@
+import threading
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
-import os
+from assets import AssetCache, BASE_DIR, load_logo
+from app_shell import when_painted
+import locales
 
 class LoadingScreen:
-    def __init__(self):
-        self.root = tk.Tk()
-        self.root.title("WMR Group Apps")
-        self.root.geometry("600x400")
-        self.root.configure(bg="#000000")
-        self.center_window()
-        
-        self.logo_path = None
+    def __init__(self, shell, config=None):
+        self.shell = shell
+        self.config = config
+        lang = config.get_language() if config else "en"
+        self.tr = locales.LANGUAGES.get(lang, locales.LANGUAGES["en"])
+        
+        self.root = shell.root
+        self.shell.set_window("WMR Group Apps", (600, 400))
+        
+        self.logo_image = None
         self.running = True
-        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         self.setup_ui()
-    
-    def on_close(self):
-        self.running = False
-        if hasattr(self, 'progress_bar'):
-            try:
-                self.progress_bar.stop()
-            except:
-                pass
-        self.root.destroy()
-    
-    def center_window(self):
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f"{width}x{height}+{x}+{y}")
+        self.shell.show(self)
     
     def setup_ui(self):
-        main_frame = tk.Frame(self.root, bg="#000000")
-        main_frame.pack(fill="both", expand=True, padx=50, pady=50)
+        self.main_frame = tk.Frame(self.root, bg="#000000")
+        self.main_frame.pack(fill="both", expand=True, padx=50, pady=50)
+        main_frame = self.main_frame
         
-        logo_frame = tk.Frame(main_frame, bg="#000000")
+        # The logo slot keeps its size while the scaled logo is prepared in
+        # the background, so the layout does not jump when it arrives.
+        logo_frame = tk.Frame(main_frame, bg="#000000", width=200, height=200)
+        logo_frame.pack_propagate(False)
         logo_frame.pack(expand=True)
         
-        logo_paths = ["Logo.png", "logo.png", "icon.png", "icon.ico"]
-        for path in logo_paths:
-            if os.path.exists(path):
-                self.logo_path = path
-                break
-        
-        if self.logo_path:
-            try:
-                img = Image.open(self.logo_path)
-                img = img.resize((200, 200), Image.Resampling.LANCZOS)
-                self.logo_image = ImageTk.PhotoImage(img)
-                
-                logo_label = tk.Label(
-                    logo_frame,
-                    image=self.logo_image,
-                    bg="#000000"
-                )
-                logo_label.pack()
-            except:
-                self.create_text_logo(logo_frame)
-        else:
-            self.create_text_logo(logo_frame)
+        data_dir = self.config.get_data_path() if self.config else BASE_DIR / "data"
+        load_logo(
+            self.root,
+            AssetCache(data_dir / "assets"),
+            (200, 200),
+            lambda photo: self.show_logo(logo_frame, photo)
+        )
         
         title_label = tk.Label(
             main_frame,
@@ -82,14 +58,14 @@ class LoadingScreen:
         )
         version_label.pack(pady=5)
         
-        loading_label = tk.Label(
+        self.loading_label = tk.Label(
             main_frame,
-            text="Loading...",
+            text=self.tr["loading"],
             font=("Lucida Console", 14),
             bg="#000000",
             fg="#00FF00"
         )
-        loading_label.pack(pady=20)
+        self.loading_label.pack(pady=20)
         
         self.progress_bar = ttk.Progressbar(
             main_frame,
@@ -102,6 +78,22 @@ class LoadingScreen:
         if self.running:
             self.progress_bar.start(10)
     
+    def show_logo(self, parent, photo):
+        if not self.running:
+            return
+        
+        if photo is None:
+            self.create_text_logo(parent)
+            return
+        
+        self.logo_image = photo
+        logo_label = tk.Label(
+            parent,
+            image=self.logo_image,
+            bg="#000000"
+        )
+        logo_label.pack(expand=True)
+    
     def create_text_logo(self, parent):
         logo_text = tk.Label(
             parent,
@@ -121,14 +113,78 @@ class LoadingScreen:
         )
         subtitle_label.pack()
     
-    def close(self):
-        self.running = False
-        if hasattr(self, 'progress_bar'):
-            try:
-                self.progress_bar.stop()
-            except:
-                pass
-        self.root.destroy()
+    def when_painted(self, callback):
+        when_painted(self.root, callback)
     
-    def run(self):
-        self.root.mainloop()
\ No newline at end of file
+    def run_stages(self, stages, on_finished, startup=None, poll_interval=15):
+        # stages is a list of (name, func, in_worker). Worker stages run off
+        # the Tk thread so the splash keeps painting; the rest need Tk and run
+        # here, after the splash has drawn their label. A stage that returns a
+        # list of stages has them run right after it.
+        stages = list(stages)
+        self.progress_bar.stop()
+        self.progress_bar.config(mode="determinate", value=0)
+        
+        def start(index):
+            if not self.running:
+                return
+            if index == len(stages):
+                self.progress_bar["value"] = 100
+                on_finished()
+                return
+            
+            name, func, in_worker = stages[index]
+            self.loading_label.config(text=self.tr.get(name, name))
+            self.progress_bar["value"] = index * 100 / len(stages)
+            
+            if in_worker:
+                result = {}
+                
+                def worker():
+                    try:
+                        result["value"] = func()
+                        result["error"] = None
+                    except Exception as e:
+                        result["error"] = e
+                
+                threading.Thread(target=worker, name=f"startup-{name}", daemon=True).start()
+                poll(index, result)
+            else:
+                self.root.update_idletasks()
+                try:
+                    finish(index, None, func())
+                except Exception as e:
+                    finish(index, e)
+        
+        def poll(index, result):
+            if not self.running:
+                return
+            if "error" not in result:
+                self.root.after(poll_interval, lambda: poll(index, result))
+                return
+            finish(index, result["error"], result.get("value"))
+        
+        def finish(index, error, value=None):
+            name = stages[index][0]
+            if error is not None:
+                self.show_error(name, error)
+                return
+            if startup:
+                startup.mark(name)
+            if isinstance(value, list):
+                stages[index + 1:index + 1] = value
+            self.root.after_idle(lambda: start(index + 1))
+        
+        start(0)
+    
+    def show_error(self, name, error):
+        print(f"Startup stage {name} failed: {error}")
+        self.loading_label.config(text=f"{self.tr['startup_failed']}: {error}", fg="#FF4444", wraplength=480)
+    
+    def destroy(self):
+        self.running = False
+        try:
+            self.progress_bar.stop()
+        except:
+            pass
+        self.main_frame.destroy()
\ No newline at end of file
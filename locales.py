@@ -108,7 +108,13 @@ LANGUAGES = {
         "view": "View",
         "tools": "Tools",
         "help": "Help",
-        "exit": "Exit"
+        "exit": "Exit",
+        "loading_modules": "Loading modules...",
+        "loading_config": "Preparing folders...",
+        "loading_catalog": "Loading app catalog...",
+        "loading_programs": "Loading program info...",
+        "building_ui": "Building interface...",
+        "startup_failed": "Startup failed"
     },
     "ru": {
         "app_title": "WMR Group Apps",
@@ -219,6 +225,12 @@ LANGUAGES = {
         "view": "Вид",
         "tools": "Инструменты",
         "help": "Помощь",
-        "exit": "Выход"
+        "exit": "Выход",
+        "loading_modules": "Загрузка модулей...",
+        "loading_config": "Подготовка папок...",
+        "loading_catalog": "Загрузка каталога приложений...",
+        "loading_programs": "Загрузка информации о программах...",
+        "building_ui": "Построение интерфейса...",
+        "startup_failed": "Ошибка запуска"
     }
 }
\ No newline at end of file
@@ -4,32 +4,53 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from startup_timer import StartupTimer
+
+startup = StartupTimer()
+
+from app_shell import AppShell
 from loading_screen import LoadingScreen
 from language_selector import LanguageSelector
-from app_store import main as app_store_main
 from config import Config
 
-def start_app():
-    config = Config()
+startup.mark("base imports")
+
+def start_app(shell, config):
+    loading_screen = LoadingScreen(shell, config)
+    startup.mark("splash")
+    
+    bootstrap = {}
+    
+    def load_modules():
+        # The app modules are imported in a worker once the splash is on
+        # screen. The store's own stages then load the catalog and program
+        # info in a worker and build the main window on the shell's root.
+        from app_store import StoreBootstrap
+        bootstrap["store"] = StoreBootstrap(config, startup)
+        return bootstrap["store"].stages(shell.root)
     
-    loading_screen = LoadingScreen()
+    def on_finished():
+        app = bootstrap["store"].app
+        shell.on_shutdown(app.shutdown)
+        shell.show(app)
+        shell.center(*app.window_size)
     
-    def close_loading_and_start():
-        loading_screen.close()
-        app_store_main()
+    def start_stages():
+        loading_screen.run_stages([("loading_modules", load_modules, True)], on_finished, startup)
     
-    loading_screen.root.after(2000, close_loading_and_start)
-    loading_screen.run()
+    loading_screen.when_painted(start_stages)
 
 def main():
     config = Config()
+    startup.mark("config")
     language = config.get("app.language")
     
+    shell = AppShell()
     if not language:
-        selector = LanguageSelector(start_app)
-        selector.run()
+        LanguageSelector(shell, lambda: start_app(shell, config), config)
     else:
-        start_app()
+        start_app(shell, config)
+    shell.run()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,253 @@
+import re
+import hashlib
+import threading
+import webbrowser
+import tkinter as tk
+import tkinter.font as tkfont
+from collections import OrderedDict
+
+from task_scheduler import PRIORITY_UI
+
+INLINE_PATTERN = re.compile(
+    r"(`[^`\n]+`"
+    r"|\*\*[^*\n]+\*\*|__[^_\n]+__"
+    r"|\*[^*\s][^*\n]*\*|(?<!\w)_[^_\s][^_\n]*_(?!\w)"
+    r"|\[[^\]\n]+\]\([^)\s]+\))"
+)
+HEADING_PATTERN = re.compile(r"(#{1,6})\s+(.*)")
+LIST_PATTERN = re.compile(r"(\s*)([-*+]|\d+[.)])\s+(.*)")
+RULE_PATTERN = re.compile(r"(-{3,}|\*{3,}|_{3,})")
+UNDERLINE_PATTERN = re.compile(r"(={3,}|-{3,})")
+LINK_PATTERN = re.compile(r"\[([^\]\n]+)\]\(([^)\s]+)\)")
+
+def parse_inline(text, tags, runs, links):
+    pos = 0
+    for match in INLINE_PATTERN.finditer(text):
+        if match.start() > pos:
+            runs.append((text[pos:match.start()], tags))
+        
+        token = match.group(0)
+        if token.startswith("`"):
+            runs.append((token[1:-1], tags + ("code",)))
+        elif token.startswith(("**", "__")):
+            runs.append((token[2:-2], tags + ("bold",)))
+        elif token.startswith("["):
+            link = LINK_PATTERN.match(token)
+            links.append(link.group(2))
+            runs.append((link.group(1), tags + ("link", f"link{len(links) - 1}")))
+        else:
+            runs.append((token[1:-1], tags + ("italic",)))
+        pos = match.end()
+    
+    if pos < len(text):
+        runs.append((text[pos:], tags))
+
+def parse_markdown(text):
+    runs = []
+    links = []
+    in_code = False
+    paragraph_start = None
+    
+    for line in text.replace("\r\n", "\n").split("\n"):
+        stripped = line.strip()
+        
+        if stripped.startswith("```"):
+            in_code = not in_code
+            continue
+        if in_code:
+            runs.append((line + "\n", ("code_block",)))
+            continue
+        
+        heading = HEADING_PATTERN.fullmatch(stripped)
+        list_item = LIST_PATTERN.fullmatch(line)
+        start = len(runs)
+        
+        if paragraph_start is not None and UNDERLINE_PATTERN.fullmatch(stripped):
+            # "Title" over a line of === or --- is a heading, as in changelog.txt.
+            tag = "h1" if stripped.startswith("=") else "h2"
+            runs[paragraph_start:] = [(chunk, (tag,) + tags) for chunk, tags in runs[paragraph_start:]]
+            paragraph_start = None
+            continue
+        
+        if heading:
+            tag = f"h{min(len(heading.group(1)), 3)}"
+            parse_inline(heading.group(2).rstrip("#").strip(), (tag,), runs, links)
+            runs.append(("\n", (tag,)))
+        elif RULE_PATTERN.fullmatch(stripped):
+            runs.append(("─" * 40 + "\n", ("rule",)))
+        elif list_item:
+            tag = f"list{min(len(list_item.group(1).expandtabs(4)) // 2, 2)}"
+            marker = list_item.group(2)
+            runs.append(("• " if marker in "-*+" else marker + " ", (tag,)))
+            parse_inline(list_item.group(3), (tag,), runs, links)
+            runs.append(("\n", (tag,)))
+        elif stripped.startswith(">"):
+            parse_inline(stripped.lstrip(">").strip(), ("quote",), runs, links)
+            runs.append(("\n", ("quote",)))
+        else:
+            parse_inline(line, (), runs, links)
+            runs.append(("\n", ()))
+            if stripped:
+                paragraph_start = start
+                continue
+        paragraph_start = None
+    
+    # Adjacent runs with the same tags become one insert.
+    merged = []
+    for chunk, tags in runs:
+        if merged and merged[-1][1] == tags:
+            merged[-1] = (merged[-1][0] + chunk, tags)
+        else:
+            merged.append((chunk, tags))
+    
+    while merged and not merged[-1][0].rstrip("\n"):
+        merged.pop()
+    if merged:
+        merged[-1] = (merged[-1][0].rstrip("\n"), merged[-1][1])
+    
+    lines = sum(chunk.count("\n") for chunk, tags in merged) + 1
+    return {"runs": merged, "links": links, "lines": lines}
+
+class MarkdownCache:
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+    
+    def key(self, text):
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+    
+    def lookup(self, text, key=None):
+        key = key or self.key(text)
+        with self.lock:
+            parsed = self.entries.get(key)
+            if parsed is not None:
+                self.entries.move_to_end(key)
+            return parsed
+    
+    def get(self, text):
+        key = self.key(text)
+        parsed = self.lookup(text, key)
+        if parsed is not None:
+            return parsed
+        
+        parsed = parse_markdown(text)
+        with self.lock:
+            self.entries[key] = parsed
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return parsed
+
+_cache = MarkdownCache()
+
+def configure_tags(widget, links):
+    font = tkfont.Font(font=widget.cget("font")).actual()
+    family = font["family"]
+    size = abs(font["size"]) or 9
+    
+    widget.tag_configure("h1", font=(family, size + 6, "bold"), foreground="#FFFFFF", spacing1=8, spacing3=4)
+    widget.tag_configure("h2", font=(family, size + 4, "bold"), foreground="#FFFFFF", spacing1=6, spacing3=3)
+    widget.tag_configure("h3", font=(family, size + 2, "bold"), foreground="#FFFFFF", spacing1=4, spacing3=2)
+    widget.tag_configure("bold", font=(family, size, "bold"))
+    widget.tag_configure("italic", font=(family, size, "italic"))
+    widget.tag_configure("code", background="#2A2A2A", foreground="#FFAA00")
+    widget.tag_configure("code_block", background="#2A2A2A", foreground="#FFAA00", lmargin1=12, lmargin2=12)
+    widget.tag_configure("quote", foreground="#888888", lmargin1=16, lmargin2=16)
+    widget.tag_configure("rule", foreground="#444444")
+    for level in range(3):
+        margin = 8 + level * 16
+        widget.tag_configure(f"list{level}", lmargin1=margin, lmargin2=margin + 12)
+    
+    widget.tag_configure("link", foreground="#00AAFF", underline=True)
+    widget.tag_bind("link", "<Enter>", lambda e: widget.config(cursor="hand2"))
+    widget.tag_bind("link", "<Leave>", lambda e: widget.config(cursor=""))
+    for index, url in enumerate(links):
+        widget.tag_bind(f"link{index}", "<Button-1>", lambda e, url=url: webbrowser.open(url))
+    
+    # Inline tags are added last so they win over the block they sit in.
+    for tag in ("bold", "italic", "code", "link"):
+        widget.tag_raise(tag)
+
+def parse_safely(text):
+    try:
+        return _cache.get(text)
+    except Exception as e:
+        print(f"Failed to parse markdown: {e}")
+        return {"runs": [(text, ())], "links": [], "lines": text.count("\n") + 1}
+
+def render_markdown(widget, text, chunk_chars=4000, on_done=None, scheduler=None, poll_interval=15):
+    text = text or ""
+    token = object()
+    widget.markdown_token = token
+    
+    def current():
+        try:
+            return bool(widget.winfo_exists()) and widget.markdown_token is token
+        except tk.TclError:
+            return False
+    
+    def insert(parsed):
+        if not current():
+            return
+        configure_tags(widget, parsed["links"])
+        runs = parsed["runs"]
+        
+        # Large bodies go in a few thousand characters per idle callback, so
+        # the window keeps handling events while a long changelog is laid out.
+        def insert_from(index):
+            if not current():
+                return
+            
+            values = []
+            size = 0
+            while index < len(runs) and size < chunk_chars:
+                chunk, tags = runs[index]
+                values.extend([chunk, tags])
+                size += len(chunk)
+                index += 1
+            
+            state = widget.cget("state")
+            widget.config(state="normal")
+            if values:
+                widget.insert("end", *values)
+            widget.config(state=state)
+            
+            if index < len(runs):
+                widget.after_idle(lambda: insert_from(index))
+            elif on_done:
+                on_done()
+        
+        insert_from(0)
+    
+    # Text seen before is inserted straight away. Anything new is parsed off
+    # the Tk thread, on the scheduler when the caller has one.
+    parsed = _cache.lookup(text)
+    if parsed is not None:
+        insert(parsed)
+        return
+    
+    if scheduler is not None:
+        scheduler.submit(
+            lambda: parse_safely(text),
+            priority=PRIORITY_UI,
+            name="markdown",
+            on_done=insert
+        )
+        return
+    
+    result = {}
+    
+    def worker():
+        result["parsed"] = parse_safely(text)
+    
+    def poll():
+        if "parsed" not in result:
+            try:
+                widget.after(poll_interval, poll)
+            except tk.TclError:
+                pass
+            return
+        insert(result["parsed"])
+    
+    threading.Thread(target=worker, name="markdown-parse", daemon=True).start()
+    poll()
@@ -0,0 +1,120 @@
+import threading
+
+class ProgressChannel:
+    def __init__(self, widget, fps=20):
+        self.widget = widget
+        self.interval = 1.0 / fps
+        self.lock = threading.Lock()
+        
+        self.progress_var = None
+        self.status_label = None
+        self.detail_label = None
+        self.console_text = None
+        
+        self.pending_logs = []
+        self.pending_progress = None
+        self.pending_detail = None
+        self.pending_status = None
+        self.pending_calls = []
+        self.dirty = False
+        self.closed = False
+        
+        # The channel is created on the Tk thread and polls from there;
+        # producers on other threads only update the pending state.
+        self.poll_id = self.widget.after(int(self.interval * 1000), self.poll)
+    
+    def bind(self, progress_var=None, status_label=None, detail_label=None, console_text=None):
+        self.progress_var = progress_var
+        self.status_label = status_label
+        self.detail_label = detail_label
+        self.console_text = console_text
+        return self
+    
+    def log(self, message):
+        with self.lock:
+            self.pending_logs.append(message)
+            self.dirty = True
+    
+    def set_progress(self, percent, detail=""):
+        with self.lock:
+            self.pending_progress = percent
+            if detail:
+                self.pending_detail = detail
+            self.dirty = True
+    
+    def set_detail(self, text):
+        with self.lock:
+            self.pending_detail = text
+            self.dirty = True
+    
+    def set_status(self, text):
+        with self.lock:
+            self.pending_status = text
+            self.dirty = True
+    
+    def call(self, callback, *args):
+        with self.lock:
+            self.pending_calls.append((callback, args))
+            self.dirty = True
+    
+    def poll(self):
+        self.poll_id = None
+        if self.closed:
+            return
+        
+        with self.lock:
+            dirty = self.dirty
+        if dirty:
+            self.flush()
+        
+        if not self.closed:
+            try:
+                self.poll_id = self.widget.after(int(self.interval * 1000), self.poll)
+            except Exception:
+                self.closed = True
+    
+    def flush(self):
+        with self.lock:
+            self.dirty = False
+            logs, self.pending_logs = self.pending_logs, []
+            progress, self.pending_progress = self.pending_progress, None
+            detail, self.pending_detail = self.pending_detail, None
+            status, self.pending_status = self.pending_status, None
+            calls, self.pending_calls = self.pending_calls, []
+        
+        try:
+            if not self.widget.winfo_exists():
+                self.closed = True
+                return
+        except Exception:
+            self.closed = True
+            return
+        
+        if logs and self.console_text is not None:
+            self.console_text.insert("end", "".join(f"> {message}\n" for message in logs))
+            self.console_text.see("end")
+        
+        if progress is not None and self.progress_var is not None:
+            self.progress_var.set(progress)
+        
+        if detail and self.detail_label is not None:
+            self.detail_label.config(text=detail)
+        
+        if status is not None and self.status_label is not None:
+            self.status_label.config(text=status)
+        
+        for callback, args in calls:
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Progress callback failed: {e}")
+    
+    def close(self):
+        self.flush()
+        self.closed = True
+        if self.poll_id is not None:
+            try:
+                self.widget.after_cancel(self.poll_id)
+            except Exception:
+                pass
+            self.poll_id = None
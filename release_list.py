@@ -0,0 +1,430 @@
+import tkinter as tk
+import webbrowser
+from datetime import datetime
+
+from task_scheduler import PRIORITY_UI, PRIORITY_NORMAL
+from markdown_view import render_markdown
+
+class ReleaseList:
+    def __init__(self, parent, canvas, owner, app, scrollbar=None, per_page=10, load_threshold=0.9):
+        self.canvas = canvas
+        self.owner = owner
+        self.tr = owner.tr
+        self.app = app
+        self.scrollbar = scrollbar
+        self.per_page = per_page
+        self.load_threshold = load_threshold
+        self.max_body_lines = 30
+        
+        self.releases = []
+        self.pages = 0
+        self.has_more = False
+        self.task = None
+        
+        self.frame = tk.Frame(parent, bg="#000000")
+        self.frame.pack(fill="x", padx=12)
+        self.cards_frame = tk.Frame(self.frame, bg="#000000")
+        self.cards_frame.pack(fill="x")
+        self.footer = None
+        
+        self.canvas.configure(yscrollcommand=self.on_scroll)
+    
+    @property
+    def alive(self):
+        try:
+            return bool(self.frame.winfo_exists()) and self.owner.current_app is self.app
+        except tk.TclError:
+            return False
+    
+    def cancel(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+    
+    def load(self, force=False):
+        cached, fresh = self.owner.releases_cache.get(self.owner.releases_cache_key(self.app, 1))
+        stale_while_revalidate = self.owner.config.get("cache.stale_while_revalidate", True)
+        
+        if cached is not None and not force and (fresh or stale_while_revalidate):
+            self.show_first_page(cached)
+            if fresh:
+                return
+        else:
+            self.clear()
+            self.set_footer(self.tr["loading_releases"] + "...", "#00FF00")
+        
+        def on_done(releases):
+            if releases == cached and not force and self.pages:
+                return
+            self.show_first_page(releases)
+        
+        self.fetch(1, force, on_done, PRIORITY_UI)
+    
+    def load_next(self):
+        if self.task or not self.has_more:
+            return
+        
+        self.set_footer(self.tr["loading_releases"] + "...", "#00FF00")
+        self.fetch(self.pages + 1, False, self.append_page, PRIORITY_NORMAL)
+    
+    def fetch(self, page, force, on_done, priority):
+        self.cancel()
+        
+        def fetch_task():
+            return self.owner.get_app_releases(self.app, page=page, force=force)
+        
+        # A cancelled fetch that was already running still reports back; only
+        # the latest one may touch the list.
+        def done(releases):
+            if self.task is not task:
+                return
+            self.task = None
+            if self.alive:
+                on_done(releases)
+        
+        def failed(error):
+            if self.task is not task:
+                return
+            self.task = None
+            if self.alive:
+                self.show_error(str(error))
+        
+        task = self.task = self.owner.scheduler.submit(
+            fetch_task,
+            priority=priority,
+            name=f"releases-{self.app['app_id']}-{page}",
+            on_done=done,
+            on_error=failed
+        )
+    
+    def clear(self):
+        for widget in self.cards_frame.winfo_children():
+            widget.destroy()
+        self.releases = []
+        self.pages = 0
+        self.has_more = False
+    
+    def show_first_page(self, releases):
+        self.clear()
+        if not releases:
+            self.set_footer(self.tr["no_releases"], "#FF5555")
+            return
+        self.append_page(releases)
+    
+    def append_page(self, releases):
+        # Pages shift when a release is published between fetches; anything
+        # already listed is skipped.
+        seen = {release.get("id") for release in self.releases}
+        for release in releases:
+            if release.get("id") in seen:
+                continue
+            seen.add(release.get("id"))
+            self.create_release_card(release, len(self.releases))
+            self.releases.append(release)
+        
+        self.pages += 1
+        self.has_more = len(releases) >= self.per_page
+        
+        if self.has_more:
+            self.set_footer(self.tr["show_more"], "#00AAFF", command=self.load_next)
+        else:
+            self.set_footer(None)
+    
+    def set_footer(self, text, color="#CCCCCC", command=None):
+        if self.footer is not None:
+            self.footer.destroy()
+            self.footer = None
+        if text is None:
+            return
+        
+        if command:
+            self.footer = tk.Button(
+                self.frame,
+                text=text,
+                font=("Lucida Console", 8, "bold"),
+                bg="#222222",
+                fg=color,
+                relief="solid",
+                borderwidth=1,
+                padx=12,
+                pady=4,
+                cursor="hand2",
+                command=command
+            )
+            self.footer.pack(pady=12)
+        else:
+            self.footer = tk.Label(
+                self.frame,
+                text=text,
+                font=("Lucida Console", 10),
+                bg="#1A1A1A",
+                fg=color,
+                justify="center"
+            )
+            self.footer.pack(fill="x", pady=15, ipadx=12, ipady=25)
+    
+    def show_error(self, error_msg):
+        self.set_footer(None)
+        self.footer = tk.Frame(self.frame, bg="#1A1A1A")
+        self.footer.pack(fill="x", pady=30, ipadx=12, ipady=25)
+        
+        error_label = tk.Label(
+            self.footer,
+            text=f"{self.tr['error']}: {error_msg}",
+            font=("Lucida Console", 8),
+            bg="#1A1A1A",
+            fg="#FF5555",
+            justify="center"
+        )
+        error_label.pack()
+        
+        retry_btn = tk.Button(
+            self.footer,
+            text=self.tr["refresh"],
+            font=("Lucida Console", 8, "bold"),
+            bg="#222222",
+            fg="#FFFFFF",
+            relief="solid",
+            borderwidth=1,
+            padx=12,
+            pady=4,
+            cursor="hand2",
+            command=self.retry
+        )
+        retry_btn.pack(pady=8)
+    
+    def retry(self):
+        if self.pages:
+            self.load_next()
+        else:
+            self.load(force=True)
+    
+    def on_scroll(self, first, last):
+        # The canvas also reports here when its scroll region changes, so a
+        # page that does not fill the view pulls in the next one by itself.
+        if self.scrollbar:
+            self.scrollbar.set(first, last)
+        if float(last) >= self.load_threshold:
+            self.load_next()
+    
+    def create_release_card(self, release, index):
+        release_frame = tk.Frame(self.cards_frame, bg="#1A1A1A")
+        release_frame.pack(fill="x", pady=6, ipadx=12, ipady=12)
+        
+        header_frame = tk.Frame(release_frame, bg="#1A1A1A")
+        header_frame.pack(fill="x", pady=(0, 8))
+        
+        version_label = tk.Label(
+            header_frame,
+            text=release.get("tag_name", f"Release {index + 1}"),
+            font=("Lucida Console", 12, "bold"),
+            bg="#1A1A1A",
+            fg="#FFFFFF",
+            anchor="w"
+        )
+        version_label.pack(side="left")
+        
+        if release.get("prerelease", False):
+            prerelease_label = tk.Label(
+                header_frame,
+                text=f" [{self.tr['prerelease']}]",
+                font=("Lucida Console", 8, "bold"),
+                bg="#1A1A1A",
+                fg="#FFAA00",
+                anchor="w"
+            )
+            prerelease_label.pack(side="left", padx=(4, 0))
+        
+        if index == 0:
+            latest_label = tk.Label(
+                header_frame,
+                text=f" [{self.tr['latest']}]",
+                font=("Lucida Console", 8, "bold"),
+                bg="#1A1A1A",
+                fg="#00FF00",
+                anchor="w"
+            )
+            latest_label.pack(side="left", padx=(4, 0))
+        
+        date_text = release.get("published_at", "")
+        if date_text:
+            try:
+                date_obj = datetime.fromisoformat(date_text.replace("Z", "+00:00"))
+                date_label = tk.Label(
+                    header_frame,
+                    text=f"{self.tr['published']}: {date_obj.strftime('%Y-%m-%d %H:%M')}",
+                    font=("Lucida Console", 7),
+                    bg="#1A1A1A",
+                    fg="#CCCCCC"
+                )
+                date_label.pack(side="right")
+            except:
+                pass
+        
+        # Bodies can be long; they are only turned into widgets when the
+        # user asks for them.
+        body_frame = tk.Frame(release_frame, bg="#1A1A1A")
+        
+        assets = release.get("assets", [])
+        if assets:
+            self.create_assets(release_frame, assets)
+        
+        buttons_frame = tk.Frame(release_frame, bg="#1A1A1A")
+        buttons_frame.pack(fill="x")
+        
+        if release.get("body"):
+            notes_btn = tk.Button(
+                buttons_frame,
+                text=self.tr["release_notes"],
+                font=("Lucida Console", 7),
+                bg="#222222",
+                fg="#FFFFFF",
+                relief="solid",
+                borderwidth=1,
+                padx=8,
+                pady=2,
+                cursor="hand2"
+            )
+            notes_btn.config(command=lambda: self.toggle_body(release, body_frame, buttons_frame, notes_btn))
+            notes_btn.pack(side="left", padx=(0, 4))
+        
+        if release.get("html_url"):
+            github_btn = tk.Button(
+                buttons_frame,
+                text=self.tr["github"],
+                font=("Lucida Console", 7, "bold"),
+                bg="#222222",
+                fg="#FFFFFF",
+                relief="solid",
+                borderwidth=1,
+                padx=8,
+                pady=2,
+                cursor="hand2",
+                command=lambda url=release["html_url"]: webbrowser.open(url)
+            )
+            github_btn.pack(side="left", padx=(0, 4))
+        
+        if release.get("zipball_url"):
+            source_btn = tk.Button(
+                buttons_frame,
+                text=self.tr["download"] + " (Source)",
+                font=("Lucida Console", 7),
+                bg="#222222",
+                fg="#00FF00",
+                relief="solid",
+                borderwidth=1,
+                padx=8,
+                pady=2,
+                cursor="hand2",
+                command=lambda url=release["zipball_url"]: webbrowser.open(url)
+            )
+            source_btn.pack(side="left", padx=(0, 4))
+    
+    def create_assets(self, parent, assets):
+        assets_frame = tk.Frame(parent, bg="#1A1A1A")
+        assets_frame.pack(fill="x", pady=(0, 8))
+        
+        assets_label = tk.Label(
+            assets_frame,
+            text=f"{self.tr['assets']}: {len(assets)}",
+            font=("Lucida Console", 8, "bold"),
+            bg="#1A1A1A",
+            fg="#FFFFFF",
+            anchor="w"
+        )
+        assets_label.pack(anchor="w", pady=(0, 4))
+        
+        for asset in assets[:5]:
+            asset_frame = tk.Frame(assets_frame, bg="#2A2A2A")
+            asset_frame.pack(fill="x", pady=2, ipadx=8, ipady=4)
+            
+            asset_size = asset.get("size", 0)
+            size_mb = asset_size / (1024 * 1024)
+            size_text = f"{size_mb:.2f} MB" if size_mb >= 1 else f"{asset_size / 1024:.2f} KB"
+            
+            name_label = tk.Label(
+                asset_frame,
+                text=asset.get("name", "Unknown"),
+                font=("Lucida Console", 7, "bold"),
+                bg="#2A2A2A",
+                fg="#CCCCCC",
+                anchor="w"
+            )
+            name_label.pack(side="left", padx=(4, 0))
+            
+            size_label = tk.Label(
+                asset_frame,
+                text=f" ({size_text})",
+                font=("Lucida Console", 7),
+                bg="#2A2A2A",
+                fg="#888888",
+                anchor="w"
+            )
+            size_label.pack(side="left", padx=(4, 0))
+            
+            download_btn = tk.Button(
+                asset_frame,
+                text=self.tr["download"],
+                font=("Lucida Console", 7),
+                bg="#222222",
+                fg="#00AAFF",
+                relief="solid",
+                borderwidth=1,
+                padx=6,
+                pady=2,
+                cursor="hand2",
+                command=lambda url=asset.get("browser_download_url", ""): webbrowser.open(url)
+            )
+            download_btn.pack(side="right", padx=(0, 4))
+    
+    def toggle_body(self, release, body_frame, buttons_frame, button):
+        if body_frame.winfo_manager():
+            body_frame.pack_forget()
+            button.config(text=self.tr["release_notes"])
+            return
+        
+        if not body_frame.winfo_children():
+            self.render_body(body_frame, release["body"])
+        body_frame.pack(fill="x", pady=(0, 8), before=buttons_frame)
+        button.config(text=self.tr["show_less"])
+    
+    def render_body(self, parent, body):
+        body_text = tk.Text(
+            parent,
+            font=("Lucida Console", 8),
+            bg="#1A1A1A",
+            fg="#AAAAAA",
+            wrap="word",
+            relief="flat",
+            borderwidth=0,
+            highlightthickness=0,
+            height=1,
+            state="disabled"
+        )
+        scrollbar = tk.Scrollbar(parent, orient="vertical", command=body_text.yview)
+        body_text.configure(yscrollcommand=scrollbar.set)
+        body_text.pack(side="left", fill="x", expand=True)
+        
+        # Wrapped lines only exist once the text has its width, so the height
+        # is taken from display lines after the insert and again whenever the
+        # card is resized. Long bodies stop at max_body_lines and scroll.
+        def fit(event=None):
+            try:
+                lines = body_text.count("1.0", "end", "displaylines")
+            except tk.TclError:
+                return
+            if isinstance(lines, tuple):
+                lines = lines[0]
+            lines = max(lines or 1, 1)
+            
+            body_text.config(height=min(lines, self.max_body_lines))
+            if lines > self.max_body_lines:
+                scrollbar.pack(side="right", fill="y")
+            else:
+                scrollbar.pack_forget()
+        
+        def on_done():
+            body_text.after_idle(fit)
+            body_text.bind("<Configure>", fit)
+        
+        render_markdown(body_text, body, on_done=on_done, scheduler=self.owner.scheduler)
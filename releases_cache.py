@@ -0,0 +1,78 @@
+import os
+import json
+import time
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+class ReleasesCache:
+    def __init__(self, cache_file, ttl=3600, max_entries=32):
+        self.cache_file = Path(cache_file)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.load()
+    
+    def load(self):
+        if not self.cache_file.exists():
+            return
+        
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                loaded = json.load(f)
+        except:
+            return
+        
+        entries = sorted(loaded.get("entries", {}).items(), key=lambda item: item[1].get("used_at", 0))
+        with self.lock:
+            for key, entry in entries:
+                if isinstance(entry.get("releases"), list):
+                    self.entries[key] = entry
+            self.evict()
+    
+    def save(self):
+        with self.lock:
+            data = {"entries": dict(self.entries)}
+        
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_name(f"{self.cache_file.name}.{threading.get_ident()}.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            print(f"Failed to save releases cache: {e}")
+    
+    def evict(self):
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+    
+    def is_fresh(self, entry):
+        return time.time() - entry.get("fetched_at", 0) < self.ttl
+    
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None, False
+            
+            entry["used_at"] = time.time()
+            self.entries.move_to_end(key)
+            return entry["releases"], self.is_fresh(entry)
+    
+    def set(self, key, releases):
+        now = time.time()
+        with self.lock:
+            self.entries[key] = {"releases": releases, "fetched_at": now, "used_at": now}
+            self.entries.move_to_end(key)
+            self.evict()
+        self.save()
+    
+    def invalidate(self, key=None):
+        with self.lock:
+            if key is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(key, None)
+        self.save()
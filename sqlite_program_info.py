@@ -0,0 +1,236 @@
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+from prog_info import ProgramInfo
+
+PROGRAM_COLUMNS = [
+    "name",
+    "current_version",
+    "latest_version",
+    "last_checked",
+    "last_updated",
+    "install_path",
+    "file_count",
+    "status",
+    "update_available"
+]
+
+FILE_COLUMNS = ["name", "path", "rel_path", "size", "type"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS programs (
+    key TEXT PRIMARY KEY,
+    name TEXT,
+    current_version TEXT,
+    latest_version TEXT,
+    last_checked TEXT,
+    last_updated TEXT,
+    install_path TEXT,
+    file_count INTEGER DEFAULT 0,
+    status TEXT DEFAULT 'not_installed',
+    update_available INTEGER DEFAULT 0,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS programs_status ON programs(status);
+CREATE TABLE IF NOT EXISTS executable_files (
+    program_key TEXT NOT NULL,
+    name TEXT,
+    path TEXT,
+    rel_path TEXT,
+    size INTEGER,
+    type TEXT
+);
+CREATE INDEX IF NOT EXISTS executable_files_program ON executable_files(program_key);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+class SQLiteProgramInfo(ProgramInfo):
+    def __init__(self, config=None, manifests=None, catalog=None):
+        self.setup(config, manifests, catalog)
+        self.db_file = self.data_dir / "programs_info.db"
+        self.local = threading.local()
+        
+        conn = self.connection()
+        conn.executescript(SCHEMA)
+        self.migrate()
+    
+    def connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_file), timeout=10, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+            self.local.depth = 0
+        return conn
+    
+    @contextmanager
+    def transaction(self):
+        conn = self.connection()
+        if self.local.depth == 0:
+            conn.execute("BEGIN IMMEDIATE")
+        self.local.depth += 1
+        try:
+            yield conn
+        except:
+            self.local.depth -= 1
+            if self.local.depth == 0:
+                conn.execute("ROLLBACK")
+            raise
+        else:
+            self.local.depth -= 1
+            if self.local.depth == 0:
+                conn.execute("COMMIT")
+    
+    def migrate(self):
+        conn = self.connection()
+        if conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone():
+            self.insert_missing(self.default_info["programs"])
+            return
+        
+        # load_info reads programs_info.json merged with the defaults, or just
+        # the defaults when there is no JSON file yet.
+        info = self.load_info()
+        with self.transaction():
+            self.insert_missing(info["programs"])
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', '1')")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_update', ?)", (info.get("last_update"),))
+            if self.info_file.exists():
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('migrated_from', ?)", (str(self.info_file),))
+        
+        if self.info_file.exists():
+            print(f"Migrated {len(info['programs'])} programs from {self.info_file.name} to {self.db_file.name}")
+    
+    def insert_missing(self, programs):
+        conn = self.connection()
+        existing = {row["key"] for row in conn.execute("SELECT key FROM programs")}
+        with self.transaction():
+            for program_name, program in programs.items():
+                if program_name not in existing:
+                    self.write_program(program_name, program)
+    
+    def write_program(self, program_name, program):
+        conn = self.connection()
+        values = {column: program.get(column) for column in PROGRAM_COLUMNS}
+        values["file_count"] = values["file_count"] or 0
+        values["update_available"] = 1 if values["update_available"] else 0
+        extra = {key: value for key, value in program.items()
+                 if key not in PROGRAM_COLUMNS and key != "executable_files"}
+        
+        # An upsert rather than INSERT OR REPLACE keeps the rowid, which is the
+        # display order of the programs.
+        conn.execute(
+            f"INSERT INTO programs (key, {', '.join(PROGRAM_COLUMNS)}, extra) "
+            f"VALUES (?, {', '.join('?' for _ in PROGRAM_COLUMNS)}, ?) "
+            f"ON CONFLICT(key) DO UPDATE SET "
+            f"{', '.join(f'{column} = excluded.{column}' for column in PROGRAM_COLUMNS)}, extra = excluded.extra",
+            [program_name] + [values[column] for column in PROGRAM_COLUMNS] + [json.dumps(extra) if extra else None]
+        )
+        if "executable_files" in program:
+            self.write_files(program_name, program["executable_files"])
+    
+    def write_files(self, program_name, files):
+        conn = self.connection()
+        conn.execute("DELETE FROM executable_files WHERE program_key = ?", (program_name,))
+        conn.executemany(
+            f"INSERT INTO executable_files (program_key, {', '.join(FILE_COLUMNS)}) "
+            f"VALUES (?, {', '.join('?' for _ in FILE_COLUMNS)})",
+            [[program_name] + [file.get(column) for column in FILE_COLUMNS] for file in files]
+        )
+    
+    def row_to_program(self, row, files):
+        program = {column: row[column] for column in PROGRAM_COLUMNS}
+        program["update_available"] = bool(program["update_available"])
+        if row["extra"]:
+            program.update(json.loads(row["extra"]))
+        program["executable_files"] = files
+        return program
+    
+    def file_to_dict(self, row):
+        return {column: row[column] for column in FILE_COLUMNS if row[column] is not None}
+    
+    def update_row(self, program_name, **values):
+        assignments = ", ".join(f"{column} = ?" for column in values)
+        
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE programs SET {assignments} WHERE key = ?",
+                list(values.values()) + [program_name]
+            )
+            if cursor.rowcount:
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_update', ?)", (datetime.now().isoformat(),))
+            return cursor.rowcount > 0
+    
+    def get_meta(self, key):
+        row = self.connection().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+    
+    @property
+    def info(self):
+        return {"last_update": self.get_meta("last_update"), "programs": self.get_all_programs_info()}
+    
+    def save_info(self):
+        pass
+    
+    def write_info(self):
+        pass
+    
+    def flush(self):
+        pass
+    
+    def get_program_info(self, program_name):
+        conn = self.connection()
+        row = conn.execute("SELECT * FROM programs WHERE key = ?", (program_name,)).fetchone()
+        if row is None:
+            return {}
+        files = [self.file_to_dict(file) for file in conn.execute(
+            "SELECT * FROM executable_files WHERE program_key = ? ORDER BY rowid", (program_name,)
+        )]
+        return self.row_to_program(row, files)
+    
+    def get_all_programs_info(self):
+        conn = self.connection()
+        files = {}
+        for file in conn.execute("SELECT * FROM executable_files ORDER BY rowid"):
+            files.setdefault(file["program_key"], []).append(self.file_to_dict(file))
+        
+        return {
+            row["key"]: self.row_to_program(row, files.get(row["key"], []))
+            for row in conn.execute("SELECT * FROM programs ORDER BY rowid")
+        }
+    
+    def update_program_info(self, program_name, info):
+        with self.transaction():
+            program = self.get_program_info(program_name)
+            program.update(info)
+            program["last_updated"] = datetime.now().isoformat()
+            self.write_program(program_name, program)
+    
+    def update_program_version(self, program_name, version):
+        self.update_row(program_name, current_version=version, last_updated=datetime.now().isoformat())
+    
+    def update_program_status(self, program_name, status, install_path=None):
+        if install_path:
+            self.update_row(program_name, status=status, install_path=install_path)
+        elif status == "not_installed":
+            self.update_row(program_name, status=status, install_path=None)
+        else:
+            self.update_row(program_name, status=status)
+    
+    def update_executable_files(self, program_name, files):
+        with self.transaction():
+            if self.update_row(program_name, file_count=len(files)):
+                self.write_files(program_name, files)
+    
+    def set_update_available(self, program_name, available, latest_version=None):
+        values = {"update_available": 1 if available else 0, "last_checked": datetime.now().isoformat()}
+        if latest_version:
+            values["latest_version"] = latest_version
+        self.update_row(program_name, **values)
@@ -0,0 +1,27 @@
+import time
+
+class StartupTimer:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.last = self.started
+        self.stages = []
+        self.reported = False
+    
+    def mark(self, stage):
+        now = time.perf_counter()
+        self.stages.append((stage, now - self.last))
+        self.last = now
+    
+    @property
+    def total(self):
+        return self.last - self.started
+    
+    def report(self):
+        if self.reported:
+            return
+        self.reported = True
+        
+        print("Startup timing:")
+        for stage, elapsed in self.stages:
+            print(f"  {stage:<16} {elapsed * 1000:8.1f} ms")
+        print(f"  {'total':<16} {self.total * 1000:8.1f} ms")
@@ -0,0 +1,199 @@
+import time
+import queue
+import itertools
+import threading
+from collections import deque
+
+PRIORITY_UI = 0
+PRIORITY_NORMAL = 10
+PRIORITY_BULK = 20
+
+class Task:
+    def __init__(self, func, priority=PRIORITY_NORMAL, name=None, on_done=None, on_error=None):
+        self.func = func
+        self.priority = priority
+        self.name = name or getattr(func, "__name__", "task")
+        self.on_done = on_done
+        self.on_error = on_error
+        
+        self.state = "queued"
+        self.result = None
+        self.error = None
+        self.cancel_event = threading.Event()
+        
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+        self.finished_at = None
+    
+    def cancel(self):
+        self.cancel_event.set()
+        if self.state == "queued":
+            self.state = "cancelled"
+            return True
+        return False
+    
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+    
+    @property
+    def queue_time(self):
+        if self.started_at is None:
+            return None
+        return self.started_at - self.submitted_at
+    
+    @property
+    def run_time(self):
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+class TaskScheduler:
+    def __init__(self, root, max_workers=4, history_size=100, poll_interval=0.016, idle_interval=0.5):
+        self.root = root
+        self.tk_thread = threading.current_thread()
+        self.tasks = queue.PriorityQueue()
+        self.callbacks = queue.SimpleQueue()
+        self.counter = itertools.count()
+        self.poll_ms = max(1, int(poll_interval * 1000))
+        self.idle_ms = max(self.poll_ms, int(idle_interval * 1000))
+        self.poll_id = None
+        self.poll_delay = None
+        
+        self.pending = 0
+        self.pending_lock = threading.Lock()
+        
+        self.history = deque(maxlen=history_size)
+        self.history_lock = threading.Lock()
+        
+        self.running = True
+        self.workers = []
+        for i in range(max_workers):
+            worker = threading.Thread(target=self.worker_loop, name=f"task-worker-{i}", daemon=True)
+            worker.start()
+            self.workers.append(worker)
+        
+        # Worker threads never touch Tk: they only put callbacks on a queue,
+        # and a loop on the Tk thread drains it. The loop runs at poll_ms
+        # while tasks are pending and backs off to idle_ms once nothing is.
+        self.schedule(self.idle_ms)
+    
+    def submit(self, func, priority=PRIORITY_NORMAL, name=None, on_done=None, on_error=None):
+        task = Task(func, priority, name, on_done, on_error)
+        with self.pending_lock:
+            self.pending += 1
+        self.tasks.put((priority, next(self.counter), task))
+        self.wake()
+        return task
+    
+    def task_finished(self):
+        with self.pending_lock:
+            self.pending -= 1
+    
+    def worker_loop(self):
+        while True:
+            priority, seq, task = self.tasks.get()
+            if task is None:
+                break
+            
+            if task.cancelled:
+                task.state = "cancelled"
+                self.task_finished()
+                continue
+            
+            task.state = "running"
+            task.started_at = time.perf_counter()
+            try:
+                task.result = task.func()
+                task.state = "cancelled" if task.cancelled else "done"
+            except Exception as e:
+                task.error = e
+                task.state = "failed"
+                print(f"Task {task.name} failed: {e}")
+            task.finished_at = time.perf_counter()
+            
+            with self.history_lock:
+                self.history.append(task)
+            
+            if task.state == "done" and task.on_done:
+                self.call_in_ui(task.on_done, task.result)
+            elif task.state == "failed" and task.on_error:
+                self.call_in_ui(task.on_error, task.error)
+            self.task_finished()
+    
+    def call_in_ui(self, callback, *args):
+        self.callbacks.put((callback, args))
+        self.wake()
+    
+    def schedule(self, delay):
+        try:
+            self.poll_id = self.root.after(delay, self.poll)
+            self.poll_delay = delay
+        except Exception:
+            self.poll_id = None
+            self.running = False
+    
+    def wake(self):
+        # Only the Tk thread may reschedule; calls from workers are picked up
+        # by the loop, which stays fast while their task is pending.
+        if not self.running or threading.current_thread() is not self.tk_thread:
+            return
+        if self.poll_id is not None:
+            if self.poll_delay == self.poll_ms:
+                return
+            try:
+                self.root.after_cancel(self.poll_id)
+            except Exception:
+                pass
+        self.schedule(self.poll_ms)
+    
+    def poll(self):
+        self.poll_id = None
+        self.drain()
+        if not self.running:
+            return
+        
+        # pending is read first: a worker queues its callbacks before it
+        # stops counting as pending, so an empty queue after that is final.
+        with self.pending_lock:
+            busy = self.pending > 0
+        busy = busy or not self.callbacks.empty()
+        self.schedule(self.poll_ms if busy else self.idle_ms)
+    
+    def drain(self):
+        while True:
+            try:
+                callback, args = self.callbacks.get_nowait()
+            except queue.Empty:
+                break
+            
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"UI callback failed: {e}")
+    
+    def get_stats(self):
+        with self.history_lock:
+            finished = list(self.history)
+        
+        stats = {"pending": self.tasks.qsize(), "finished": len(finished), "tasks": []}
+        for task in finished:
+            stats["tasks"].append({
+                "name": task.name,
+                "priority": task.priority,
+                "state": task.state,
+                "queue_time": task.queue_time,
+                "run_time": task.run_time
+            })
+        return stats
+    
+    def shutdown(self):
+        self.running = False
+        if self.poll_id is not None:
+            try:
+                self.root.after_cancel(self.poll_id)
+            except Exception:
+                pass
+            self.poll_id = None
+        for _ in self.workers:
+            self.tasks.put((float("inf"), next(self.counter), None))
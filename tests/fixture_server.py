@@ -0,0 +1,214 @@
+import io
+import json
+import hashlib
+import zipfile
+import threading
+from urllib.parse import urlparse, unquote
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+def blob_sha(content):
+    return hashlib.sha1(f"blob {len(content)}\0".encode("ascii") + content).hexdigest()
+
+# A GitHub repository held in memory. Commits are plain {path: bytes} maps
+# and are served over the API, raw and archive URL layouts DeltaUpdater and
+# the store use. Release downloads live in files and are served from
+# /files/ with range support; each entry in drops cuts the next download GET
+# off after that many body bytes.
+class FixtureRepo:
+    def __init__(self, owner="WMR-Group", name="Demo-App"):
+        self.owner = owner
+        self.name = name
+        self.commits = {}
+        self.refs = {}
+        self.corrupt = set()
+        self.executable = set()
+        self.requests = []
+        self.lock = threading.Lock()
+        
+        self.files = {}
+        self.sizes = {}
+        self.ranges = True
+        self.drops = []
+        self.range_requests = []
+    
+    @property
+    def download_url(self):
+        return f"https://github.com/{self.owner}/{self.name}/archive/refs/heads/main.zip"
+    
+    def commit(self, files, ref="main"):
+        files = {path: content.encode("utf-8") if isinstance(content, str) else content
+                 for path, content in files.items()}
+        digest = hashlib.sha1()
+        for path in sorted(files):
+            digest.update(path.encode("utf-8") + b"\0" + blob_sha(files[path]).encode("ascii"))
+        digest.update(str(len(self.commits)).encode("ascii"))
+        
+        sha = digest.hexdigest()
+        self.commits[sha] = files
+        self.refs[ref] = sha
+        return sha
+    
+    def archive(self, sha):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zip_ref:
+            for path, content in self.commits[sha].items():
+                zip_ref.writestr(f"{self.name}-{sha}/{path}", content)
+        return buffer.getvalue()
+    
+    def raw_requests(self):
+        with self.lock:
+            return [path for path in self.requests if path.startswith("/raw/")]
+    
+    def take_drop(self):
+        with self.lock:
+            return self.drops.pop(0) if self.drops else None
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+    
+    def send_body(self, body, content_type="application/octet-stream", status=200):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def send_json(self, data, status=200):
+        self.send_body(json.dumps(data).encode("utf-8"), "application/json", status)
+    
+    def send_file(self, name, head=False):
+        repo = self.server.repo
+        content = repo.files.get(name)
+        if content is None:
+            return self.send_body(b"404: Not Found", "text/plain", 404)
+        
+        total = len(content)
+        status = 200
+        body = content
+        range_header = self.headers.get("Range")
+        with repo.lock:
+            repo.range_requests.append((name, range_header))
+        
+        headers = {"ETag": f'"{blob_sha(content)}"'}
+        if repo.ranges:
+            headers["Accept-Ranges"] = "bytes"
+            if range_header and range_header.startswith("bytes="):
+                start, _, end = range_header[len("bytes="):].partition("-")
+                start = int(start)
+                end = min(int(end), total - 1) if end else total - 1
+                body = content[start:end + 1]
+                status = 206
+                headers["Content-Range"] = f"bytes {start}-{end}/{total}"
+        
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(repo.sizes.get(name, len(body)) if head else len(body)))
+        self.end_headers()
+        if head:
+            return
+        
+        drop = repo.take_drop()
+        if drop is None:
+            self.wfile.write(body)
+            return
+        self.wfile.write(body[:drop])
+        self.wfile.flush()
+        self.close_connection = True
+    
+    def do_HEAD(self):
+        path = urlparse(self.path).path
+        if path.startswith("/files/"):
+            return self.send_file(unquote(path[len("/files/"):]), head=True)
+        self.send_response(404)
+        self.end_headers()
+    
+    def do_GET(self):
+        repo = self.server.repo
+        path = urlparse(self.path).path
+        with repo.lock:
+            repo.requests.append(path)
+        
+        if path.startswith("/files/"):
+            return self.send_file(unquote(path[len("/files/"):]))
+        
+        prefix = f"/{repo.owner}/{repo.name}"
+        api_prefix = f"/api/repos{prefix}"
+        
+        if path.startswith(api_prefix + "/commits/"):
+            ref = unquote(path[len(api_prefix + "/commits/"):])
+            sha = repo.refs.get(ref, ref if ref in repo.commits else None)
+            if sha is None:
+                return self.send_json({"message": "Not Found"}, 404)
+            return self.send_json({"sha": sha})
+        
+        if path.startswith(api_prefix + "/git/trees/"):
+            sha = path[len(api_prefix + "/git/trees/"):]
+            if sha not in repo.commits:
+                return self.send_json({"message": "Not Found"}, 404)
+            
+            tree = []
+            directories = set()
+            for file_path, content in sorted(repo.commits[sha].items()):
+                parts = file_path.split("/")
+                for depth in range(1, len(parts)):
+                    directories.add("/".join(parts[:depth]))
+                mode = "100755" if file_path in repo.executable else "100644"
+                tree.append({"path": file_path, "mode": mode, "type": "blob", "sha": blob_sha(content)})
+            tree.extend({"path": directory, "mode": "040000", "type": "tree", "sha": ""} for directory in sorted(directories))
+            return self.send_json({"sha": sha, "tree": tree, "truncated": False})
+        
+        if path.startswith("/raw" + prefix + "/"):
+            sha, _, file_path = path[len("/raw" + prefix + "/"):].partition("/")
+            file_path = unquote(file_path)
+            content = repo.commits.get(sha, {}).get(file_path)
+            if content is None:
+                return self.send_body(b"404: Not Found", "text/plain", 404)
+            if file_path in repo.corrupt:
+                content = content + b"corrupted"
+            return self.send_body(content)
+        
+        if path.startswith(prefix + "/archive/") and path.endswith(".zip"):
+            sha = path[len(prefix + "/archive/"):-len(".zip")]
+            if sha not in repo.commits:
+                return self.send_body(b"404: Not Found", "text/plain", 404)
+            return self.send_body(repo.archive(sha), "application/zip")
+        
+        self.send_body(b"404: Not Found", "text/plain", 404)
+
+class FixtureServer:
+    def __init__(self, repo):
+        self.repo = repo
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.repo = repo
+        self.thread = None
+    
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    @property
+    def api_base(self):
+        return self.base_url + "/api"
+    
+    @property
+    def raw_base(self):
+        return self.base_url + "/raw"
+    
+    def file_url(self, name):
+        return f"{self.base_url}/files/{name}"
+    
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="fixture-server", daemon=True)
+        self.thread.start()
+        return self
+    
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread:
+            self.thread.join(timeout=5)
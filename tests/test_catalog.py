@@ -0,0 +1,27 @@
+import copy
+import unittest
+
+from catalog import Catalog, CatalogError, CATALOG_SCHEMA
+
+class CatalogValidateTest(unittest.TestCase):
+    def setUp(self):
+        self.catalog = Catalog(None)
+    
+    def index(self, app_id):
+        return {"schema": CATALOG_SCHEMA, "apps": [{"id": app_id, "name": "Demo"}]}
+    
+    def test_bundled_catalog_is_valid(self):
+        self.assertTrue(self.catalog.apps)
+        self.catalog.validate(copy.deepcopy(self.catalog.index))
+    
+    def test_plain_ids_are_accepted(self):
+        for app_id in ["WALMFAST", "Wlap-FlashTool", "deltarune-translator", "app_2.0"]:
+            self.catalog.validate(self.index(app_id))
+    
+    def test_ids_that_are_not_one_path_component_are_rejected(self):
+        for app_id in ["../evil", "..", ".hidden", "a/b", "a\\b", "/abs", "C:", "C:\\evil", "", 42]:
+            with self.assertRaises(CatalogError, msg=repr(app_id)):
+                self.catalog.validate(self.index(app_id))
+
+if __name__ == "__main__":
+    unittest.main()
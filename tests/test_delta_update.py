@@ -0,0 +1,181 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from github_client import GitHubClient
+from install_manifest import InstallManifest
+from delta_update import DeltaUpdater, DeltaUnavailable
+from tests.fixture_server import FixtureRepo, FixtureServer
+
+APP_KEY = "demo"
+
+class DeltaUpdateTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.install_path = os.path.join(self.temp_dir, "install", APP_KEY)
+        
+        self.repo = FixtureRepo()
+        self.server = FixtureServer(self.repo).start()
+        self.client = GitHubClient(os.path.join(self.temp_dir, "http_cache"), timeout=5)
+        self.manifests = InstallManifest(os.path.join(self.temp_dir, "manifests"))
+        self.updater = DeltaUpdater(
+            self.client,
+            self.manifests,
+            api_base=self.server.api_base,
+            raw_base=self.server.raw_base
+        )
+    
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def install(self, files):
+        self.repo.commit(files)
+        for rel_path, content in files.items():
+            path = os.path.join(self.install_path, *rel_path.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+        return self.updater.snapshot(APP_KEY, self.install_path, self.repo.download_url)
+    
+    def read(self, rel_path):
+        with open(os.path.join(self.install_path, *rel_path.split("/")), "r", encoding="utf-8") as f:
+            return f.read()
+    
+    def exists(self, rel_path):
+        return os.path.exists(os.path.join(self.install_path, *rel_path.split("/")))
+    
+    def test_snapshot_records_files_matching_the_tree(self):
+        self.install({"main.py": "print(1)\n", "lib/util.py": "x = 1\n"})
+        with open(os.path.join(self.install_path, "main.py"), "a", encoding="utf-8") as f:
+            f.write("# local edit\n")
+        
+        manifest = self.updater.snapshot(APP_KEY, self.install_path, self.repo.download_url)
+        
+        self.assertEqual(manifest["commit"], self.repo.refs["main"])
+        self.assertEqual(sorted(manifest["files"]), ["lib/util.py"])
+        self.assertEqual(self.manifests.load(APP_KEY)["files"], manifest["files"])
+    
+    def test_update_fetches_only_changed_files(self):
+        self.install({
+            "main.py": "print(1)\n",
+            "lib/util.py": "x = 1\n",
+            "lib/old.py": "old = True\n",
+            "README.md": "demo\n"
+        })
+        with open(os.path.join(self.install_path, "run.bat"), "w", encoding="utf-8") as f:
+            f.write("@echo off\n")
+        
+        commit = self.repo.commit({
+            "main.py": "print(2)\n",
+            "lib/util.py": "x = 1\n",
+            "lib/new.py": "new = True\n",
+            "README.md": "demo\n"
+        })
+        progress = []
+        logs = []
+        
+        result = self.updater.update(
+            APP_KEY,
+            self.install_path,
+            self.repo.download_url,
+            progress_callback=lambda *args: progress.append(args),
+            log_callback=logs.append
+        )
+        
+        self.assertEqual(result["commit"], commit)
+        self.assertEqual((result["changed"], result["removed"]), (2, 1))
+        self.assertEqual(sorted(self.repo.raw_requests()), sorted([
+            f"/raw/{self.repo.owner}/{self.repo.name}/{commit}/main.py",
+            f"/raw/{self.repo.owner}/{self.repo.name}/{commit}/lib/new.py"
+        ]))
+        
+        self.assertEqual(self.read("main.py"), "print(2)\n")
+        self.assertEqual(self.read("lib/new.py"), "new = True\n")
+        self.assertFalse(self.exists("lib/old.py"))
+        self.assertEqual(self.read("run.bat"), "@echo off\n")
+        self.assertFalse(os.path.exists(self.install_path + ".delta"))
+        
+        manifest = self.manifests.load(APP_KEY)
+        self.assertEqual(manifest["commit"], commit)
+        self.assertEqual(sorted(manifest["files"]), ["README.md", "lib/new.py", "lib/util.py", "main.py"])
+        self.assertEqual(progress[-1][:2], (2, 2))
+        self.assertTrue(logs)
+    
+    def test_update_keeps_the_executable_bit(self):
+        self.install({"run.sh": "echo 1\n", "main.py": "print(1)\n"})
+        self.repo.commit({"run.sh": "echo 2\n", "main.py": "print(1)\n"})
+        self.repo.executable.add("run.sh")
+        
+        self.updater.update(APP_KEY, self.install_path, self.repo.download_url)
+        
+        self.assertEqual(self.read("run.sh"), "echo 2\n")
+        if os.name == "posix":
+            self.assertTrue(os.stat(os.path.join(self.install_path, "run.sh")).st_mode & 0o100)
+    
+    def test_update_removes_directories_left_empty(self):
+        self.install({"main.py": "print(1)\n", "plugins/old/a.py": "a = 1\n", "lib/util.py": "x = 1\n"})
+        with open(os.path.join(self.install_path, "lib", "local.txt"), "w", encoding="utf-8") as f:
+            f.write("user file\n")
+        self.repo.commit({"main.py": "print(1)\n"})
+        
+        result = self.updater.update(APP_KEY, self.install_path, self.repo.download_url)
+        
+        self.assertEqual(result["removed"], 2)
+        self.assertFalse(self.exists("plugins"))
+        self.assertFalse(self.exists("lib/util.py"))
+        self.assertEqual(self.read("lib/local.txt"), "user file\n")
+    
+    def test_update_at_the_installed_commit_downloads_nothing(self):
+        self.install({"main.py": "print(1)\n"})
+        
+        result = self.updater.update(APP_KEY, self.install_path, self.repo.download_url)
+        
+        self.assertEqual(result["changed"], 0)
+        self.assertEqual(self.repo.raw_requests(), [])
+    
+    def test_checksum_mismatch_leaves_the_install_untouched(self):
+        self.install({"main.py": "print(1)\n", "lib/util.py": "x = 1\n"})
+        old_commit = self.repo.refs["main"]
+        self.repo.commit({"main.py": "print(2)\n", "lib/util.py": "x = 2\n"})
+        self.repo.corrupt.add("lib/util.py")
+        
+        with self.assertRaises(DeltaUnavailable):
+            self.updater.update(APP_KEY, self.install_path, self.repo.download_url)
+        
+        self.assertEqual(self.read("main.py"), "print(1)\n")
+        self.assertEqual(self.read("lib/util.py"), "x = 1\n")
+        self.assertFalse(os.path.exists(self.install_path + ".delta"))
+        self.assertEqual(self.manifests.load(APP_KEY)["commit"], old_commit)
+    
+    def test_large_changes_fall_back_to_a_full_download(self):
+        self.install({"a.py": "a = 1\n", "b.py": "b = 1\n"})
+        self.repo.commit({"a.py": "a = 2\n", "b.py": "b = 2\n"})
+        self.updater.max_files = 1
+        
+        with self.assertRaises(DeltaUnavailable):
+            self.updater.update(APP_KEY, self.install_path, self.repo.download_url)
+        self.assertEqual(self.repo.raw_requests(), [])
+    
+    def test_update_without_manifest_is_unavailable(self):
+        with self.assertRaises(DeltaUnavailable):
+            self.updater.update(APP_KEY, self.install_path, self.repo.download_url)
+    
+    def test_changed_download_source_is_unavailable(self):
+        self.install({"main.py": "print(1)\n"})
+        other_url = "https://github.com/WMR-Group/Other-App/archive/refs/heads/main.zip"
+        
+        with self.assertRaises(DeltaUnavailable):
+            self.updater.update(APP_KEY, self.install_path, other_url)
+    
+    def test_commit_archive_url_points_at_the_resolved_commit(self):
+        self.install({"main.py": "print(1)\n"})
+        commit = self.repo.refs["main"]
+        
+        url = self.updater.commit_archive_url(self.repo.download_url, commit)
+        
+        self.assertEqual(url, f"https://github.com/{self.repo.owner}/{self.repo.name}/archive/{commit}.zip")
+
+if __name__ == "__main__":
+    unittest.main()
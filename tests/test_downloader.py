@@ -0,0 +1,89 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from downloader import ChunkedDownloader, DownloadError
+from tests.fixture_server import FixtureRepo, FixtureServer
+
+FILE_NAME = "app.zip"
+
+class ChunkedDownloaderTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.dest = os.path.join(self.temp_dir, FILE_NAME)
+        self.content = os.urandom(64 * 1024)
+        
+        self.repo = FixtureRepo()
+        self.repo.files[FILE_NAME] = self.content
+        self.server = FixtureServer(self.repo).start()
+        
+        # Retries back off with time.sleep; the tests do not need to wait.
+        patcher = mock.patch("downloader.time.sleep")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def downloader(self, segments=1):
+        return ChunkedDownloader(segments=segments, buffer_size=4096, min_segment_size=4096, timeout=5)
+    
+    def download(self, downloader):
+        logs = []
+        downloader.download(self.server.file_url(FILE_NAME), self.dest, log_callback=logs.append)
+        with open(self.dest, "rb") as f:
+            self.assertEqual(f.read(), self.content)
+        self.assertFalse(os.path.exists(self.dest + ".part"))
+        self.assertFalse(os.path.exists(self.dest + ".part.json"))
+        return logs
+    
+    def range_headers(self):
+        return [header for name, header in self.repo.range_requests if header is not None]
+    
+    def test_stream_resumes_after_a_dropped_connection(self):
+        self.repo.drops.append(20480)
+        
+        self.download(self.downloader())
+        
+        self.assertEqual(self.range_headers(), ["bytes=20480-"])
+    
+    def test_drop_before_any_bytes_retries_from_the_start(self):
+        self.repo.drops.append(0)
+        
+        self.download(self.downloader())
+        
+        self.assertEqual(self.range_headers(), ["bytes=0-"])
+    
+    def test_stream_without_range_support_restarts(self):
+        self.repo.ranges = False
+        self.repo.drops.append(20000)
+        
+        logs = self.download(self.downloader(segments=4))
+        
+        self.assertEqual(self.range_headers(), [])
+        self.assertTrue(any("restarting" in line for line in logs))
+    
+    def test_segment_resumes_after_a_dropped_connection(self):
+        self.repo.drops.append(4096)
+        downloader = self.downloader(segments=4)
+        
+        self.download(downloader)
+        
+        starts = {segment["start"] for segment in downloader.plan_segments(len(self.content))}
+        requested = [int(header[len("bytes="):].split("-")[0]) for header in self.range_headers()]
+        self.assertEqual(len(requested), len(starts) + 1)
+        self.assertTrue(any(start - 4096 in starts for start in requested if start not in starts))
+    
+    def test_content_length_mismatch_is_rejected(self):
+        self.repo.ranges = False
+        self.repo.sizes[FILE_NAME] = len(self.content) + 10
+        
+        with self.assertRaises(DownloadError):
+            self.downloader().download(self.server.file_url(FILE_NAME), self.dest)
+        self.assertFalse(os.path.exists(self.dest))
+
+if __name__ == "__main__":
+    unittest.main()
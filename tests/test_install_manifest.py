@@ -0,0 +1,112 @@
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+
+from install_manifest import InstallManifest
+
+APP_KEY = "demo"
+
+class InstallManifestTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.install_path = os.path.join(self.temp_dir, "install", APP_KEY)
+        os.makedirs(os.path.join(self.install_path, "lib"))
+        self.write("main.py", "print(1)\n")
+        self.write("lib/util.py", "x = 1\n")
+        self.manifests = InstallManifest(os.path.join(self.temp_dir, "manifests"))
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def write(self, rel_path, content):
+        with open(os.path.join(self.install_path, *rel_path.split("/")), "w", encoding="utf-8") as f:
+            f.write(content)
+    
+    def test_index_is_served_from_memory_while_the_root_is_unchanged(self):
+        entries = self.manifests.get_index(APP_KEY, self.install_path)
+        self.assertEqual(entries["main.py"]["type"], "py")
+        self.assertEqual(entries["lib"]["type"], "dir")
+        
+        reads = []
+        read_json = self.manifests.read_json
+        self.manifests.read_json = lambda path: reads.append(path) or read_json(path)
+        scans = []
+        self.manifests.scan = lambda path: scans.append(path) or {}
+        
+        self.assertIs(self.manifests.get_index(APP_KEY, self.install_path), entries)
+        self.assertEqual((reads, scans), ([], []))
+    
+    def test_index_is_reloaded_from_its_own_file(self):
+        entries = self.manifests.get_index(APP_KEY, self.install_path)
+        
+        reopened = InstallManifest(self.manifests.manifest_dir)
+        self.assertEqual(reopened.get_index(APP_KEY, self.install_path), entries)
+        self.assertIsNone(reopened.load_raw(APP_KEY))
+    
+    def test_patch_index_applies_watcher_changes(self):
+        self.manifests.get_index(APP_KEY, self.install_path)
+        self.write("run.bat", "@echo off\n")
+        os.remove(os.path.join(self.install_path, "lib", "util.py"))
+        
+        self.assertTrue(self.manifests.patch_index(APP_KEY, self.install_path, [
+            ("created", "run.bat", None),
+            ("deleted", "lib/util.py", None)
+        ]))
+        
+        entries = self.manifests.get_index(APP_KEY, self.install_path)
+        self.assertEqual(entries["run.bat"]["type"], "bat")
+        self.assertNotIn("lib/util.py", entries)
+    
+    def test_scans_do_not_overwrite_the_delta_manifest(self):
+        files = {f"file{i}.py": {"sha": str(i)} for i in range(50)}
+        stop = threading.Event()
+        
+        def scan_loop():
+            while not stop.is_set():
+                self.manifests.drop_index(APP_KEY)
+                self.manifests.get_index(APP_KEY, self.install_path)
+        
+        scanner = threading.Thread(target=scan_loop)
+        scanner.start()
+        try:
+            for commit in range(50):
+                with self.manifests.editing(APP_KEY):
+                    manifest = self.manifests.load(APP_KEY) or {"repo": "WMR-Group/Demo-App", "files": {}}
+                    manifest["commit"] = str(commit)
+                    manifest["files"] = dict(files)
+                    self.manifests.save(APP_KEY, manifest)
+        finally:
+            stop.set()
+            scanner.join()
+        
+        manifest = self.manifests.load(APP_KEY)
+        self.assertEqual(manifest["commit"], "49")
+        self.assertEqual(manifest["files"], files)
+        self.assertNotIn("index", manifest)
+    
+    def test_inline_index_from_older_manifests_is_dropped_on_save(self):
+        path = self.manifests.manifest_path(APP_KEY)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"repo": "WMR-Group/Demo-App", "files": {}, "index": {"root_mtime": 0, "entries": {}}}, f)
+        
+        manifest = self.manifests.load(APP_KEY)
+        self.manifests.save(APP_KEY, manifest)
+        
+        with open(path, "r", encoding="utf-8") as f:
+            self.assertNotIn("index", json.load(f))
+    
+    def test_delete_removes_manifest_and_index(self):
+        self.manifests.get_index(APP_KEY, self.install_path)
+        self.manifests.save(APP_KEY, {"repo": "WMR-Group/Demo-App", "files": {}})
+        
+        self.manifests.delete(APP_KEY)
+        
+        self.assertFalse(self.manifests.manifest_path(APP_KEY).exists())
+        self.assertFalse(self.manifests.index_path(APP_KEY).exists())
+        self.assertNotIn(APP_KEY, self.manifests.indexes)
+
+if __name__ == "__main__":
+    unittest.main()
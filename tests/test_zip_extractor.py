@@ -0,0 +1,67 @@
+import os
+import shutil
+import zipfile
+import tempfile
+import unittest
+
+from zip_extractor import ZipExtractor, UnsafeArchiveError
+
+class ZipExtractorTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.dest = os.path.join(self.temp_dir, "install", "demo.staging")
+        self.dest_root = os.path.realpath(os.path.join(self.temp_dir, "install", "demo.staging"))
+        self.extractor = ZipExtractor()
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def archive(self, names):
+        zip_path = os.path.join(self.temp_dir, "demo.zip")
+        with zipfile.ZipFile(zip_path, "w") as zip_ref:
+            for name in names:
+                zip_ref.writestr(zipfile.ZipInfo(name), b"data")
+        return zip_path
+    
+    def assert_rejected(self, relative_name):
+        with self.assertRaises(UnsafeArchiveError):
+            self.extractor.member_path(self.dest_root, relative_name, relative_name)
+    
+    def test_parent_references_are_rejected(self):
+        self.assert_rejected("../x")
+        self.assert_rejected("lib/../../x")
+        self.assert_rejected("..\\x")
+    
+    def test_absolute_paths_are_rejected(self):
+        self.assert_rejected("/etc/passwd")
+        self.assert_rejected("\\Windows\\win.ini")
+    
+    def test_drive_letter_paths_are_rejected(self):
+        self.assert_rejected("C:/Windows/win.ini")
+        self.assert_rejected("C:\\Windows\\win.ini")
+        self.assert_rejected("C:win.ini")
+    
+    def test_normal_names_resolve_inside_the_destination(self):
+        target = self.extractor.member_path(self.dest_root, "Demo-App-main/lib/util.py", "lib/util.py")
+        self.assertEqual(target, os.path.join(self.dest_root, "lib", "util.py"))
+    
+    def test_top_level_folder_is_stripped(self):
+        zip_path = self.archive(["Demo-App-main/main.py", "Demo-App-main/lib/util.py"])
+        
+        result = self.extractor.extract(zip_path, self.dest)
+        
+        self.assertEqual(result["errors"], [])
+        self.assertTrue(os.path.isfile(os.path.join(self.dest, "main.py")))
+        self.assertTrue(os.path.isfile(os.path.join(self.dest, "lib", "util.py")))
+    
+    def test_escaping_member_stops_the_extraction(self):
+        zip_path = self.archive(["Demo-App-main/main.py", "Demo-App-main/../../evil.py"])
+        
+        with self.assertRaises(UnsafeArchiveError):
+            self.extractor.extract(zip_path, self.dest)
+        
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "evil.py")))
+        self.assertFalse(os.path.exists(os.path.join(self.dest, "main.py")))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,25 +1,31 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext
+import sys
 import threading
+from pathlib import Path
 from updater import Updater
+from progress_channel import ProgressChannel
 import locales
 
 class UpdateDialog:
-    def __init__(self, updater, update_info, config):
+    def __init__(self, parent, updater, update_info, config):
+        self.parent = parent
         self.updater = updater
         self.update_info = update_info
         self.config = config
         self.lang = config.get_language()
         self.tr = locales.LANGUAGES.get(self.lang, locales.LANGUAGES["en"])
         
-        self.root = tk.Tk()
+        self.root = tk.Toplevel(parent)
         self.root.title(self.tr["updating"])
         self.root.geometry("600x400")
         self.root.configure(bg="#000000")
         self.center_window()
         self.root.resizable(False, False)
+        self.root.transient(parent)
         
         self.setup_ui()
+        self.root.grab_set()
     
     def center_window(self):
         self.root.update_idletasks()
@@ -82,16 +88,19 @@ class UpdateDialog:
             borderwidth=1
         )
         self.console_text.pack(fill="both", expand=True)
+        
+        self.channel = ProgressChannel(self.root).bind(
+            progress_var=self.progress_var,
+            status_label=self.status_label,
+            console_text=self.console_text
+        )
     
     def log_message(self, message):
-        self.console_text.insert("end", f"> {message}\n")
-        self.console_text.see("end")
-        self.root.update()
+        self.channel.log(message)
     
     def update_progress(self, percent, status):
-        self.progress_var.set(percent)
-        self.status_label.config(text=status)
-        self.root.update()
+        self.channel.set_progress(percent)
+        self.channel.set_status(status)
     
     def start_update(self):
         try:
@@ -115,28 +124,30 @@ class UpdateDialog:
                 import time
                 time.sleep(1)
                 
-                self.root.destroy()
-                
-                import tkinter as tk
-                from tkinter import messagebox
-                
-                tk.Tk().withdraw()
-                messagebox.showinfo(
-                    self.tr["update_complete"],
-                    self.tr["update_complete"]
-                )
-                
-                import subprocess
-                subprocess.Popen([sys.executable, __file__])
-                sys.exit(0)
+                self.channel.call(self.finish_update)
             else:
                 raise Exception("Update application failed")
         
         except Exception as e:
             self.log_message(f"Error: {str(e)}")
-            self.status_label.config(text=self.tr["installation_failed"])
+            self.channel.set_status(self.tr["installation_failed"])
+    
+    def finish_update(self):
+        self.channel.close()
+        self.root.destroy()
+        
+        from tkinter import messagebox
+        
+        messagebox.showinfo(
+            self.tr["update_complete"],
+            self.tr["update_complete"],
+            parent=self.parent
+        )
+        
+        import subprocess
+        subprocess.Popen([sys.executable, str(Path(__file__).parent / "main.py")])
+        self.parent.winfo_toplevel().destroy()
     
     def run(self):
         thread = threading.Thread(target=self.start_update, daemon=True)
-        thread.start()
-        self.root.mainloop()
\ No newline at end of file
+        thread.start()
\ No newline at end of file
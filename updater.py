@@ -1,15 +1,16 @@
-import requests
 import json
 import os
 import sys
+import shutil
 import subprocess
 import tempfile
-import zipfile
-import shutil
 from datetime import datetime
 from pathlib import Path
 import threading
 from config import Config
+from github_client import get_client
+from downloader import ChunkedDownloader
+from zip_extractor import ZipExtractor
 
 class Updater:
     def __init__(self, config=None):
@@ -18,13 +19,16 @@ class Updater:
         self.update_file_url = self.config.get("updater.update_file_url")
         self.changelog_url = self.config.get("updater.changelog_url")
         self.base_dir = Path(__file__).parent
+        self.client = get_client(self.config)
+        self.downloader = ChunkedDownloader(client=self.client)
+        self.extractor = ZipExtractor()
     
     def check_for_updates(self):
         try:
             current_version = self.config.get("app.version", "1.1.3").replace("v", "")
             
             try:
-                response = requests.get(self.repo_url, timeout=10)
+                response = self.client.get(self.repo_url, timeout=10)
                 if response.status_code == 200:
                     data = response.json()
                     latest_version = data.get("tag_name", "").replace("v", "")
@@ -45,14 +49,14 @@ class Updater:
                 pass
             
             try:
-                response = requests.get(self.update_file_url, timeout=10)
+                response = self.client.get(self.update_file_url, timeout=10)
                 if response.status_code == 200:
                     latest_version = response.text.strip().replace("v", "")
                     
                     if latest_version and self.compare_versions(latest_version, current_version) > 0:
                         changelog = ""
                         try:
-                            changelog_response = requests.get(self.changelog_url, timeout=10)
+                            changelog_response = self.client.get(self.changelog_url, timeout=10)
                             if changelog_response.status_code == 200:
                                 changelog = changelog_response.text
                         except:
@@ -116,7 +120,7 @@ class Updater:
             if "github.com" in download_url and "/releases/" in download_url:
                 api_url = download_url.replace("github.com", "api.github.com/repos").replace("/releases/latest", "/releases/latest")
                 try:
-                    response = requests.get(api_url, timeout=10)
+                    response = self.client.get(api_url, timeout=10)
                     if response.status_code == 200:
                         data = response.json()
                         assets = data.get("assets", [])
@@ -128,26 +132,17 @@ class Updater:
                 except:
                     pass
             
-            response = requests.get(download_url, stream=True, timeout=30)
-            total_size = int(response.headers.get('content-length', 0))
-            
             temp_dir = Path(tempfile.gettempdir()) / "wmr_update"
             temp_dir.mkdir(exist_ok=True)
             
             zip_path = temp_dir / "update.zip"
             
-            downloaded = 0
-            chunk_size = 8192
+            def on_progress(downloaded, total_size):
+                if progress_callback and total_size > 0:
+                    percent = (downloaded / total_size) * 100
+                    progress_callback(percent, f"Downloading... {downloaded/(1024*1024):.1f} MB")
             
-            with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if progress_callback and total_size > 0:
-                            percent = (downloaded / total_size) * 100
-                            progress_callback(percent, f"Downloading... {downloaded/(1024*1024):.1f} MB")
+            self.downloader.download(download_url, zip_path, progress_callback=on_progress)
             
             if progress_callback:
                 progress_callback(100, "Download complete")
@@ -159,41 +154,36 @@ class Updater:
             return None
     
     def apply_update(self, zip_path):
+        # The archive is extracted into a staging dir first and each file is
+        # then moved over the installed one with os.replace, so a crash never
+        # leaves a half-written .py behind. config.json is skipped: Config's
+        # writer owns it and replaces it atomically itself.
+        staging_path = self.base_dir / ".update"
         try:
-            extract_dir = Path(tempfile.gettempdir()) / "wmr_update_extract"
-            if extract_dir.exists():
-                shutil.rmtree(extract_dir)
-            
-            extract_dir.mkdir(exist_ok=True)
-            
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
-            
-            for item in extract_dir.iterdir():
-                if item.is_dir():
-                    update_folder = item
-                    break
-            else:
-                update_folder = extract_dir
-            
-            for root, dirs, files in os.walk(update_folder):
-                for file in files:
-                    if file.endswith(".py") or file.endswith(".txt") or file.endswith(".json") or file.endswith(".bat") or file.endswith(".sh"):
-                        src_path = Path(root) / file
-                        rel_path = src_path.relative_to(update_folder)
-                        target_path = self.base_dir / rel_path
-                        
-                        target_path.parent.mkdir(parents=True, exist_ok=True)
-                        
-                        try:
-                            shutil.copy2(src_path, target_path)
-                        except Exception as e:
-                            print(f"Error copying {src_path} to {target_path}: {e}")
-            
-            self.config.set("app.version", self.get_latest_version())
-            self.config.set("app.last_check", datetime.now().isoformat())
+            if staging_path.exists():
+                shutil.rmtree(staging_path)
+            
+            result = self.extractor.extract(
+                zip_path,
+                staging_path,
+                member_filter=lambda name: name.endswith((".py", ".txt", ".json", ".bat", ".sh")) and name != "config.json"
+            )
+            if result["errors"]:
+                for name, error in result["errors"]:
+                    print(f"Error extracting {name}: {error}")
+                return False
+            
+            for root, dirs, files in os.walk(staging_path):
+                for name in files:
+                    source = os.path.join(root, name)
+                    target = self.base_dir / os.path.relpath(source, staging_path)
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(source, target)
+            
+            with self.config.batch():
+                self.config.set("app.version", self.get_latest_version())
+                self.config.set("app.last_check", datetime.now().isoformat())
             
-            shutil.rmtree(extract_dir)
             os.remove(zip_path)
             
             return True
@@ -201,17 +191,19 @@ class Updater:
         except Exception as e:
             print(f"Update apply failed: {e}")
             return False
+        finally:
+            shutil.rmtree(staging_path, ignore_errors=True)
     
     def get_latest_version(self):
         try:
-            response = requests.get(self.update_file_url, timeout=10)
+            response = self.client.get(self.update_file_url, timeout=10)
             if response.status_code == 200:
                 return response.text.strip()
         except:
             pass
         
         try:
-            response = requests.get(self.repo_url, timeout=10)
+            response = self.client.get(self.repo_url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 return data.get("tag_name", "").replace("v", "")
@@ -231,7 +223,7 @@ class Updater:
     
     def get_changelog(self):
         try:
-            response = requests.get(self.changelog_url, timeout=10)
+            response = self.client.get(self.changelog_url, timeout=10)
             if response.status_code == 200:
                 return response.text
         except:
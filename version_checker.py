@@ -0,0 +1,81 @@
+import time
+import threading
+
+from github_client import get_client
+
+class VersionChecker:
+    def __init__(self, client=None, max_workers=8, timeout=5):
+        self.client = client or get_client()
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.last_metrics = {}
+    
+    def fetch_latest_release(self, app):
+        response = self.client.get(app["github_api"], timeout=self.timeout)
+        if response.status_code == 200:
+            return response.json()
+        return None
+    
+    def timed_fetch(self, app):
+        started = time.perf_counter()
+        try:
+            return self.fetch_latest_release(app), None, time.perf_counter() - started
+        except Exception as e:
+            return None, e, time.perf_counter() - started
+    
+    def check_all(self, apps, on_result=None, log_callback=None):
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
+        started = time.perf_counter()
+        apps = list(apps)
+        targets = [app for app in apps if app.get("github_api")]
+        timings = {}
+        failed = 0
+        
+        for app in apps:
+            if not app.get("github_api") and on_result:
+                on_result(app, None, None)
+        
+        if targets:
+            workers = max(1, min(self.max_workers, len(targets)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="version-check") as pool:
+                futures = {pool.submit(self.timed_fetch, app): app for app in targets}
+                
+                # Results are delivered on the calling thread in completion order,
+                # so callers never need to lock around on_result.
+                for future in as_completed(futures):
+                    app = futures[future]
+                    data, error, elapsed = future.result()
+                    timings[app["name"]] = elapsed
+                    if error is not None or data is None:
+                        failed += 1
+                    if on_result:
+                        try:
+                            on_result(app, data, error)
+                        except Exception as e:
+                            if log_callback:
+                                log_callback(f"Version check callback failed for {app['name']}: {e}")
+        
+        total = time.perf_counter() - started
+        metrics = {
+            "checked": len(targets),
+            "failed": failed,
+            "total_time": total,
+            "timings": timings,
+            "finished_at": time.time()
+        }
+        
+        with self.lock:
+            self.last_metrics = metrics
+        
+        slowest = max(timings.items(), key=lambda item: item[1]) if timings else None
+        if slowest and log_callback:
+            log_callback(f"Version check: {len(targets)} apps in {total:.2f}s "
+                         f"({failed} failed, slowest {slowest[0]} {slowest[1]:.2f}s)")
+        
+        return metrics
+    
+    def get_metrics(self):
+        with self.lock:
+            return dict(self.last_metrics)
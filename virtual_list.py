@@ -0,0 +1,112 @@
+from app_card import AppCard
+
+class VirtualAppList:
+    def __init__(self, canvas, owner, scrollbar=None, row_height=58, overscan=2):
+        self.canvas = canvas
+        self.owner = owner
+        self.scrollbar = scrollbar
+        self.row_height = row_height
+        self.overscan = overscan
+        
+        self.items = []
+        self.cards = []
+        self.window_ids = []
+        self.active = False
+        self.refresh_pending = False
+        
+        self.canvas.bind("<Configure>", self.on_configure, add="+")
+    
+    def activate(self):
+        if self.active:
+            return
+        self.active = True
+        self.canvas.configure(yscrollcommand=self.on_scroll)
+    
+    def deactivate(self):
+        if not self.active:
+            return
+        self.active = False
+        for card in self.cards:
+            card.destroy()
+        for window_id in self.window_ids:
+            self.canvas.delete(window_id)
+        self.cards = []
+        self.window_ids = []
+        self.items = []
+        if self.scrollbar:
+            self.canvas.configure(yscrollcommand=self.scrollbar.set)
+    
+    def set_items(self, items):
+        self.activate()
+        self.items = list(items)
+        self.update_scrollregion()
+        self.refresh()
+    
+    def update_scrollregion(self):
+        width = max(self.canvas.winfo_width(), 1)
+        height = len(self.items) * self.row_height
+        self.canvas.configure(scrollregion=(0, 0, width, height))
+    
+    def on_scroll(self, first, last):
+        if self.scrollbar:
+            self.scrollbar.set(first, last)
+        self.schedule_refresh()
+    
+    def on_configure(self, event):
+        if not self.active:
+            return
+        for window_id in self.window_ids:
+            self.canvas.itemconfigure(window_id, width=max(event.width - 16, 1))
+        self.update_scrollregion()
+        self.schedule_refresh()
+    
+    def schedule_refresh(self):
+        if self.refresh_pending:
+            return
+        self.refresh_pending = True
+        self.canvas.after_idle(self.refresh)
+    
+    def visible_range(self):
+        top = self.canvas.canvasy(0)
+        height = max(self.canvas.winfo_height(), self.row_height)
+        first = max(0, int(top // self.row_height) - self.overscan)
+        last = min(len(self.items), int((top + height) // self.row_height) + 1 + self.overscan)
+        return first, last
+    
+    def ensure_pool(self, size):
+        width = max(self.canvas.winfo_width() - 16, 1)
+        while len(self.cards) < size:
+            card = AppCard(self.canvas, self.owner)
+            window_id = self.canvas.create_window(
+                8, 0,
+                window=card.frame,
+                anchor="nw",
+                width=width,
+                height=self.row_height - 8
+            )
+            self.cards.append(card)
+            self.window_ids.append(window_id)
+    
+    def refresh(self):
+        self.refresh_pending = False
+        if not self.active:
+            return
+        
+        first, last = self.visible_range()
+        self.ensure_pool(last - first)
+        
+        # Rows are recycled: each pooled card is re-pointed at whichever item now
+        # falls into its slot, and AppCard.update only touches what differs.
+        for i, (card, window_id) in enumerate(zip(self.cards, self.window_ids)):
+            index = first + i
+            if index < last:
+                card.update(self.items[index])
+                self.canvas.coords(window_id, 8, index * self.row_height + 4)
+                self.canvas.itemconfigure(window_id, state="normal")
+            else:
+                self.canvas.itemconfigure(window_id, state="hidden")
+    
+    def refresh_app(self, app):
+        for card in self.cards:
+            if card.app is app or (card.app and card.app["name"] == app["name"]):
+                card.update(app)
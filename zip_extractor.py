@@ -0,0 +1,146 @@
+import os
+import time
+import shutil
+import zipfile
+import threading
+
+class UnsafeArchiveError(Exception):
+    pass
+
+class ZipExtractor:
+    def __init__(self, workers=4, buffer_size=1024 * 1024, progress_interval=0.1, parallel_threshold=64):
+        self.workers = workers
+        self.buffer_size = buffer_size
+        self.progress_interval = progress_interval
+        self.parallel_threshold = parallel_threshold
+    
+    def common_prefix(self, members):
+        top_levels = {member.filename.split("/", 1)[0] for member in members}
+        if len(top_levels) == 1 and all("/" in member.filename for member in members):
+            return top_levels.pop() + "/"
+        return ""
+    
+    def member_path(self, dest_root, filename, relative_name):
+        # Absolute names, drive letters and ".." are refused outright; the
+        # realpath check then catches anything that still resolves outside
+        # dest_root, such as a link already inside it.
+        parts = relative_name.replace("\\", "/").split("/")
+        if relative_name.startswith(("/", "\\")) or ".." in parts or os.path.splitdrive(relative_name)[0] or ":" in parts[0]:
+            raise UnsafeArchiveError(f"Archive member escapes destination: {filename}")
+        
+        target = os.path.realpath(os.path.join(dest_root, *parts))
+        try:
+            inside = os.path.commonpath([dest_root, target]) == dest_root
+        except ValueError:
+            inside = False
+        if not inside:
+            raise UnsafeArchiveError(f"Archive member escapes destination: {filename}")
+        return target
+    
+    def plan(self, members, dest, prefix="", member_filter=None):
+        dest_root = os.path.realpath(dest)
+        directories = set()
+        files = []
+        
+        for member in members:
+            relative_name = member.filename[len(prefix):]
+            if not relative_name:
+                continue
+            
+            target = self.member_path(dest_root, member.filename, relative_name)
+            
+            if member.is_dir():
+                directories.add(target)
+            elif member_filter is None or member_filter(relative_name):
+                directories.add(os.path.dirname(target))
+                files.append((member, target))
+        
+        return sorted(directories), files
+    
+    def extract(self, zip_path, dest, strip_top_level=True, member_filter=None,
+                progress_callback=None, log_callback=None):
+        os.makedirs(dest, exist_ok=True)
+        
+        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            members = zip_ref.infolist()
+            prefix = self.common_prefix(members) if strip_top_level else ""
+            directories, files = self.plan(members, dest, prefix, member_filter)
+        
+        if log_callback:
+            log_callback(f"Found {len(members)} entries in archive, extracting {len(files)} files")
+            if prefix:
+                log_callback(f"Stripping top-level folder: {prefix}")
+        
+        for directory in directories:
+            os.makedirs(directory, exist_ok=True)
+        
+        total_bytes = sum(member.file_size for member, target in files)
+        progress = {"bytes": 0, "files": 0, "last": 0.0}
+        lock = threading.Lock()
+        errors = []
+        
+        def report(force=False):
+            if not progress_callback:
+                return
+            now = time.monotonic()
+            if not force and now - progress["last"] < self.progress_interval:
+                return
+            progress["last"] = now
+            progress_callback(progress["bytes"], total_bytes, progress["files"], len(files))
+        
+        handles = threading.local()
+        opened = []
+        
+        def get_handle():
+            # ZipFile objects share one file position, so each thread reads
+            # through its own handle.
+            handle = getattr(handles, "zip_ref", None)
+            if handle is None:
+                handle = zipfile.ZipFile(zip_path, "r")
+                handles.zip_ref = handle
+                with lock:
+                    opened.append(handle)
+            return handle
+        
+        def extract_member(item):
+            member, target = item
+            try:
+                with get_handle().open(member) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, self.buffer_size)
+                
+                mode = (member.external_attr >> 16) & 0o777
+                if member.create_system == 3 and mode:
+                    os.chmod(target, mode)
+            except Exception as e:
+                with lock:
+                    errors.append((member.filename, e))
+                if log_callback:
+                    log_callback(f"Error extracting {member.filename}: {str(e)}")
+            
+            with lock:
+                progress["bytes"] += member.file_size
+                progress["files"] += 1
+                report()
+        
+        # Large members first so one big file does not end up last on a single thread.
+        files.sort(key=lambda item: item[0].file_size, reverse=True)
+        
+        try:
+            if self.workers > 1 and len(files) >= self.parallel_threshold:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="unzip") as pool:
+                    list(pool.map(extract_member, files))
+            else:
+                for item in files:
+                    extract_member(item)
+        finally:
+            for handle in opened:
+                handle.close()
+        
+        with lock:
+            report(force=True)
+        
+        if log_callback:
+            log_callback(f"Extracted {len(files) - len(errors)} files ({total_bytes / (1024*1024):.2f} MB)")
+        
+        return {"files": len(files), "bytes": total_bytes, "errors": errors}